@@ -42,6 +42,7 @@ from lftools.geocapt.topogeo import (dd2dms as DD2DMS,
                                      azimute, str2HTML,
                                      geod2geoc,
                                      geoc2enu)
+from lftools.geocapt.adjacencia import AdjacenciaCamada, Confrontantes, FeicaoMapa
 from lftools import geomag
 from numpy import array, pi, sqrt, median
 import numpy as np
@@ -1039,15 +1040,11 @@ def geoneighbors(layer_name, street, borderer_field, prefixo, decimal, fontsize,
 
         # Pegar vizinhos
         geom1 = feature.geometry()
-        feat1 = feature
+        mapa = AdjacenciaCamada(layer)
         confront = {}
-        for feat2 in layer.getFeatures():
-            geom2 = feat2.geometry()
-            cd_lote2 = str(feat2[borderer_field])
-            if feat1 != feat2:
-                if geom1.intersects(geom2):
-                    inters = geom1.intersection(geom2)
-                    confront[feat2.id()] = [cd_lote2, inters]
+        for fid2, inters in Confrontantes(mapa, feature).items():
+            cd_lote2 = str(FeicaoMapa(mapa, fid2)[borderer_field])
+            confront[fid2] = [cd_lote2, inters]
 
         if geom1.isMultipart():
             coords = geom1.asMultiPolygon()[0][0]
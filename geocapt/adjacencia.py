@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Adjacência (confrontantes) entre os polígonos de uma camada
+
+from qgis.core import QgsSpatialIndex
+
+# Mapas de adjacência das camadas usadas pelas expressões: {id da camada: mapa}
+_cache = {}
+# Camadas com os sinais de edição conectados à invalidação do cache
+_conectadas = set()
+
+
+# Mapa de adjacência de um conjunto de feições
+# Os confrontantes de cada feição são calculados uma única vez, na primeira consulta
+def MapaAdjacencia(feicoes):
+    feicoes = list(feicoes)
+    indice = QgsSpatialIndex()
+    for k, feat in enumerate(feicoes):
+        indice.addFeature(k, feat.geometry().boundingBox())
+    return {'feicoes': feicoes,
+            'posicao': {feat.id(): k for k, feat in enumerate(feicoes)},
+            'indice': indice,
+            'confrontantes': {}}
+
+
+# Confrontantes de uma feição: {id do vizinho: geometria da interseção}
+# Na ordem das feições do mapa; a própria feição não é incluída
+def Confrontantes(mapa, feat):
+    feicoes = mapa['feicoes']
+    k = mapa['posicao'].get(feat.id())
+    geom1 = feat.geometry()
+    # Feição de outra camada ou com geometria diferente da mapeada: sem memorização
+    memorizar = k is not None and feicoes[k].geometry().equals(geom1)
+    if memorizar and k in mapa['confrontantes']:
+        return mapa['confrontantes'][k]
+    confront = {}
+    for j in sorted(mapa['indice'].intersects(geom1.boundingBox())):
+        if memorizar and j == k:
+            continue
+        geom2 = feicoes[j].geometry()
+        if geom1.intersects(geom2):
+            confront[feicoes[j].id()] = geom1.intersection(geom2)
+    if memorizar:
+        mapa['confrontantes'][k] = confront
+    return confront
+
+
+# Feição da camada pelo id, a partir do mapa
+def FeicaoMapa(mapa, fid):
+    return mapa['feicoes'][mapa['posicao'][fid]]
+
+
+def _invalidar(id_camada):
+    _cache.pop(id_camada, None)
+
+def _removida(id_camada):
+    _cache.pop(id_camada, None)
+    _conectadas.discard(id_camada)
+
+
+# Mapa de adjacência de uma camada, guardado até a próxima edição da camada
+def AdjacenciaCamada(layer):
+    id_camada = layer.id()
+    if id_camada not in _cache:
+        if id_camada not in _conectadas:
+            for sinal in (layer.featureAdded, layer.featureDeleted, layer.geometryChanged,
+                          layer.attributeValueChanged, layer.dataChanged):
+                sinal.connect(lambda *args, id_camada = id_camada: _invalidar(id_camada))
+            layer.willBeDeleted.connect(lambda id_camada = id_camada: _removida(id_camada))
+            _conectadas.add(id_camada)
+        _cache[id_camada] = MapaAdjacencia(layer.getFeatures())
+    return _cache[id_camada]
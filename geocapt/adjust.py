@@ -197,7 +197,8 @@ def Ajust2D(vetores, metodo):
             Yt = Y + b
             return (Xt, Yt)
         def CoordInvTransf(pnt, a = a, b = b): # Translacao (Inversa)
-            X, Y = pnt.x(), pnt.y()
+            # pnt: QgsPointXY ou tupla (X, Y) de arrays
+            X, Y = (pnt.x(), pnt.y()) if isinstance(pnt, QgsPointXY) else pnt
             Xit = X - a
             Yit = Y - b
             return (Xit, Yit)
@@ -219,12 +220,11 @@ def Ajust2D(vetores, metodo):
             Yt = X*b + Y*a + d
             return (Xt, Yt)
         def CoordInvTransf(pnt, a = a, b = b, c = c, d = d): # Transformação de Helmert 2D (Inversa)
-            X, Y = pnt.x(), pnt.y()
-            A = np.matrix([[a,-b],[b,a]])
-            B = np.matrix([[X-c],[Y-d]])
-            sol = solve(A,B)
-            Xit = sol[0,0]
-            Yit = sol[1,0]
+            # pnt: QgsPointXY ou tupla (X, Y) de arrays
+            X, Y = (pnt.x(), pnt.y()) if isinstance(pnt, QgsPointXY) else pnt
+            D = a*a + b*b # determinante de [[a,-b],[b,a]]
+            Xit = (a*(X-c) + b*(Y-d))/D
+            Yit = (a*(Y-d) - b*(X-c))/D
             return (Xit, Yit)
 
     elif metodo == 2:
@@ -240,12 +240,11 @@ def Ajust2D(vetores, metodo):
             Yt = X*d + Y*e + f
             return (Xt, Yt)
         def CoordInvTransf(pnt, a = a, b = b, c = c, d = d, e = e, f = f): # Transformação Afim (Inversa)
-            X, Y = pnt.x(), pnt.y()
-            A = np.matrix([[a,b],[d,e]])
-            B = np.matrix([[X-c],[Y-f]])
-            sol = solve(A,B)
-            Xit = sol[0,0]
-            Yit = sol[1,0]
+            # pnt: QgsPointXY ou tupla (X, Y) de arrays
+            X, Y = (pnt.x(), pnt.y()) if isinstance(pnt, QgsPointXY) else pnt
+            D = a*e - b*d # determinante de [[a,b],[d,e]]
+            Xit = (e*(X-c) - b*(Y-f))/D
+            Yit = (a*(Y-f) - d*(X-c))/D
             return (Xit, Yit)
 
     # Cálculo do Resíduos
@@ -490,22 +489,36 @@ def ValidacaoGCP(lista, metodo):
     elif metodo == 1:
         if cont < 3:
             raise QgsProcessingException(tr('It takes 3 or more GPC to perform this adjustment!', 'É necessario 3 ou mais GCP para realizar esse ajustamento!'))
+    elif metodo == 2:
+        if cont < 4:
+            raise QgsProcessingException(tr('It takes 4 or more GPC to perform this adjustment!', 'É necessario 4 ou mais GCP para realizar esse ajustamento!'))
+    elif metodo == 3:
+        if cont < 6:
+            raise QgsProcessingException(tr('It takes 6 or more GPC to perform this adjustment!', 'É necessario 6 ou mais GCP para realizar esse ajustamento!'))
 
 
 # Ajustamento Vertical
 def AjustVertical(lista, metodo):
     # lista: [(Xa, Ya, Za), Zb] - ponto A - GCP, Zb - cota do MDE
     # Métodos:
-    # 0 - constante, 1 - plano
+    # 0 - constante, 1 - plano, 2 - superfície bilinear, 3 - superfície quadrática
+    # As funções de transformação aceitam X e Y escalares ou arrays
 
     # numero de pontos homologos
     n_pnts_ctrl = len(lista)
+    # Centróide dos GCP (coordenadas reduzidas nas superfícies de ordem superior)
+    Xo = float(np.mean([item[0][0] for item in lista]))
+    Yo = float(np.mean([item[0][1] for item in lista]))
 
     # numero minimo de pontos de controle por metodo
     if metodo == 0: # 0 - constante
         min_pnts_ctrl = n_pnts_ctrl == 1
     elif metodo == 1: # 1 - plano
         min_pnts_ctrl = n_pnts_ctrl == 3
+    elif metodo == 2: # 2 - superfície bilinear
+        min_pnts_ctrl = n_pnts_ctrl == 4
+    elif metodo == 3: # 3 - superfície quadrática
+        min_pnts_ctrl = n_pnts_ctrl == 6
 
     A = [] # Matriz Design
     L = [] # Coordenadas Finais
@@ -520,6 +533,10 @@ def AjustVertical(lista, metodo):
             A += [[1]]
         elif metodo == 1:
             A += [[xa, ya, 1]]
+        elif metodo == 2:
+            A += [[xa-Xo, ya-Yo, (xa-Xo)*(ya-Yo), 1]]
+        elif metodo == 3:
+            A += [[(xa-Xo)**2, (ya-Yo)**2, (xa-Xo)*(ya-Yo), xa-Xo, ya-Yo, 1]]
         L +=[[zb]]
         Lo +=[[za]]
 
@@ -530,7 +547,7 @@ def AjustVertical(lista, metodo):
     msg_erro = tr('Inconsistent values, check your control points!', 'Valores inconsistentes, verifique seus pontos de controle!')
     if metodo == 0:
         X = (L - Lo).mean()
-    elif metodo == 1:
+    else:
         if min_pnts_ctrl:
             if det(A):
                 X = solve(A, L - Lo)
@@ -564,6 +581,36 @@ def AjustVertical(lista, metodo):
             dz = X*a + Y*b + c
             return dz
 
+    elif metodo == 2:
+        a = X[0,0]
+        b = X[1,0]
+        c = X[2,0]
+        d = X[3,0]
+        def CoordTransf(X, Y, a = a, b = b, c = c, d = d, Xo = Xo, Yo = Yo): # Transformação dz Superfície Bilinear
+            '''
+            dz = x*a + y*b + x*y*c + d
+            x = X - Xo, y = Y - Yo
+            '''
+            x, y = X - Xo, Y - Yo
+            dz = x*a + y*b + x*y*c + d
+            return dz
+
+    elif metodo == 3:
+        a = X[0,0]
+        b = X[1,0]
+        c = X[2,0]
+        d = X[3,0]
+        e = X[4,0]
+        f = X[5,0]
+        def CoordTransf(X, Y, a = a, b = b, c = c, d = d, e = e, f = f, Xo = Xo, Yo = Yo): # Transformação dz Superfície Quadrática
+            '''
+            dz = x²*a + y²*b + x*y*c + x*d + y*e + f
+            x = X - Xo, y = Y - Yo
+            '''
+            x, y = X - Xo, Y - Yo
+            dz = x*x*a + y*y*b + x*y*c + x*d + y*e + f
+            return dz
+
     # Cálculo do Resíduos
     V = []
     COTAS = []
@@ -622,6 +669,18 @@ def AjustVertical(lista, metodo):
  style=""></span></i><i><span style="">
 +aX + bY
 + c +</span></i><i><span style=""> Vz<o:p></o:p></span></i></p>
+'''
+    elif metodo in (2, 3):
+        formula = '''<p class="MsoNormal" style="text-align: center;"
+ align="center"><i><span style="">''' + (tr('Bilinear surface as a function of X and Y',str2HTML('Superfície bilinear em função de X e Y')) if metodo == 2 else tr('Quadratic surface as a function of X and Y',str2HTML('Superfície quadrática em função de X e Y'))) + '''</span></i></p>
+<p class="MsoNormal" style="text-align: center;"
+ align="center"><i><span style=""></span></i></p>
+<p class="MsoNormal" style="text-align: center;"
+ align="center"><i><span style="">Z = Zo</span></i><i><span
+ style=""></span></i><i><span style="">
+''' + ('+ax + by + cxy + d +' if metodo == 2 else '+ax&sup2; + by&sup2; + cxy + dx + ey + f +') + '''</span></i><i><span style=""> Vz<o:p></o:p></span></i></p>
+<p class="MsoNormal" style="text-align: center;"
+ align="center"><i><span style="">x = X - ''' + str(round(Xo,3)) + ''', y = Y - ''' + str(round(Yo,3)) + '''</span></i></p>
 '''
 
     parametros = ''
@@ -22,6 +22,7 @@ import math
 from pyproj.crs import CRS
 from qgis.core import (QgsGeometry,
                        QgsPointXY,
+                       QgsSpatialIndex,
                        QgsCoordinateTransform,
                        QgsProject,
                        QgsCoordinateReferenceSystem)
@@ -339,6 +340,69 @@ def OrientarPoligono(coords, primeiro, sentido):
     return coords
 
 
+# Distâncias de pontos (n, 2) aos segmentos p1-p2 (m, 2)
+# Retorna matriz (m, n)
+def DistPontosSegmentos(pontos, p1, p2):
+    d = (p2 - p1)[:, np.newaxis, :]
+    v = pontos[np.newaxis, :, :] - p1[:, np.newaxis, :]
+    comp2 = (d*d).sum(axis=2)
+    t = np.clip((v*d).sum(axis=2)/np.where(comp2 > 0, comp2, 1), 0, 1)
+    r = v - t[..., np.newaxis]*d
+    return np.sqrt((r*r).sum(axis=2))
+
+
+# Índice espacial dos retângulos envolventes das geometrias (id = posição na lista)
+def IndiceEspacial(geometrias):
+    indice = QgsSpatialIndex()
+    for k, geom in enumerate(geometrias):
+        indice.addFeature(k, geom.boundingBox())
+    return indice
+
+
+# Conectar polígonos adjacentes (topologia)
+# Vértices de um polígono a menos de tol de um segmento do vizinho, sem vértice
+# correspondente, são inseridos nesse segmento (um por segmento)
+# Os vizinhos candidatos vêm do índice espacial
+def ConectarPoligonos(feicoes, tol, feedback = None):
+    tam = len(feicoes)
+    indice = IndiceEspacial([feat.geometry() for feat in feicoes])
+    for i in range(tam):
+        geom_a = feicoes[i].geometry()
+        box = geom_a.boundingBox()
+        box.grow(2*tol)
+        coord_a = None
+        for j in sorted(indice.intersects(box)):
+            if i != j:
+                feat_b = feicoes[j]
+                geom_b = feat_b.geometry()
+                if geom_a.intersects(geom_b):
+                    if coord_a is None:
+                        coord_a = geom_a.asPolygon()[0]
+                        A = np.array([[pnt.x(), pnt.y()] for pnt in coord_a])
+                    coord_b = geom_b.asPolygon()[0]
+                    B = np.array([[pnt.x(), pnt.y()] for pnt in coord_b])
+                    # Pontos de A sem vértice correspondente em B
+                    livres = ~(np.abs(A[:, np.newaxis, :] - B[np.newaxis, :, :]).max(axis=2) <= 1e-8).any(axis=1)
+                    if not livres.any():
+                        continue
+                    ind = np.nonzero(livres)[0]
+                    perto = DistPontosSegmentos(A[ind], B[:-1], B[1:]) <= tol
+                    if not perto.any():
+                        continue
+                    primeiro = ind[np.argmax(perto, axis=1)] # primeiro ponto de A próximo de cada segmento
+                    new_coord_b = []
+                    for k in range(len(coord_b)-1):
+                        new_coord_b += [coord_b[k], coord_a[primeiro[k]]] if perto[k].any() else [coord_b[k]]
+                    new_coord_b += [coord_b[-1]]
+                    feat_b.setGeometry(QgsGeometry.fromPolygonXY([new_coord_b]))
+                    feicoes[j] = feat_b
+        if feedback is not None:
+            feedback.setProgress(int((i+1)*100/tam))
+            if feedback.isCanceled():
+                break
+    return feicoes
+
+
 
 def map_sistem(lon, lat, ScaleD=1e6):
     # Escala 1:1.000.000
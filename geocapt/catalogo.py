@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Catálogo das áreas de cobertura (footprints) de arquivos raster
+
+import os, sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from osgeo import gdal
+from qgis.core import (QgsGeometry,
+                       QgsPointXY,
+                       QgsRectangle,
+                       QgsProject,
+                       QgsCoordinateTransform,
+                       QgsCoordinateReferenceSystem)
+
+# Leituras simultâneas de arquivos (limitadas pelo disco ou pela rede, não pela CPU)
+N_LEITORES = 8
+# Arquivos gravados no catálogo por lote
+ARQUIVOS_POR_LOTE = 1000
+# Arquivo do catálogo, gravado na pasta dos rasters
+ARQUIVO_CATALOGO = '.lftools_rasters.sqlite'
+# Colunas com os dados de cada raster (na ordem das tuplas retornadas)
+COLUNAS = 'src, ulx, xres, xskew, uly, yskew, yres, colunas, linhas, bandas, tipo'
+
+
+# Dados de um arquivo raster: (src em wkt, geotransform (6 valores), colunas, linhas, bandas, tipo de dado)
+def LerRaster(caminho):
+    image = gdal.Open(caminho)
+    if image is None:
+        raise IOError(gdal.GetLastErrorMsg() or caminho)
+    prj = image.GetProjection() # wkt
+    geotransform = tuple(image.GetGeoTransform())
+    dados = (prj,) + geotransform + (image.RasterXSize, image.RasterYSize, image.RasterCount,
+                                      gdal.GetDataTypeName(image.GetRasterBand(1).DataType))
+    image = None # Close image
+    return dados
+
+
+# Polígono da área de cobertura de um raster, no seu próprio SRC
+def Contorno(dados):
+    ulx, xres, xskew, uly, yskew, yres, cols, rows = dados[1:9]
+    coord = [[QgsPointXY(ulx, uly),
+              QgsPointXY(ulx+cols*xres, uly),
+              QgsPointXY(ulx+cols*xres, uly+rows*yres),
+              QgsPointXY(ulx, uly+rows*yres),
+              QgsPointXY(ulx, uly)]]
+    return QgsGeometry.fromPolygonXY(coord)
+
+
+# Catálogo (SQLite com índice R-tree dos limites em graus, WGS84)
+# Sem pasta, ou se não for possível gravar na pasta, o catálogo é criado na memória
+def AbrirCatalogo(pasta = None):
+    try:
+        conexao = sqlite3.connect(os.path.join(pasta, ARQUIVO_CATALOGO) if pasta else ':memory:')
+        conexao.execute('''CREATE TABLE IF NOT EXISTS rasters (id INTEGER PRIMARY KEY, caminho TEXT UNIQUE, mtime REAL, tamanho INTEGER,
+                           src TEXT, ulx REAL, xres REAL, xskew REAL, uly REAL, yskew REAL, yres REAL,
+                           colunas INTEGER, linhas INTEGER, bandas INTEGER, tipo TEXT,
+                           xmin REAL, xmax REAL, ymin REAL, ymax REAL)''')
+    except sqlite3.Error:
+        if pasta:
+            return AbrirCatalogo()
+        raise
+    try:
+        conexao.execute('CREATE VIRTUAL TABLE IF NOT EXISTS rasters_rtree USING rtree(id, xmin, xmax, ymin, ymax)')
+    except sqlite3.OperationalError:
+        pass # SQLite sem o módulo R-tree: consulta direta nas colunas de limites
+    return conexao
+
+def _rtree(catalogo):
+    return catalogo.execute("SELECT 1 FROM sqlite_master WHERE name = 'rasters_rtree'").fetchone() is not None
+
+
+# Limites (xmin, xmax, ymin, ymax) em WGS84 da área de cobertura de um raster
+# Retorna None se o raster não tiver SRC válido
+def _limites_geo(dados, transformadores):
+    if dados[0] not in transformadores:
+        crs = QgsCoordinateReferenceSystem(dados[0])
+        transformadores[dados[0]] = QgsCoordinateTransform(crs, QgsCoordinateReferenceSystem('EPSG:4326'), QgsProject.instance()) if crs.isValid() else None
+    xform = transformadores[dados[0]]
+    if xform is None:
+        return None
+    try:
+        ret = xform.transformBoundingBox(Contorno(dados).boundingBox())
+    except Exception:
+        return None
+    return (ret.xMinimum(), ret.xMaximum(), ret.yMinimum(), ret.yMaximum())
+
+
+# Dados de uma lista de rasters, atualizando o catálogo
+# Apenas os arquivos novos ou modificados desde a última consulta são abertos, em paralelo (threads)
+# Gera (índice na lista, caminho, dados ou exceção, lido do catálogo)
+def AtualizarCatalogo(catalogo, lista):
+    conhecidos = {}
+    for linha in catalogo.execute('SELECT id, caminho, mtime, tamanho, ' + COLUNAS + ' FROM rasters'):
+        conhecidos[linha[1]] = linha
+    novos = []
+    for ind, caminho in enumerate(lista):
+        estado = os.stat(caminho)
+        item = conhecidos.pop(caminho, None)
+        if item and item[2] == estado.st_mtime and item[3] == estado.st_size:
+            yield ind, caminho, item[4:], True
+        else:
+            novos += [(ind, caminho, estado.st_mtime, estado.st_size, item[0] if item else None)]
+
+    # Arquivos apagados
+    apagados = [(item[0],) for caminho, item in conhecidos.items() if not os.path.exists(caminho)]
+    rtree = _rtree(catalogo)
+    if apagados:
+        catalogo.executemany('DELETE FROM rasters WHERE id = ?', apagados)
+        if rtree:
+            catalogo.executemany('DELETE FROM rasters_rtree WHERE id = ?', apagados)
+        catalogo.commit()
+
+    def Ler(caminho):
+        try:
+            return LerRaster(caminho)
+        except Exception as erro:
+            return erro
+
+    # Fila limitada: no máximo 2 leituras por thread aguardando (cancelamento rápido)
+    transformadores = {}
+    executor = ThreadPoolExecutor(max_workers = N_LEITORES)
+    pendentes = deque()
+    proxima = 0
+    try:
+        while proxima < len(novos) or pendentes:
+            while proxima < len(novos) and len(pendentes) < 2*N_LEITORES:
+                pendentes.append((novos[proxima], executor.submit(Ler, novos[proxima][1])))
+                proxima += 1
+            (ind, caminho, mtime, tamanho, id_antigo), tarefa = pendentes.popleft()
+            dados = tarefa.result()
+            if id_antigo is not None:
+                catalogo.execute('DELETE FROM rasters WHERE id = ?', (id_antigo,))
+                if rtree:
+                    catalogo.execute('DELETE FROM rasters_rtree WHERE id = ?', (id_antigo,))
+            if not isinstance(dados, Exception):
+                limites = _limites_geo(dados, transformadores)
+                cursor = catalogo.execute('INSERT INTO rasters (caminho, mtime, tamanho, ' + COLUNAS + ', xmin, xmax, ymin, ymax) VALUES (' + ','.join(['?']*18) + ')',
+                                          (caminho, mtime, tamanho) + dados + (limites or (None,)*4))
+                if rtree and limites:
+                    catalogo.execute('INSERT INTO rasters_rtree VALUES (?,?,?,?,?)', (cursor.lastrowid,) + limites)
+            yield ind, caminho, dados, False
+            if (proxima - len(pendentes)) % ARQUIVOS_POR_LOTE == 0:
+                catalogo.commit()
+    finally:
+        executor.shutdown(wait = False, cancel_futures = True)
+        catalogo.commit()
+
+
+# Rasters do catálogo cuja área de cobertura pode interceptar um retângulo em WGS84 (QgsRectangle)
+# Rasters sem SRC válido são sempre retornados
+# Retorna {caminho: dados}
+def RastersNaArea(catalogo, retangulo):
+    limites = (retangulo.xMaximum(), retangulo.xMinimum(), retangulo.yMaximum(), retangulo.yMinimum())
+    if _rtree(catalogo):
+        consulta = '''SELECT caminho, ''' + COLUNAS + ''' FROM rasters WHERE id IN
+                      (SELECT id FROM rasters_rtree WHERE xmin <= ? AND xmax >= ? AND ymin <= ? AND ymax >= ?)'''
+    else:
+        consulta = '''SELECT caminho, ''' + COLUNAS + ''' FROM rasters WHERE xmin <= ? AND xmax >= ? AND ymin <= ? AND ymax >= ?'''
+    resultado = {linha[0]: linha[1:] for linha in catalogo.execute(consulta, limites)}
+    for linha in catalogo.execute('SELECT caminho, ' + COLUNAS + ' FROM rasters WHERE xmin IS NULL'):
+        resultado[linha[0]] = linha[1:]
+    return resultado
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Execução de programas externos (PostgreSQL) acompanhada pelo feedback
+
+import os, shutil, subprocess, threading, queue, time
+
+# Intervalo (segundos) entre os relatórios de bytes gravados
+INTERVALO_RELATORIO = 5
+
+
+# Pasta dos executáveis do PostgreSQL (Windows e macOS)
+# Retorna '' se os executáveis estão no PATH ou None se não forem encontrados
+def PastaPostgreSQL(versao, programa = 'psql'):
+    for pasta in ['C:/Program Files (x86)/PostgreSQL/'+versao+'/bin',
+                  'D:/Program Files (x86)/PostgreSQL/'+versao+'/bin',
+                  'C:/Program Files/PostgreSQL/'+versao+'/bin',
+                  'D:/Program Files/PostgreSQL/'+versao+'/bin',
+                  '/Library/PostgreSQL/'+versao+'/bin/']:
+        if os.path.isdir(pasta):
+            return pasta
+    if shutil.which(programa):
+        return ''
+    return None
+
+
+# Caminho do executável de um programa na pasta do PostgreSQL
+def ProgramaPostgreSQL(pasta, programa):
+    for nome in (programa + '.exe', programa):
+        caminho = os.path.join(pasta, nome)
+        if pasta and os.path.isfile(caminho):
+            return caminho
+    return programa
+
+
+# Tamanho em bytes de um arquivo ou da soma dos arquivos de uma pasta
+def TamanhoCaminho(caminho):
+    if os.path.isfile(caminho):
+        return os.path.getsize(caminho)
+    tamanho = 0
+    if os.path.isdir(caminho):
+        for raiz, pastas, arquivos in os.walk(caminho):
+            for arq in arquivos:
+                try:
+                    tamanho += os.path.getsize(os.path.join(raiz, arq))
+                except OSError:
+                    pass
+    return tamanho
+
+
+# Bytes em texto (kB, MB, GB...)
+def TextoBytes(n):
+    for unidade in ('B', 'kB', 'MB', 'GB', 'TB'):
+        if n < 1024 or unidade == 'TB':
+            return '{:.1f} {}'.format(n, unidade) if unidade != 'B' else '{} B'.format(int(n))
+        n /= 1024.
+
+
+# Executa um comando (lista de argumentos) repassando suas mensagens ao feedback
+# monitorar: arquivo ou pasta de saída, cujo tamanho é informado periodicamente
+# passos: número esperado de mensagens, usado para o progresso (opcional)
+# O processo é encerrado se o usuário cancelar
+# Retorna o código de saída do programa
+def ExecutarComando(argumentos, feedback, monitorar = None, passos = None):
+    proc = subprocess.Popen(argumentos, stdout = subprocess.PIPE, stderr = subprocess.STDOUT,
+                            stdin = subprocess.DEVNULL,
+                            universal_newlines = True, errors = 'replace')
+    mensagens = queue.Queue()
+    def Ler():
+        for linha in proc.stdout:
+            mensagens.put(linha.rstrip())
+        mensagens.put(None)
+    threading.Thread(target = Ler, daemon = True).start()
+
+    cont = 0
+    relatorio = time.time()
+    while True:
+        try:
+            linha = mensagens.get(timeout = 0.5)
+        except queue.Empty:
+            linha = ''
+        if linha is None:
+            break
+        if linha:
+            feedback.pushInfo(linha)
+            cont += 1
+            if passos:
+                feedback.setProgress(min(99, int(cont*100/passos)))
+        if monitorar and time.time() - relatorio >= INTERVALO_RELATORIO:
+            relatorio = time.time()
+            feedback.pushInfo('[{}]'.format(TextoBytes(TamanhoCaminho(monitorar))))
+        if feedback.isCanceled():
+            proc.terminate()
+            break
+    return proc.wait()
+
+
+# Número de itens do sumário (TOC) de um backup em formato diretório (pg_restore -l)
+def ItensBackup(pg_restore, caminho):
+    try:
+        lista = subprocess.run([pg_restore, '-l', caminho], stdout = subprocess.PIPE, stderr = subprocess.DEVNULL,
+                               stdin = subprocess.DEVNULL, universal_newlines = True, errors = 'replace').stdout
+    except OSError:
+        return None
+    return len([linha for linha in lista.splitlines() if linha and not linha.startswith(';')]) or None
+
+
+# Executa comando1 | comando2 sem passar pelo shell
+# Os dois processos são encerrados se o usuário cancelar (feedback opcional)
+# Retorna (código de saída do último comando com erro ou 0, mensagens de erro)
+def ExecutarEncadeado(comando1, comando2, feedback = None):
+    p1 = subprocess.Popen(comando1, stdout = subprocess.PIPE, stderr = subprocess.PIPE, stdin = subprocess.DEVNULL)
+    p2 = subprocess.Popen(comando2, stdin = p1.stdout, stdout = subprocess.DEVNULL, stderr = subprocess.PIPE)
+    p1.stdout.close() # p1 recebe SIGPIPE se p2 terminar antes
+    erros = ([], [])
+    leitores = [threading.Thread(target = lambda proc = proc, lista = lista: lista.append(proc.stderr.read()), daemon = True)
+                for proc, lista in zip((p1, p2), erros)]
+    for leitor in leitores:
+        leitor.start()
+    while True:
+        try:
+            p2.wait(timeout = 0.5)
+            break
+        except subprocess.TimeoutExpired:
+            if feedback is not None and feedback.isCanceled():
+                p1.terminate()
+                p2.terminate()
+    for leitor in leitores:
+        leitor.join()
+    r1, r2 = p1.wait(), p2.returncode
+    texto = b''.join(erros[0] + erros[1])
+    return (r2 or r1), texto.decode('utf-8', 'replace').strip()
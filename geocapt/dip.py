@@ -17,8 +17,13 @@ __copyright__ = '(C) 2021, Leandro França'
 # Digital Image Processing (DIP)
 
 import numpy as np
+from osgeo import gdal
+from matplotlib import path
 from math import floor, ceil
 
+# Matriz da interpolação bicúbica - resultado da inversa: np.linalg.inv([[-1, 1, -1, 1], [0, 0, 0, 1], [1, 1, 1, 1], [8, 4, 2, 1]])
+MatrInvCubica = np.array([[-1/6, 0.5, -0.5, 1/6], [ 0.5, -1., 0.5, 0.], [-1/3, -0.5,  1., -1/6], [ 0., 1., 0., 0.]])
+
 # Função de Interpolação
 def Interpolar(X, Y, BAND, origem, resol_X, resol_Y, metodo, nulo):
     if metodo == 'nearest':
@@ -50,17 +55,16 @@ def Interpolar(X, Y, BAND, origem, resol_X, resol_Y, metodo, nulo):
         J=int(floor(J))
         try:
             if (BAND[I-1:I+3, J-1:J+3] == nulo).sum() == 0:
-                MatrInv = np.mat([[-1/6, 0.5, -0.5, 1/6], [ 0.5, -1., 0.5, 0.], [-1/3, -0.5,  1., -1/6], [ 0., 1., 0., 0.]]) # resultado da inversa: (np.mat([[-1, 1, -1, 1], [0, 0, 0, 1], [1, 1, 1, 1], [8, 4, 2, 1]])).I #
-                MAT  = np.mat([ [BAND[I-1, J-1],  BAND[I-1, J], BAND[I-1, J+1], BAND[I-2, J+2]],
-                                [BAND[I, J-1],    BAND[I, J],   BAND[I, J+1],   BAND[I, J+2]],
-                                [BAND[I+1, J-1],  BAND[I+1, J], BAND[I+1, J+1], BAND[I+1, J+2]],
-                                [BAND[I+2, J-1],  BAND[I+2, J], BAND[I+2, J+1], BAND[I+2, J+2]]])
-                coef = MatrInv*MAT.transpose()
+                MAT  = np.array([[BAND[I-1, J-1],  BAND[I-1, J], BAND[I-1, J+1], BAND[I-1, J+2]],
+                                 [BAND[I, J-1],    BAND[I, J],   BAND[I, J+1],   BAND[I, J+2]],
+                                 [BAND[I+1, J-1],  BAND[I+1, J], BAND[I+1, J+1], BAND[I+1, J+2]],
+                                 [BAND[I+2, J-1],  BAND[I+2, J], BAND[I+2, J+1], BAND[I+2, J+2]]])
+                coef = MatrInvCubica @ MAT.transpose()
                 # Horizontal
-                pi = coef[0,:]*pow(dj,3)+coef[1,:]*pow(dj,2)+coef[2,:]*dj+coef[3,:]
+                pi = coef[0,:]*(dj*dj*dj)+coef[1,:]*(dj*dj)+coef[2,:]*dj+coef[3,:]
                 # Vertical
-                coef2 = MatrInv*pi.transpose()
-                pj = coef2[0]*pow(di,3)+coef2[1]*pow(di,2)+coef2[2]*di+coef2[3]
+                coef2 = MatrInvCubica @ pi
+                pj = coef2[0]*(di*di*di)+coef2[1]*(di*di)+coef2[2]*di+coef2[3]
                 return float(pj)
             else:
                 return nulo
@@ -68,6 +72,218 @@ def Interpolar(X, Y, BAND, origem, resol_X, resol_Y, metodo, nulo):
             return nulo
 
 
+# Função de Interpolação para arrays de coordenadas (mesmos resultados de Interpolar)
+# desloc: (linha, coluna) do primeiro pixel de BAND, quando BAND é uma janela do raster com a origem dada
+def InterpolarArray(X, Y, BAND, origem, resol_X, resol_Y, metodo, nulo, desloc = (0, 0)):
+    X, Y = np.broadcast_arrays(np.asarray(X, dtype=float), np.asarray(Y, dtype=float))
+    lins, cols = BAND.shape
+    Z = np.full(X.shape, nulo, dtype=float)
+    I = (origem[1]-Y)/resol_Y - 0.5
+    J = (X - origem[0])/resol_X - 0.5
+    if metodo == 'nearest':
+        I = np.round(I) - desloc[0]
+        J = np.round(J) - desloc[1]
+        dentro = (I >= 0) & (I < lins) & (J >= 0) & (J < cols)
+        Z[dentro] = BAND[I[dentro].astype(int), J[dentro].astype(int)]
+    elif metodo == 'bilinear':
+        I0, J0 = np.floor(I), np.floor(J)
+        di, dj = I - I0, J - J0
+        I0, J0 = I0 - desloc[0], J0 - desloc[1]
+        I1, J1 = np.ceil(I) - desloc[0], np.ceil(J) - desloc[1]
+        dentro = (I0 >= 0) & (I1 < lins) & (J0 >= 0) & (J1 < cols)
+        di = di[dentro]
+        dj = dj[dentro]
+        i0, j0 = I0[dentro].astype(int), J0[dentro].astype(int)
+        i1, j1 = I1[dentro].astype(int), J1[dentro].astype(int)
+        z00, z10, z01, z11 = BAND[i0, j0], BAND[i1, j0], BAND[i0, j1], BAND[i1, j1]
+        valido = (z00 != nulo) & (z10 != nulo) & (z01 != nulo) & (z11 != nulo)
+        valores = (1-di)*(1-dj)*z00 + (1-dj)*di*z10 + (1-di)*dj*z01 + di*dj*z11
+        Z[dentro] = np.where(valido, valores, nulo)
+    elif metodo == 'bicubic':
+        I0, J0 = np.floor(I), np.floor(J)
+        di, dj = I - I0, J - J0
+        I0, J0 = I0 - desloc[0], J0 - desloc[1]
+        dentro = (I0 >= 1) & (I0 + 2 < lins) & (J0 >= 1) & (J0 + 2 < cols)
+        di = di[dentro]
+        dj = dj[dentro]
+        desloc = np.arange(-1, 3)
+        i = I0[dentro].astype(int)[:, np.newaxis, np.newaxis] + desloc[np.newaxis, :, np.newaxis]
+        j = J0[dentro].astype(int)[:, np.newaxis, np.newaxis] + desloc[np.newaxis, np.newaxis, :]
+        MAT = BAND[i, j] # janelas 4x4 de cada ponto
+        valido = (MAT != nulo).all(axis=(1, 2))
+        coef = np.matmul(MatrInvCubica, MAT.transpose(0, 2, 1))
+        # Horizontal
+        dj = dj[:, np.newaxis]
+        pi = coef[:, 0, :]*(dj*dj*dj) + coef[:, 1, :]*(dj*dj) + coef[:, 2, :]*dj + coef[:, 3, :]
+        # Vertical
+        coef2 = np.matmul(MatrInvCubica, pi[:, :, np.newaxis])[:, :, 0]
+        pj = coef2[:, 0]*(di*di*di) + coef2[:, 1]*(di*di) + coef2[:, 2]*di + coef2[:, 3]
+        Z[dentro] = np.where(valido, pj, nulo)
+    return Z
+
+
+# Rasters abertos por um processo paralelo (reaproveitados entre as tarefas do processo)
+# Usado apenas nos processos filhos: no processo do QGIS, cada execução passa o seu próprio dicionário,
+# pois os datasets do GDAL não podem ser compartilhados entre threads
+RASTERS_ABERTOS = {}
+
+def AbrirRaster(caminho, rasters = None):
+    if rasters is None:
+        rasters = RASTERS_ABERTOS
+    if caminho not in rasters:
+        rasters[caminho] = gdal.Open(caminho)
+    return rasters[caminho]
+
+# Pixels por tarefa de interpolação
+PIXELS_POR_LOTE = 262144 # 2^18
+
+# Interpolação dos pixels (lin, col) de uma grade a partir de uma ou mais imagens
+# sobrep: 0 - primeira imagem, 1 - média, 2 - mediana, 3 - máximo, 4 - mínimo
+# rasters: dicionário das imagens já abertas (None: cache do processo paralelo)
+# Retorna NaN onde nenhuma imagem tem valor
+def InterpolarPixels(imagens, n_banda, lin, col, origem, resol_X, resol_Y, metodo, nulo, sobrep, rasters = None):
+    X = origem[0] + resol_X*(col + 0.5)
+    Y = origem[1] - resol_Y*(lin + 0.5)
+    valores = []
+    for caminho in imagens:
+        image = AbrirRaster(caminho, rasters)
+        ulx, xres, xskew, uly, yskew, yres  = image.GetGeoTransform()
+        img_resol_X = abs(xres)
+        img_resol_Y = abs(yres)
+        # Janela da imagem que contém os pixels (com margem para a bicúbica)
+        I = (uly - Y)/img_resol_Y - 0.5
+        J = (X - ulx)/img_resol_X - 0.5
+        lin_ini = max(int(np.floor(I.min())) - 2, 0)
+        lin_fim = min(int(np.ceil(I.max())) + 3, image.RasterYSize)
+        col_ini = max(int(np.floor(J.min())) - 2, 0)
+        col_fim = min(int(np.ceil(J.max())) + 3, image.RasterXSize)
+        if lin_fim > lin_ini and col_fim > col_ini:
+            BAND = image.GetRasterBand(n_banda).ReadAsArray(col_ini, lin_ini, col_fim - col_ini, lin_fim - lin_ini)
+            Interpolado = InterpolarArray(X, Y, BAND, (ulx, uly), img_resol_X, img_resol_Y, metodo, nulo, (lin_ini, col_ini))
+            Interpolado[Interpolado == nulo] = np.nan
+        else:
+            Interpolado = np.full(X.shape, np.nan)
+        valores += [Interpolado]
+    valores = np.array(valores)
+    if sobrep == 0:
+        return valores[0]
+    result = np.full(X.shape, np.nan)
+    validos = (~np.isnan(valores)).any(axis=0)
+    if sobrep == 1:
+        result[validos] = np.nanmean(valores[:, validos], axis=0)
+    elif sobrep == 2:
+        result[validos] = np.nanmedian(valores[:, validos], axis=0)
+    elif sobrep == 3:
+        result[validos] = np.nanmax(valores[:, validos], axis=0)
+    elif sobrep == 4:
+        result[validos] = np.nanmin(valores[:, validos], axis=0)
+    return result
+
+
+# Janelas de leitura/escrita por blocos de um raster GDAL
+PIXELS_POR_BLOCO = 4194304 # 2^22 pixels (32 MB por banda em float64)
+
+def BlocosRaster(image, tamanho = None):
+    # Retorna a lista de janelas (xoff, yoff, xsize, ysize) que cobrem o raster
+    # tamanho: (n_col, n_lin) da janela; se None, usa o bloco natural da banda 1 agrupado até PIXELS_POR_BLOCO
+    cols = image.RasterXSize
+    rows = image.RasterYSize
+    if tamanho:
+        bx, by = tamanho
+    else:
+        bx, by = image.GetRasterBand(1).GetBlockSize()
+        bx = bx*max(1, min(-(-cols//bx), PIXELS_POR_BLOCO//(bx*by)))
+        by = by*max(1, PIXELS_POR_BLOCO//(bx*by))
+    bx, by = min(bx, cols), min(by, rows)
+    janelas = []
+    for yoff in range(0, rows, by):
+        for xoff in range(0, cols, bx):
+            janelas += [(xoff, yoff, min(bx, cols - xoff), min(by, rows - yoff))]
+    return janelas
+
+
+# Soma móvel em janela m x m (somente posições completas) por convolução separável
+def SomaMovel(A, m):
+    lins = A.shape[0] - m + 1
+    cols = A.shape[1] - m + 1
+    S = A[0:lins].astype(float)
+    for k in range(1, m):
+        S += A[k:k+lins]
+    R = S[:, 0:cols].copy()
+    for k in range(1, m):
+        R += S[:, k:k+cols]
+    return R
+
+# Mediana móvel em janela m x m (somente posições completas) por stride tricks
+def MedianaMovel(A, m):
+    A = np.ascontiguousarray(A)
+    lins = A.shape[0] - m + 1
+    cols = A.shape[1] - m + 1
+    s0, s1 = A.strides
+    janelas = np.lib.stride_tricks.as_strided(A, shape=(lins, cols, m, m), strides=(s0, s1, s0, s1), writeable=False)
+    return np.median(janelas.reshape(lins, cols, m*m), axis=2)
+
+
+# Máscara de um polígono sobre a grade de pixels do raster (centro do pixel dentro do polígono)
+def MascaraPoligono(pontos, origem, resol_X, resol_Y, n_lin, n_col):
+    # pontos: vértices do anel do polígono (QgsPointXY)
+    # Retorna a janela booleana e sua posição (lin_min, col_min) no raster
+    caminho = np.array([[(origem[1]-pnt.y())/resol_Y, (pnt.x() - origem[0])/resol_X] for pnt in pontos])
+    lin_min = max(int(np.floor(caminho[:,0].min())), 0)
+    lin_max = min(int(np.floor(caminho[:,0].max())), n_lin - 1)
+    col_min = max(int(np.floor(caminho[:,1].min())), 0)
+    col_max = min(int(np.floor(caminho[:,1].max())), n_col - 1)
+    if lin_max < lin_min or col_max < col_min:
+        return np.zeros((0, 0), dtype=bool), lin_min, col_min
+    LIN, COL = np.mgrid[lin_min:lin_max+1, col_min:col_max+1]
+    centros = np.column_stack((LIN.ravel() + 0.5, COL.ravel() + 0.5)) # 0.5 eh o centro do pixel
+    mascara = path.Path(caminho).contains_points(centros).reshape(LIN.shape)
+    return mascara, lin_min, col_min
+
+
+# Classes de sobreposição de imagens retangulares na grade de um mosaico (arranjo planar)
+# retangulos: (lin_ini, lin_fim, col_ini, col_fim) de cada imagem na grade (fim exclusivo)
+# vizinhos: para cada imagem, índices das imagens que podem intersectá-la (ex.: consulta ao índice espacial)
+# primeiro: se True, cada pixel é atribuído apenas à primeira imagem que o cobre
+# Retorna {combinação de imagens (numeradas a partir de 1): array (n, 2) com (lin, col) dos pixels}
+def ClassesSobreposicao(retangulos, vizinhos, primeiro = False):
+    ret = np.asarray(retangulos, dtype=int).reshape(-1, 4)
+    partes = {}
+    for i, (l0, l1, c0, c1) in enumerate(ret):
+        if l1 <= l0 or c1 <= c0:
+            continue
+        viz = np.array(sorted(set(vizinhos[i]) | {i}))
+        R = ret[viz]
+        inter = (R[:,0] < l1) & (R[:,1] > l0) & (R[:,2] < c1) & (R[:,3] > c0)
+        viz, R = viz[inter], R[inter]
+        # Células delimitadas pelas bordas das imagens vizinhas dentro da imagem i
+        lins = np.unique(np.clip(R[:,:2], l0, l1))
+        cols = np.unique(np.clip(R[:,2:], c0, c1))
+        cob_lin = (R[:,0:1] <= lins[:-1]) & (R[:,1:2] >= lins[1:])
+        cob_col = (R[:,2:3] <= cols[:-1]) & (R[:,3:4] >= cols[1:])
+        cobertura = cob_lin[:,:,np.newaxis] & cob_col[:,np.newaxis,:]
+        # A célula pertence à imagem i se nenhuma imagem de menor índice a cobre (sem duplicidade)
+        dono = ~cobertura[viz < i].any(axis=0)
+        celulas_lin, celulas_col = np.nonzero(dono)
+        if primeiro:
+            padroes, inversa = np.zeros((1, 0), dtype=bool), np.zeros(len(celulas_lin), dtype=int)
+        else:
+            padroes, inversa = np.unique(cobertura[:, celulas_lin, celulas_col].T, axis=0, return_inverse=True)
+            inversa = inversa.ravel()
+        for k, padrao in enumerate(padroes):
+            comb = (i+1,) if primeiro else tuple(int(img) + 1 for img in viz[padrao])
+            for a, b in zip(celulas_lin[inversa == k], celulas_col[inversa == k]):
+                partes.setdefault(comb, []).append((lins[a], lins[a+1], cols[b], cols[b+1]))
+    classes = {}
+    for comb in partes:
+        pixels = []
+        for l0, l1, c0, c1 in partes[comb]:
+            LIN, COL = np.mgrid[l0:l1, c0:c1]
+            pixels += [np.column_stack((LIN.ravel(), COL.ravel()))]
+        classes[comb] = np.concatenate(pixels)
+    return classes
+
+
 def rgb2hsv(rgb):
     rgb = rgb.astype('float')/255. # dividir pelo máximo - mínimo
     maxv = np.amax(rgb, axis=2)
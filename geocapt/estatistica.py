@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Estatística espacial
+
+import numpy as np
+
+# Elementos da matriz de distâncias calculados por vez (32 MB em float64)
+ELEMENTOS_POR_BLOCO = 4194304 # 2^22
+# Acima deste número de pontos, a feição central é buscada apenas entre os candidatos
+# mais próximos da mediana geométrica (aproximação)
+LIMITE_FEICAO_CENTRAL = 20000
+N_CANDIDATOS = 2048
+
+
+# Quantis ponderados
+# valores: array (n,) ou (n, k) - cada coluna é tratada separadamente
+# quantis: valor ou lista de quantis entre 0 e 1
+# pesos: array (n,) com os pesos de cada valor
+def QuantisPonderados(valores, quantis, pesos):
+    valores = np.asarray(valores, dtype=float)
+    pesos = np.asarray(pesos, dtype=float)
+    coluna = valores.ndim == 1
+    if coluna:
+        valores = valores[:, np.newaxis]
+    sorter = np.argsort(valores, axis=0, kind='stable') # ordenar valores
+    valores = np.take_along_axis(valores, sorter, axis=0)
+    q = pesos[sorter].cumsum(axis=0)/pesos.sum() # quantis ponderados
+    result = np.array([np.interp(quantis, q[:, k], valores[:, k]) for k in range(valores.shape[1])]).T
+    return result[..., 0] if coluna else result
+
+# Mediana ponderada
+def MedianaPonderada(valores, pesos):
+    return QuantisPonderados(valores, 0.5, pesos)
+
+
+# Soma ponderada das distâncias dos pontos candidatos (índices) a todos os pontos
+# Calculada por blocos de linhas da matriz de distâncias (memória limitada)
+def SomaDistancias(x, y, w, candidatos):
+    soma = np.empty(len(candidatos))
+    passo = max(1, ELEMENTOS_POR_BLOCO//max(len(x), 1))
+    for ini in range(0, len(candidatos), passo):
+        ind = candidatos[ini:ini+passo]
+        dx = x[ind][:, np.newaxis] - x[np.newaxis, :]
+        dy = y[ind][:, np.newaxis] - y[np.newaxis, :]
+        soma[ini:ini+passo] = np.sqrt(dx*dx + dy*dy) @ w
+    return soma
+
+# Mediana geométrica ponderada (algoritmo de Weiszfeld)
+def MedianaGeometrica(x, y, w, tol = 1e-9, max_iter = 200):
+    xm = np.average(x, weights = w)
+    ym = np.average(y, weights = w)
+    for k in range(max_iter):
+        d = np.hypot(x - xm, y - ym)
+        d[d < tol] = tol # evitar divisão por zero sobre um ponto
+        p = w/d
+        xn = (p*x).sum()/p.sum()
+        yn = (p*y).sum()/p.sum()
+        if np.hypot(xn - xm, yn - ym) < tol:
+            xm, ym = xn, yn
+            break
+        xm, ym = xn, yn
+    return xm, ym
+
+# Índice da feição central: ponto com a menor soma ponderada das distâncias aos demais
+# Até LIMITE_FEICAO_CENTRAL pontos a busca é exata; acima, os candidatos são os
+# N_CANDIDATOS pontos mais próximos da mediana geométrica
+def FeicaoCentral(x, y, w = None):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    w = np.ones(len(x)) if w is None else np.asarray(w, dtype=float)
+    if len(x) > LIMITE_FEICAO_CENTRAL:
+        xm, ym = MedianaGeometrica(x, y, w)
+        d = np.hypot(x - xm, y - ym)
+        candidatos = np.sort(np.argpartition(d, N_CANDIDATOS)[:N_CANDIDATOS])
+    else:
+        candidatos = np.arange(len(x))
+    soma = SomaDistancias(x, y, w, candidatos)
+    return int(candidatos[np.argmin(soma)])
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Leitura dos metadados (EXIF) de fotos geolocalizadas
+
+import os, sqlite3, datetime
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from PIL import Image, TiffTags, ExifTags
+from PIL.TiffImagePlugin import ImageFileDirectory_v2
+from PIL.TiffTags import TAGS
+ImageFileDirectory_v2._load_dispatch[13] = ImageFileDirectory_v2._load_dispatch[TiffTags.LONG]
+
+# Leituras simultâneas de arquivos (limitadas pelo disco ou pela rede, não pela CPU)
+N_LEITORES = 8
+# Fotos gravadas no cache por lote
+FOTOS_POR_LOTE = 1000
+# Arquivo de cache dos metadados, gravado na pasta das fotos
+ARQUIVO_CACHE = '.lftools_exif.sqlite'
+
+GPS_KEYS = ['GPSVersionID','GPSLatitudeRef','GPSLatitude','GPSLongitudeRef','GPSLongitude','GPSAltitudeRef','GPSAltitude','GPSTimeStamp','GPSSatellites','GPSStatus','GPSMeasureMode','GPSDOP','GPSSpeedRef','GPSSpeed','GPSTrackRef','GPSTrack','GPSImgDirectionRef','GPSImgDirection','GPSMapDatum','GPSDestLatitudeRef','GPSDestLatitude','GPSDestLongitudeRef','GPSDestLongitude','GPSDestBearingRef','GPSDestBearing','GPSDestDistanceRef','GPSDestDistance','GPSProcessingMethod','GPSAreaInformation','GPSDateStamp','GPSDifferential']
+
+
+# Transformar os dados do EXIF em coordenadas em graus decimais
+def _coordenadas(exif):
+    try:
+        ref_lat = exif['GPSInfo'][1][0]
+        ref_lon = exif['GPSInfo'][3][0]
+        sinal_lat, sinal_lon = 0, 0
+        if ref_lat == 'S':
+            sinal_lat = -1
+        elif ref_lat == 'N':
+            sinal_lat = 1
+        if ref_lon == 'W':
+            sinal_lon = -1
+        elif ref_lon == 'E':
+            sinal_lon = 1
+
+        try:
+            grausLat,grausLon = exif['GPSInfo'][2][0][0], exif['GPSInfo'][4][0][0]
+            minLat, minLon = exif['GPSInfo'][2][1][0], exif['GPSInfo'][4][1][0]
+            segLat = exif['GPSInfo'][2][2][0]/float(exif['GPSInfo'][2][2][1])
+            segLon = exif['GPSInfo'][4][2][0]/float(exif['GPSInfo'][4][2][1])
+        except:
+            grausLat,grausLon = exif['GPSInfo'][2][0], exif['GPSInfo'][4][0]
+            minLat, minLon = exif['GPSInfo'][2][1], exif['GPSInfo'][4][1]
+            segLat = exif['GPSInfo'][2][2]
+            segLon = exif['GPSInfo'][4][2]
+        if sinal_lat!=0 and sinal_lon!=0:
+            lat = sinal_lat*(float(grausLat)+minLat/60.0+segLat/3600.0)
+            lon = sinal_lon*(float(grausLon)+minLon/60.0+segLon/3600.0)
+        return float(lat), float(lon)
+    except:
+        return 0,0
+
+# Azimute da foto
+def _azimute(exif):
+    Az = exif['GPSInfo'][17]
+    if isinstance(Az, tuple):
+        Az = Az[0]/float(Az[1])
+    return float(Az)
+
+# Padrão data-hora
+def _data_hora(texto):
+    data_hora = texto.replace(' ',':')
+    data_hora = data_hora.split(':')
+    ano = int(data_hora[0])
+    mes = int(data_hora[1])
+    dia = int(data_hora[2])
+    hora = int(data_hora[3])
+    minuto = int(data_hora[4])
+    segundo = int(data_hora[5])
+    return str(datetime.datetime(ano, mes, dia, hora, minuto, segundo))
+
+
+# Metadados de uma foto JPEG ou TIFF
+# A imagem é aberta de forma preguiçosa: apenas os cabeçalhos (EXIF/APP1 ou IFDs) são lidos,
+# os pixels não são decodificados
+# Retorna (lon, lat, altitude, azimute, data_hora); lon = lat = 0 para fotos sem geotag
+def ExifFoto(filepath):
+    lon, lat = 0, 0
+    Az = None
+    date_time = None
+    altitude = None
+    if filepath.lower().endswith(('.jpg', '.jpeg')):
+        with Image.open(filepath) as img:
+            dados = img._getexif()
+        if dados:
+            exif = {
+                ExifTags.TAGS[k]: v
+                for k, v in dados.items()
+                if k in ExifTags.TAGS
+            }
+        else:
+            exif = {}
+        if 'GPSInfo' in exif:
+            lat, lon = _coordenadas(exif)
+            if lat != 0:
+                if 17 in exif['GPSInfo']:
+                    Az = _azimute(exif)
+                if 6 in exif['GPSInfo']:
+                    try:
+                        altitude = float(exif['GPSInfo'][6][0])/exif['GPSInfo'][6][1]
+                    except:
+                        altitude = float(exif['GPSInfo'][6])
+        if 'DateTimeOriginal' in exif:
+            date_time = _data_hora(exif['DateTimeOriginal'])
+        elif 'DateTime' in exif:
+            date_time = _data_hora(exif['DateTime'])
+
+    elif filepath.lower().endswith(('.tif', '.tiff')):
+        with Image.open(filepath) as img:
+            meta_dict = {TAGS[key] : img.tag[key] for key in img.tag_v2 if key in TAGS}
+            gps_offset = img.tag_v2.get(0x8825)
+            tags = {}
+            if gps_offset:
+                ifh = b"II\x2A\x00\x08\x00\x00\x00" if img.tag_v2._endian == "<" else b"MM\x00\x2A\x00\x00\x00\x08"
+                info = ImageFileDirectory_v2(ifh)
+                img.fp.seek(gps_offset)
+                info.load(img.fp)
+                for k, v in info.items():
+                    tags[GPS_KEYS[k]] = str(v)
+
+        if 'GPSLatitudeRef' in tags:
+            lat_ref = str(tags['GPSLatitudeRef'])
+            lat = eval(str(tags['GPSLatitude']))
+            lat = (-1 if lat_ref.upper() == 'S' else 1)*(lat[0] + lat[1]/60 + lat[2]/3600)
+            lon_ref = str(tags['GPSLongitudeRef'])
+            lon = eval(str(tags['GPSLongitude']))
+            lon = (-1 if lon_ref.upper() == 'W' else 1)*(lon[0] + lon[1]/60 + lon[2]/3600)
+            altitude = float(eval(str(tags['GPSAltitude'])))
+            date_time = _data_hora(meta_dict['DateTime'][0])
+
+    return (float(lon), float(lat), altitude, Az, date_time)
+
+
+# Cache dos metadados (SQLite), chave: caminho, data de modificação e tamanho do arquivo
+# Retorna a conexão ou None se não for possível gravar na pasta
+def AbrirCacheExif(pasta):
+    try:
+        conexao = sqlite3.connect(os.path.join(pasta, ARQUIVO_CACHE))
+        conexao.execute('''CREATE TABLE IF NOT EXISTS fotos (caminho TEXT PRIMARY KEY, mtime REAL, tamanho INTEGER,
+                           lon REAL, lat REAL, altitude REAL, azimute REAL, data_hora TEXT)''')
+        return conexao
+    except sqlite3.Error:
+        return None
+
+
+# Gravar um lote de metadados no cache (retorna None se o cache deixar de ser gravável)
+def _gravar_cache(cache, lote):
+    if cache is not None and lote:
+        try:
+            cache.executemany('INSERT OR REPLACE INTO fotos VALUES (?,?,?,?,?,?,?,?)', lote)
+            cache.commit()
+        except sqlite3.Error:
+            return None
+    return cache
+
+
+# Metadados de uma lista de fotos
+# Apenas as fotos novas ou modificadas desde o cache são lidas, em paralelo (threads)
+# Gera (índice na lista, caminho, metadados ou exceção, lido do cache)
+def ExifFotos(lista, cache = None):
+    conhecidos = {}
+    if cache is not None:
+        for caminho, mtime, tamanho, lon, lat, alt, az, dh in cache.execute('SELECT * FROM fotos'):
+            conhecidos[caminho] = (mtime, tamanho, (lon, lat, alt, az, dh))
+    novos = []
+    for ind, caminho in enumerate(lista):
+        estado = os.stat(caminho)
+        item = conhecidos.get(caminho)
+        if item and item[0] == estado.st_mtime and item[1] == estado.st_size:
+            yield ind, caminho, item[2], True
+        else:
+            novos += [(ind, caminho, estado.st_mtime, estado.st_size)]
+
+    def Ler(caminho):
+        try:
+            return ExifFoto(caminho)
+        except Exception as erro:
+            return erro
+
+    # Fila limitada: no máximo 2 leituras por thread aguardando (cancelamento rápido)
+    executor = ThreadPoolExecutor(max_workers = N_LEITORES)
+    pendentes = deque()
+    lote = []
+    proxima = 0
+    try:
+        while proxima < len(novos) or pendentes:
+            while proxima < len(novos) and len(pendentes) < 2*N_LEITORES:
+                pendentes.append((novos[proxima], executor.submit(Ler, novos[proxima][1])))
+                proxima += 1
+            (ind, caminho, mtime, tamanho), tarefa = pendentes.popleft()
+            dados = tarefa.result()
+            if not isinstance(dados, Exception):
+                lote += [(caminho, mtime, tamanho) + tuple(dados)]
+            yield ind, caminho, dados, False
+            if len(lote) >= FOTOS_POR_LOTE:
+                cache = _gravar_cache(cache, lote)
+                lote = []
+    finally:
+        executor.shutdown(wait = False, cancel_futures = True)
+        _gravar_cache(cache, lote)
+
+
+# Redimensionar uma foto JPEG para que o lado maior tenha 'lado' pixels, mantendo o EXIF
+# Usa a redução no domínio DCT do JPEG (draft) quando a saída é bem menor que a entrada
+# atualizar: não refaz saídas mais novas que a foto de entrada
+# Retorna True se a foto foi gravada, False se foi pulada
+def RedimensionarFoto(caminho, saida, lado, atualizar = False):
+    if atualizar and os.path.isfile(saida) and os.path.getmtime(saida) >= os.path.getmtime(caminho):
+        return False
+    with Image.open(caminho) as img:
+        exif = img.info.get('exif')
+        largura, altura = img.size
+        if largura > altura:
+            new_height = int(lado/float(largura)*altura)
+            new_width = lado
+        else:
+            new_width = int(lado/float(altura)*largura)
+            new_height = lado
+        img.draft(img.mode, (new_width, new_height)) # escala de 1/2, 1/4 ou 1/8, nunca menor que a saída
+        img = img.resize((new_width, new_height))
+    if exif:
+        img.save(saida, exif=exif)
+    else:
+        img.save(saida)
+    return True
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Leitura de arquivos de rastreio GNSS
+
+import os
+import numpy as np
+from functools import reduce
+from operator import xor
+
+# Bytes lidos do arquivo por vez
+BYTES_POR_LEITURA = 16777216 # 16 MB
+# Épocas por lote (colunas pré-alocadas)
+EPOCAS_POR_LOTE = 65536
+
+
+# Linhas de um arquivo lido em blocos de bytes (memória constante)
+# Retorna (linha em bytes, fração do arquivo lida)
+def LinhasArquivo(caminho):
+    tamanho = max(os.path.getsize(caminho), 1)
+    lido = 0
+    resto = b''
+    with open(caminho, 'rb') as arq:
+        while True:
+            bloco = arq.read(BYTES_POR_LEITURA)
+            if not bloco:
+                break
+            lido += len(bloco)
+            linhas = (resto + bloco).split(b'\n')
+            resto = linhas.pop()
+            for linha in linhas:
+                yield linha, lido/tamanho
+    if resto:
+        yield resto, 1.0
+
+
+# Sentença NMEA sem '$' e checksum, dividida em campos
+# Retorna None se o checksum informado não confere
+def CamposNMEA(linha, ini):
+    linha = linha.rstrip()
+    fim = linha.find(b'*', ini)
+    if fim < 0: # sem checksum
+        corpo = linha[ini+1:]
+    else:
+        corpo = linha[ini+1:fim]
+        try:
+            if reduce(xor, corpo, 0) != int(linha[fim+1:fim+3], 16):
+                return None
+        except ValueError:
+            return None
+    return corpo.decode('ascii', 'ignore').split(',')
+
+
+# Sentenças NMEA 0183
+def _nmea_gsa(partes, estado): # GPS DOP and active satellites
+    estado['PDOP'] = float(partes[-4])
+    estado['HDOP'] = float(partes[-3])
+    estado['VDOP'] = float(partes[-2])
+
+# Segundos do dia (hhmmss.ss)
+def _sod(hora):
+    return int(hora[0:2])*3600 + int(hora[2:4])*60 + float(hora[4:10])
+
+# As sentenças de data também guardam a sua hora, para que a passagem da meia-noite
+# não seja aplicada de novo na GGA seguinte
+def _nmea_zda(partes, estado): # Time & Date – UTC, Day, Month, Year and Local Time Zone
+    estado['data'] = np.datetime64('{:04d}-{:02d}-{:02d}'.format(int(partes[4]), int(partes[3]), int(partes[2])))
+    if partes[1]:
+        estado['sod'] = _sod(partes[1])
+
+def _nmea_rmc(partes, estado): # Recommended minimum specific GNSS data (data: ddmmaa)
+    data = partes[9]
+    estado['data'] = np.datetime64('{:04d}-{:02d}-{:02d}'.format(2000 + int(data[4:6]), int(data[2:4]), int(data[0:2])))
+    if partes[1]:
+        estado['sod'] = _sod(partes[1])
+
+def _nmea_gga(partes, estado): # global position system fix data
+    sod = _sod(partes[1]) # segundos do dia
+    lat = (-1 if partes[3] == 'S' else 1)*( float(partes[2][0:2]) + float(partes[2][2:])/60)
+    lon = (-1 if partes[5] == 'W' else 1)*( float(partes[4][0:3]) + float(partes[4][3:])/60)
+    quality = int(partes[6])
+    num_sat = int(partes[7])
+    HDOP = float(partes[8])
+    H = float(partes[9]) - estado['aa']
+    N = float(partes[11])
+    estado['HDOP'] = HDOP
+    # Passagem da meia-noite antes da próxima sentença de data
+    if sod < estado['sod'] - 43200:
+        estado['data'] += np.timedelta64(1, 'D')
+    estado['sod'] = sod
+    return (lat, lon, N + H, H, N, HDOP, estado['VDOP'], estado['PDOP'], sod, estado['data'], quality, num_sat)
+
+SENTENCAS_NMEA = {b'GGA': _nmea_gga,
+                  b'GSA': _nmea_gsa,
+                  b'ZDA': _nmea_zda,
+                  b'RMC': _nmea_rmc}
+
+# Colunas das épocas NMEA
+COLUNAS_NMEA = [('lat', 'f8'), ('lon', 'f8'), ('h', 'f8'), ('H', 'f8'), ('N', 'f8'),
+                ('HDOP', 'f8'), ('VDOP', 'f8'), ('PDOP', 'f8'), ('sod', 'f8'),
+                ('data', 'datetime64[D]'), ('quality', 'i4'), ('num_sat', 'i4')]
+
+
+# Leitura de arquivo NMEA por lotes de épocas (GGA)
+# aa: altura da antena
+# Retorna (lote, fração do arquivo lida, sentenças rejeitadas pelo checksum)
+# lote: array estruturado com as colunas de COLUNAS_NMEA (reutilizado entre lotes)
+def LerNMEA(caminho, aa = 0):
+    estado = {'aa': aa, 'PDOP': -1, 'HDOP': -1, 'VDOP': -1, 'sod': -1, 'data': None}
+    # Primeira data do arquivo (épocas anteriores à primeira sentença de data)
+    for linha, fracao in LinhasArquivo(caminho):
+        ini = linha.find(b'$')
+        if ini >= 0 and linha[ini+3:ini+6] in (b'ZDA', b'RMC'):
+            partes = CamposNMEA(linha, ini)
+            try:
+                SENTENCAS_NMEA[linha[ini+3:ini+6]](partes, estado)
+                break
+            except:
+                pass
+    if estado['data'] is None:
+        return
+    estado['sod'] = -1
+    lote = np.zeros(EPOCAS_POR_LOTE, dtype = COLUNAS_NMEA)
+    n = 0
+    rejeitadas = 0
+    for linha, fracao in LinhasArquivo(caminho):
+        ini = linha.find(b'$')
+        funcao = SENTENCAS_NMEA.get(linha[ini+3:ini+6]) if ini >= 0 else None
+        if funcao is None:
+            continue
+        partes = CamposNMEA(linha, ini)
+        if partes is None:
+            rejeitadas += 1
+            continue
+        try:
+            epoca = funcao(partes, estado)
+        except:
+            continue
+        if epoca is not None:
+            lote[n] = epoca
+            n += 1
+            if n == EPOCAS_POR_LOTE:
+                yield lote, fracao, rejeitadas
+                n = 0
+    if n:
+        yield lote[:n], 1.0, rejeitadas
+
+
+# Data e hora ('aaaa-mm-dd hh:mm:ss') das épocas de um lote
+def DataHora(data, sod):
+    tempo = data.astype('datetime64[s]') + np.floor(sod).astype('timedelta64[s]')
+    return np.char.replace(np.datetime_as_string(tempo, unit='s'), 'T', ' ')
+
+
+# Colunas das épocas de arquivos POS
+COLUNAS_POS = [('lat', 'f8'), ('lon', 'f8'), ('h', 'f8'), ('datahora', 'datetime64[s]'),
+               ('quality', 'i4'), ('nsat', 'i4'), ('slat', 'f8'), ('slon', 'f8'), ('sh', 'f8')]
+
+# Graus, minutos e segundos (texto) para graus decimais (sinal pelo texto dos graus, inclusive -0)
+def _gms2gd(graus, minutos, segundos):
+    sinal = np.where(np.char.startswith(graus, '-'), -1, 1)
+    return graus.astype(float) + sinal*(minutos.astype(float)/60. + segundos.astype(float)/3600)
+
+# Leitura de arquivo POS do RTKLIB ou do PPP do IBGE em uma passada
+# Retorna (tipo: 'rtklib', 'ibge' ou None, array estruturado com as colunas de COLUNAS_POS)
+def LerPOS(caminho):
+    with open(caminho, 'r', encoding='utf-8', errors='ignore') as arq:
+        primeira = arq.readline()
+        if primeira[:1] == '%':
+            tipo = 'rtklib'
+            # data, hora, lat, lon, h, Q, ns, sdn, sde, sdu
+            indices = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        elif primeira[:1] == '-':
+            tipo = 'ibge'
+            # data, hora, nsat, sigma lat, lon e h, lat (g m s), lon (g m s), h
+            indices = [4, 5, 6, 15, 16, 17, 20, 21, 22, 23, 24, 25, 26]
+        else:
+            return None, None
+        arq.seek(0)
+        linhas = []
+        for linha in arq:
+            if tipo == 'rtklib':
+                if linha[:1] == '%' or not linha.strip():
+                    continue
+            elif linha[0:3] != 'FWD':
+                continue
+            partes = linha.split()
+            linhas += [[partes[k] for k in indices]]
+    pos = np.zeros(len(linhas), dtype = COLUNAS_POS)
+    if not linhas:
+        return tipo, pos
+    col = np.array(linhas).T
+    linhas = None
+    if tipo == 'rtklib':
+        data, hora = np.char.replace(col[0], '/', '-'), col[1]
+        pos['lat'], pos['lon'], pos['h'] = col[2].astype(float), col[3].astype(float), col[4].astype(float)
+        pos['quality'], pos['nsat'] = col[5].astype(int), col[6].astype(int)
+        pos['slat'], pos['slon'], pos['sh'] = col[7].astype(float), col[8].astype(float), col[9].astype(float)
+    else:
+        data, hora = col[0], col[1]
+        pos['nsat'] = col[2].astype(int)
+        pos['slat'], pos['slon'], pos['sh'] = col[3].astype(float), col[4].astype(float), col[5].astype(float)
+        pos['lat'] = _gms2gd(col[6], col[7], col[8])
+        pos['lon'] = _gms2gd(col[9], col[10], col[11])
+        pos['h'] = col[12].astype(float)
+        pos['quality'] = 6
+    # Data e hora truncadas no segundo
+    pos['datahora'] = np.array(np.char.add(np.char.add(data, 'T'), hora), dtype='datetime64[ms]').astype('datetime64[s]')
+    return tipo, pos
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+# Processamento paralelo (multiprocessamento)
+
+import os, sys, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Executor de processos paralelos
+def ExecutorProcessos(n_processos):
+    # Dentro do QGIS (Windows e macOS), sys.executable não é o interpretador Python
+    if os.name == 'nt':
+        executavel = os.path.join(sys.exec_prefix, 'pythonw.exe')
+    elif sys.platform == 'darwin':
+        executavel = os.path.join(sys.exec_prefix, 'bin', 'python3')
+    else:
+        executavel = None
+    if executavel and os.path.isfile(executavel):
+        multiprocessing.set_executable(executavel)
+    return ProcessPoolExecutor(max_workers = n_processos)
@@ -13,20 +13,38 @@ USAGE:
 -3.382344140520556
 """
 
+from functools import lru_cache
 from . import geomag
 
 __singleton__ = geomag.GeoMag()
 
+@lru_cache(maxsize=65536)
 def declination(*args, **kargs):
     """Calculate magnetic declination in degrees
     dlat = latitude in degrees
     dlon = longitude in degrees
     h = altitude in feet, default=0
     time = date for computing declination, default=today
+    Results are cached, since expressions call it once per feature.
     """
     mag = __singleton__.GeoMag(*args, **kargs)
     return mag.dec
 
+def magnetic_field(*args, **kargs):
+    """Evaluate the magnetic model for arrays of points at once
+    dlat, dlon, h = arrays (or scalars) with the same meaning as declination
+    time = date for computing the field, default=today
+    Returns an object with the arrays dec, dip, ti (total intensity, nT),
+    bh, bx, by, bz and gv.
+    """
+    return __singleton__.GeoMagArray(*args, **kargs)
+
+def declinations(*args, **kargs):
+    """Calculate magnetic declination in degrees for arrays of points
+    All parameters are the same as declination.
+    """
+    return magnetic_field(*args, **kargs).dec
+
 def mag_heading(hdg, *args, **kargs):
     """Calculates the magnetic heading from a true heading.
     hdg = true heading in degrees
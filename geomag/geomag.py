@@ -8,6 +8,7 @@
 # Suggestions for improvements are appreciated.
 
 import math, os, unittest
+import numpy as np
 from datetime import date
 
 class GeoMag:
@@ -20,6 +21,7 @@ class GeoMag:
         otime = oalt = olat = olon = -1000.0
 
         dt = time - self.epoch
+        tc = self.TimeCoeffs(time)
         glat = dlat
         glon = dlon
         rlat = math.radians(glat)
@@ -85,25 +87,18 @@ class GeoMag:
                         self.p[m][n] = ct*self.p[m][n-1]-self.k[m][n]*self.p[m][n-2]
                         self.dp[m][n] = ct*self.dp[m][n-1] - st*self.p[m][n-1]-self.k[m][n]*self.dp[m][n-2]
 
-        # /*
-                # TIME ADJUST THE GAUSS COEFFICIENTS
-        # */
-                if (time != otime):
-                    self.tc[m][n] = self.c[m][n]+dt*self.cd[m][n]
-                    if (m != 0):
-                        self.tc[n][m-1] = self.c[n][m-1]+dt*self.cd[n][m-1]
-
         # /*
                 # ACCUMULATE TERMS OF THE SPHERICAL HARMONIC EXPANSIONS
+                # (time adjusted Gauss coefficients are cached per date)
         # */
                 par = ar*self.p[m][n]
 
                 if (m == 0):
-                    temp1 = self.tc[m][n]*self.cp[m]
-                    temp2 = self.tc[m][n]*self.sp[m]
+                    temp1 = tc[m][n]*self.cp[m]
+                    temp2 = tc[m][n]*self.sp[m]
                 else:
-                    temp1 = self.tc[m][n]*self.cp[m]+self.tc[n][m-1]*self.sp[m]
-                    temp2 = self.tc[m][n]*self.sp[m]-self.tc[n][m-1]*self.cp[m]
+                    temp1 = tc[m][n]*self.cp[m]+tc[n][m-1]*self.sp[m]
+                    temp2 = tc[m][n]*self.sp[m]-tc[n][m-1]*self.cp[m]
 
                 bt = bt-ar*temp1*self.dp[m][n]
                 bp = bp + (self.fm[m] * temp2 * par)
@@ -185,6 +180,137 @@ class GeoMag:
 
         return retobj
 
+    def TimeCoeffs(self, time):
+        """Time adjusted Gauss coefficients for a decimal year, cached per date"""
+        if time not in self.tc_cache:
+            dt = time - self.epoch
+            self.tc_cache[time] = [[self.c[m][n]+dt*self.cd[m][n] for n in range(14)] for m in range(14)]
+        return self.tc_cache[time]
+
+    def GeoMagArray(self, dlat, dlon, h=0, time=date.today()): # arrays of latitude, longitude (decimal degrees), altitude (feet), date
+        """Vectorized version of GeoMag: evaluates N points at once.
+        Returns an object whose attributes (dec, dip, ti, bh, bx, by, bz, gv) are arrays.
+        """
+        time = time.year+((time - date(time.year,1,1)).days/365.0)
+        glat, glon, h = np.broadcast_arrays(np.asarray(dlat, dtype=float), np.asarray(dlon, dtype=float), np.asarray(h, dtype=float))
+        alt = h/3280.8399
+        tc = self.TimeCoeffs(time)
+        forma = glat.shape
+
+        rlat = np.radians(glat)
+        rlon = np.radians(glon)
+        srlat = np.sin(rlat)
+        crlat = np.cos(rlat)
+        srlat2 = srlat*srlat
+        crlat2 = crlat*crlat
+        sp = np.zeros((self.maxord+1,) + forma)
+        cp = np.zeros((self.maxord+1,) + forma)
+        cp[0] = 1.0
+        sp[1] = np.sin(rlon)
+        cp[1] = np.cos(rlon)
+
+        #/* CONVERT FROM GEODETIC COORDS. TO SPHERICAL COORDS. */
+        q = np.sqrt(self.a2-self.c2*srlat2)
+        q1 = alt*q
+        q2 = ((q1+self.a2)/(q1+self.b2))*((q1+self.a2)/(q1+self.b2))
+        ct = srlat/np.sqrt(q2*crlat2+srlat2)
+        st = np.sqrt(1.0-(ct*ct))
+        r2 = (alt*alt)+2.0*q1+(self.a4-self.c4*srlat2)/(q*q)
+        r = np.sqrt(r2)
+        d = np.sqrt(self.a2*crlat2+self.b2*srlat2)
+        ca = (alt+d)/r
+        sa = self.c2*crlat*srlat/(r*d)
+
+        for m in range(2,self.maxord+1):
+            sp[m] = sp[1]*cp[m-1]+cp[1]*sp[m-1]
+            cp[m] = cp[1]*cp[m-1]-sp[1]*sp[m-1]
+
+        p = np.zeros((self.maxord+1, self.maxord+1) + forma)
+        dp = np.zeros((self.maxord+1, self.maxord+1) + forma)
+        pp = np.zeros((self.maxord+1,) + forma)
+        p[0][0] = 1.0
+        pp[0] = 1.0
+        aor = self.re/r
+        ar = aor*aor
+        br = np.zeros(forma)
+        bt = np.zeros(forma)
+        bp = np.zeros(forma)
+        bpp = np.zeros(forma)
+        for n in range(1,self.maxord+1):
+            ar = ar*aor
+            for m in range(n+1):
+                # COMPUTE UNNORMALIZED ASSOCIATED LEGENDRE POLYNOMIALS
+                # AND DERIVATIVES VIA RECURSION RELATIONS
+                if (n == m):
+                    p[m][n] = st*p[m-1][n-1]
+                    dp[m][n] = st*dp[m-1][n-1]+ct*p[m-1][n-1]
+                elif (n == 1 and m == 0):
+                    p[m][n] = ct*p[m][n-1]
+                    dp[m][n] = ct*dp[m][n-1]-st*p[m][n-1]
+                elif (n > 1 and n != m):
+                    p[m][n] = ct*p[m][n-1]-self.k[m][n]*p[m][n-2]
+                    dp[m][n] = ct*dp[m][n-1] - st*p[m][n-1]-self.k[m][n]*dp[m][n-2]
+
+                # ACCUMULATE TERMS OF THE SPHERICAL HARMONIC EXPANSIONS
+                par = ar*p[m][n]
+                if (m == 0):
+                    temp1 = tc[m][n]*cp[m]
+                    temp2 = tc[m][n]*sp[m]
+                else:
+                    temp1 = tc[m][n]*cp[m]+tc[n][m-1]*sp[m]
+                    temp2 = tc[m][n]*sp[m]-tc[n][m-1]*cp[m]
+                bt = bt-ar*temp1*dp[m][n]
+                bp = bp + (self.fm[m] * temp2 * par)
+                br = br + (self.fn[n] * temp1 * par)
+
+                # SPECIAL CASE:  NORTH/SOUTH GEOGRAPHIC POLES
+                if (m == 1):
+                    if (n == 1):
+                        pp[n] = pp[n-1]
+                    else:
+                        pp[n] = ct*pp[n-1]-self.k[m][n]*pp[n-2]
+                    bpp = bpp + (self.fm[m]*temp2*ar*pp[n])
+
+        polo = st == 0.0
+        bp = np.where(polo, bpp, bp/np.where(polo, 1.0, st))
+
+        # ROTATE MAGNETIC VECTOR COMPONENTS FROM SPHERICAL TO
+        # GEODETIC COORDINATES
+        bx = -bt*ca-br*sa
+        by = bp
+        bz = bt*sa-br*ca
+
+        # COMPUTE DECLINATION (DEC), INCLINATION (DIP) AND
+        # TOTAL INTENSITY (TI)
+        bh = np.sqrt((bx*bx)+(by*by))
+        ti = np.sqrt((bh*bh)+(bz*bz))
+        dec = np.degrees(np.arctan2(by,bx))
+        dip = np.degrees(np.arctan2(bz,bh))
+
+        # MAGNETIC GRID VARIATION (ARCTIC OR ANTARCTIC), OTHERWISE -999.0
+        gv = np.where(glat > 0.0, dec-glon, dec+glon)
+        gv = np.where(gv > +180.0, gv - 360.0, gv)
+        gv = np.where(gv < -180.0, gv + 360.0, gv)
+        gv = np.where(np.abs(glat) >= 55., gv, -999.0)
+
+        class RetObj:
+            pass
+        retobj = RetObj()
+        retobj.dec = dec
+        retobj.dip = dip
+        retobj.ti = ti
+        retobj.bh = bh
+        retobj.bx = bx
+        retobj.by = by
+        retobj.bz = bz
+        retobj.gv = gv
+        retobj.lat = glat
+        retobj.lon = glon
+        retobj.alt = h
+        retobj.time = time
+
+        return retobj
+
     def __init__(self, wmm_filename=None):
         if not wmm_filename:
             wmm_filename = os.path.join(os.path.dirname(__file__), 'WMM.COF')
@@ -216,6 +342,7 @@ class GeoMag:
         self.p = [z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14],z[0:14]]
         self.p[0][0] = 1.0
         self.dp = [z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13],z[0:13]]
+        self.tc_cache = {}
         self.a = 6378.137
         self.b = 6356.7523142
         self.re = 6371.2
@@ -297,5 +424,15 @@ class GeoMagTest(unittest.TestCase):
             calcval=gm.GeoMag(values[2], values[3], values[1], values[0])
             self.assertAlmostEqual(values[4], calcval.dec, 2, 'Expected %s, result %s' % (values[4], calcval.dec))
 
+    def test_declination_array(self):
+        gm = GeoMag()
+        for time in (self.d1, self.d2):
+            values = [v for v in self.test_values if v[0] == time]
+            calcval = gm.GeoMagArray([v[2] for v in values], [v[3] for v in values], [v[1] for v in values], time)
+            for k, v in enumerate(values):
+                scalar = gm.GeoMag(v[2], v[3], v[1], time)
+                for attr in ('dec', 'dip', 'ti', 'bx', 'by', 'bz'):
+                    self.assertAlmostEqual(getattr(scalar, attr), getattr(calcval, attr)[k], 6)
+
 if __name__ == '__main__':
     unittest.main()
@@ -32,6 +32,7 @@ from qgis.core import (QgsApplication,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterFeatureSink)
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.cartography import ConectarPoligonos
 import numpy as np
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -164,35 +165,7 @@ class ConnectFeatures(QgsProcessingAlgorithm):
 
         # Verificar e corrigir conectividade
         feedback.pushInfo(self.tr('Checking and fixing connectivity...', 'Verificando e corrigindo conectividade...'))
-        tam = len(feicoes)
-        for i in range(tam):
-            for j in range(tam):
-                if i != j:
-                    feat_a = feicoes[i]
-                    geom_a = feat_a.geometry()
-                    feat_b = feicoes[j]
-                    geom_b = feat_b.geometry()
-                    if geom_a.intersects(geom_b):
-                        # Verificar se algum ponto de A que intercepta o segmento de B, não tem vértice correspondente
-                        coord_a = geom_a.asPolygon()[0]
-                        coord_b = geom_b.asPolygon()[0]
-                        new_coord_b =[]
-                        for k in range(len(coord_b)-1):
-                            p1 = coord_b[k]
-                            p2 = coord_b[k+1]
-                            segm = QgsGeometry.fromPolylineXY([p1, p2])
-                            sentinela = False
-                            for pnt_a in coord_a:
-                                pnt = QgsGeometry.fromPointXY(pnt_a).buffer(tol,1)
-                                if pnt_a not in coord_b and pnt.intersects(segm):
-                                    new_coord_b += [p1, pnt_a]
-                                    sentinela = True
-                                    break
-                            if not sentinela:
-                                new_coord_b += [p1]
-                        new_coord_b += [coord_b[-1]]
-                        feat_b.setGeometry(QgsGeometry.fromPolygonXY([new_coord_b]))
-                        feicoes[j] = feat_b
+        feicoes = ConectarPoligonos(feicoes, tol, feedback)
         # Resultados
         tam = len(feicoes)
         total = 100/tam if tam > 0 else 0
@@ -32,7 +32,7 @@ from qgis.core import (QgsApplication,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterFeatureSink)
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.cartography import OrientarPoligono
+from lftools.geocapt.cartography import OrientarPoligono, ConectarPoligonos, IndiceEspacial
 import numpy as np
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -173,65 +173,28 @@ class FrontLotLine(QgsProcessingAlgorithm):
 
         # Verificar e corrigir conectividade
         feedback.pushInfo(self.tr('Checking and fixing connectivity...', 'Verificando e corrigindo conectividade...'))
-        tam = len(feicoes)
-        for i in range(tam):
-            for j in range(tam):
-                if i != j:
-                    feat_a = feicoes[i]
-                    geom_a = feat_a.geometry()
-                    feat_b = feicoes[j]
-                    geom_b = feat_b.geometry()
-                    if geom_a.intersects(geom_b):
-                        # Verificar se algum ponto de A que intercepta o segmento de B, não tem vértice correspondente
-                        coord_a = geom_a.asPolygon()[0]
-                        coord_b = geom_b.asPolygon()[0]
-                        new_coord_b =[]
-                        for k in range(len(coord_b)-1):
-                            p1 = coord_b[k]
-                            p2 = coord_b[k+1]
-                            segm = QgsGeometry.fromPolylineXY([p1, p2])
-                            sentinela = False
-                            for pnt_a in coord_a:
-                                pnt = QgsGeometry.fromPointXY(pnt_a).buffer(tol,1)
-                                if pnt_a not in coord_b and pnt.intersects(segm):
-                                    new_coord_b += [p1, pnt_a]
-                                    sentinela = True
-                                    break
-                            if not sentinela:
-                                new_coord_b += [p1]
-                        new_coord_b += [coord_b[-1]]
-                        feat_b.setGeometry(QgsGeometry.fromPolygonXY([new_coord_b]))
-                        feicoes[j] = feat_b
+        feicoes = ConectarPoligonos(feicoes, tol, feedback)
 
-        # Pegar geometrias para mesclar
+        # Separar por quadras (conjuntos de lotes que se interceptam)
         feedback.pushInfo(self.tr('Defining set of parcels (blocks)...', 'Definindo conjunto de parcelas (quadras)...'))
-        geometrias = []
-        for feat in feicoes:
-            geometrias += [feat.geometry()]
-
-        # Separar por quadras (Mesclar lotes)
+        geometrias = [feat.geometry() for feat in feicoes]
+        indice = IndiceEspacial(geometrias)
+        grupo = list(range(len(geometrias)))
+        def raiz(k):
+            while grupo[k] != k:
+                grupo[k] = grupo[grupo[k]]
+                k = grupo[k]
+            return k
+        for i, geom_A in enumerate(geometrias):
+            for j in indice.intersects(geom_A.boundingBox()):
+                if j > i and raiz(i) != raiz(j) and geom_A.intersects(geometrias[j]):
+                    grupo[raiz(j)] = raiz(i)
+        membros = {}
+        for k in range(len(geometrias)):
+            membros.setdefault(raiz(k), []).append(k)
         quadras = []
-        while len(geometrias)>1:
-            tam = len(geometrias)
-            for i in range(0,tam-1):
-                mergeou = False
-                geom_A = geometrias[i]
-                for j in range(i+1,tam):
-                    geom_B = geometrias[j]
-                    if geom_A.intersects(geom_B):
-                        mergeou = True
-                        new_geom = geom_A.combine(geom_B)
-                        break
-                if mergeou:
-                    del geometrias[i], geometrias[j-1]
-                    geometrias = [new_geom] + geometrias
-                    break
-                else:
-                    quadras += [geom_A]
-                    del geometrias[i]
-                    break
-        if geometrias:
-            quadras += geometrias
+        for ind in membros.values():
+            quadras += [QgsGeometry.unaryUnion([geometrias[k] for k in ind])]
 
         # Orientar polígonos
         feedback.pushInfo(self.tr('Orienting polygon (clockwise)...', 'Orientando polígono (sentido horário)...'))
@@ -247,16 +210,10 @@ class FrontLotLine(QgsProcessingAlgorithm):
         # Separar feições por quadra
         qd_dic = {}
         testada_dic = {}
-        for qd in quadras:
-            qd_dic[qd] = []
+        for qd, ind in zip(quadras, membros.values()):
+            qd_dic[qd] = [feicoes[k] for k in ind]
             testada_dic[qd] = []
 
-        for feat in feicoes:
-            geom = feat.geometry()
-            for qd in quadras:
-                if geom.intersects(qd):
-                    qd_dic[qd] += [feat]
-
 
         # Calcular testadas por quadras
         feedback.pushInfo(self.tr('Calculating front lot lines...', 'Calculando testadas...'))
@@ -270,13 +227,15 @@ class FrontLotLine(QgsProcessingAlgorithm):
                 linhas += [geom.asPolygon()[0]]
 
             TAM = len(linhas)
+            geoms_linhas = [QgsGeometry.fromPolylineXY(linha) for linha in linhas]
+            indice = IndiceEspacial(geoms_linhas)
 
             # Calculando a diferenca para cada linha
             for current, i in enumerate(range(TAM)):
-                geom1 = QgsGeometry.fromPolylineXY(linhas[i])
-                for j in range(TAM):
+                geom1 = geoms_linhas[i]
+                for j in sorted(indice.intersects(geom1.boundingBox())):
                     if i != j:
-                        geom2 = QgsGeometry.fromPolylineXY(linhas[j])
+                        geom2 = geoms_linhas[j]
                         if geom1.intersects(geom2):
                             differ = geom1.difference(geom2)
                             geom1 = differ
@@ -19,6 +19,7 @@ from PyQt5.QtCore import *
 from qgis.core import *
 from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.cartography import areaGauss, geom2PointList, OrientarPoligono
+from lftools.geocapt.adjacencia import MapaAdjacencia, Confrontantes
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -215,6 +216,7 @@ class PolygonOrientation(QgsProcessingAlgorithm):
 
         if rua:
             feedback.pushInfo(self.tr('Identifying the first forward point for road access...', 'Identificando primeiro ponto com vante para o acesso viário...'))
+            mapa = MapaAdjacencia(camada.getFeatures())
             for feat1 in camada.getFeatures():
                 # Pegar vizinhos
                 geom1 = feat1.geometry()
@@ -224,13 +226,8 @@ class PolygonOrientation(QgsProcessingAlgorithm):
                     coords = geom1.asPolygon()[0]
                     coords = coords[:-1]
                     confront = {}
-                    for feat2 in camada.getFeatures():
-                        geom2 = feat2.geometry()
-                        cd_lote2 = feat2.id()
-                        if feat1 != feat2:
-                            if geom1.intersects(geom2):
-                                inters = geom1.intersection(geom2)
-                                confront[feat2.id()] = [cd_lote2, inters]
+                    for fid2, inters in Confrontantes(mapa, feat1).items():
+                        confront[fid2] = [fid2, inters]
 
                     lista = []
                     for pnt in coords:
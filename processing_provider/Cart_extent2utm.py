@@ -293,6 +293,8 @@ class Extent2UTMGrid(QgsProcessingAlgorithm):
 
         Percent = 100.0/(len(LON)*len(LAT))
         current = 0
+        # Declinação magnética calculada de uma vez para todas as cartas
+        feicoes, lat_centro, lon_centro = [], [], []
         for lat in LAT[::-1]:
             for lon in LON:
                 if lon>=0:
@@ -348,21 +350,28 @@ class Extent2UTMGrid(QgsProcessingAlgorithm):
                     zone, hemisf = FusoHemisf(QgsPointXY(lon, lat))
                     feat[self.tr('zone_hemisphere', 'fuso_hemisfério')] = str(zone)+hemisf
 
-                if mag_decl:
-                    data = date.today()
-                    DM = geomag.declination(centroide.y(), centroide.x(), h=0, time = data)
-                    var_DM = geomag.declination(centroide.y(), centroide.x(), h=0, time = date(data.year + 1 , data.month, data.day)) - DM
-                    feat[self.tr('MD', 'DM')] = float(DM)
-                    feat[self.tr('VAR_MD', 'var_DM')] = float(var_DM)
-                    feat[self.tr('Epoch', 'Época')] = '{}-{:02d}-{:02d}'.format(data.year , data.month, data.day)
-
                 # Coordinate Transformations (if needed)
                 geom = geom if crs.isGeographic() else reprojectPoints(geom, coordinateTransformer)
                 feat.setGeometry(geom)
-                sink2.addFeature(feat, QgsFeatureSink.FastInsert)
+                if mag_decl:
+                    feicoes += [feat]
+                    lat_centro += [centroide.y()]
+                    lon_centro += [centroide.x()]
+                else:
+                    sink2.addFeature(feat, QgsFeatureSink.FastInsert)
                 current += 1
                 feedback.setProgress(int(current * Percent))
 
+        if mag_decl and feicoes:
+            data = date.today()
+            DM = geomag.declinations(lat_centro, lon_centro, h=0, time = data)
+            var_DM = geomag.declinations(lat_centro, lon_centro, h=0, time = date(data.year + 1 , data.month, data.day)) - DM
+            for k, feat in enumerate(feicoes):
+                feat[self.tr('MD', 'DM')] = float(DM[k])
+                feat[self.tr('VAR_MD', 'var_DM')] = float(var_DM[k])
+                feat[self.tr('Epoch', 'Época')] = '{}-{:02d}-{:02d}'.format(data.year , data.month, data.day)
+            sink2.addFeatures(feicoes, QgsFeatureSink.FastInsert)
+
         if sink2 is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.FRAME))
 
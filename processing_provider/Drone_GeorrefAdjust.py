@@ -52,7 +52,7 @@ import numpy as np
 from pyproj.crs import CRS
 from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import Interpolar
+from lftools.geocapt.dip import InterpolarArray, BlocosRaster, PIXELS_POR_BLOCO
 from lftools.geocapt.adjust import Ajust2D, ValidacaoVetores, transformGeom2D
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -368,48 +368,51 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
         Driver.SetProjection(prj)
 
         # Iniciar reamostragem
-        Percent = 100.0/(n_lin*n_bands)
-        current = 0
-
+        tipo = gdal_array.GDALTypeCodeToNumericTypeCode(GDT)
+        inteiro = True if GDT in (gdal.GDT_Byte,
+                                  gdal.GDT_UInt16,
+                                  gdal.GDT_Int16,
+                                  gdal.GDT_UInt32,
+                                  gdal.GDT_Int32) else False
         for k in range(n_bands):
-            # Abrir banda 1 como array
-            feedback.pushInfo((self.tr('Opening band {} as array...', 'Abrindo banda {} como array...')).format(str(k+1)))
-            banda_antiga = image.GetRasterBand(k+1).ReadAsArray()
-            # Criando novo array
-            feedback.pushInfo((self.tr('Transforming new band {}...', 'Transformando nova banda {}...')).format(str(k+1)))
-            tipo = gdal_array.GDALTypeCodeToNumericTypeCode(GDT)
-            inteiro = True if GDT in (gdal.GDT_Byte,
-                                      gdal.GDT_UInt16,
-                                      gdal.GDT_Int16,
-                                      gdal.GDT_UInt32,
-                                      gdal.GDT_Int32) else False
-            banda_nova = np.ones((n_lin,n_col), dtype = tipo) * (int(valor_nulo) if inteiro else valor_nulo)
-            # Varrendo e preenchendo nova imagem
-            for lin in range(n_lin):
-                for col in range(n_col):
-                    X = origem[0] + resol_X*(col + 0.5)
-                    Y = origem[1] - resol_Y*(lin + 0.5)
-                    X_antigo, Y_antigo = CoordInvTransf(QgsPointXY(X,Y))
-                    Interpolado = Interpolar(X_antigo, Y_antigo,
-                                            banda_antiga,
-                                            origem_antiga,
-                                            xres_antiga,
-                                            yres_antiga,
-                                            reamostragem,
-                                            valor_nulo)
-                    if Interpolado != valor_nulo:
-                        banda_nova[lin][col] = round(Interpolado) if inteiro else Interpolado
-
-                if feedback.isCanceled():
-                    break
-                current += 1
-                feedback.setProgress(int(current * Percent))
-
-            # Salvar banda
-            outband = Driver.GetRasterBand(k+1)
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(k+1), 'Escrevendo Banda {}...'.format(k+1)))
-            outband.WriteArray(banda_nova)
-            outband.SetNoDataValue(valor_nulo)
+            Driver.GetRasterBand(k+1).SetNoDataValue(valor_nulo)
+
+        # Janelas quadradas da nova imagem (limitam a janela lida da imagem original em qualquer rotação)
+        lado = int(np.sqrt(PIXELS_POR_BLOCO))
+        janelas = BlocosRaster(Driver, (lado, lado))
+        Percent = 100.0/len(janelas)
+        feedback.pushInfo(self.tr('Transforming new image...', 'Transformando nova imagem...'))
+
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            # Coordenadas dos centros dos pixels da janela na imagem original (transformação inversa)
+            lin, col = np.mgrid[yoff:yoff+ysize, xoff:xoff+xsize]
+            X, Y = CoordInvTransf((origem[0] + resol_X*(col.ravel() + 0.5), origem[1] - resol_Y*(lin.ravel() + 0.5)))
+            # Janela da imagem original que contém os pontos (com margem para a bicúbica)
+            I = (origem_antiga[1] - Y)/yres_antiga - 0.5
+            J = (X - origem_antiga[0])/xres_antiga - 0.5
+            lin_ini = max(int(np.floor(I.min())) - 2, 0)
+            lin_fim = min(int(np.ceil(I.max())) + 3, rows)
+            col_ini = max(int(np.floor(J.min())) - 2, 0)
+            col_fim = min(int(np.ceil(J.max())) + 3, cols)
+            # Reamostrar todas as bandas
+            for k in range(n_bands):
+                banda_nova = np.ones((ysize, xsize), dtype = tipo) * (int(valor_nulo) if inteiro else valor_nulo)
+                if lin_fim > lin_ini and col_fim > col_ini:
+                    banda_antiga = image.GetRasterBand(k+1).ReadAsArray(col_ini, lin_ini, col_fim - col_ini, lin_fim - lin_ini)
+                    Interpolado = InterpolarArray(X, Y,
+                                                  banda_antiga,
+                                                  origem_antiga,
+                                                  xres_antiga,
+                                                  yres_antiga,
+                                                  reamostragem,
+                                                  valor_nulo,
+                                                  (lin_ini, col_ini)).reshape(ysize, xsize)
+                    validos = Interpolado != valor_nulo
+                    banda_nova[validos] = np.round(Interpolado[validos]) if inteiro else Interpolado[validos]
+                Driver.GetRasterBand(k+1).WriteArray(banda_nova, xoff, yoff)
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((index+1) * Percent))
 
         # Fechar Raster
         image = None # Close image
@@ -50,6 +50,7 @@ from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from math import floor, ceil
 import numpy as np
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import BlocosRaster
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -198,19 +199,29 @@ class RemoveAlphaBand(QgsProcessingAlgorithm):
             Driver.SetProjection(CRS.ExportToWkt()) # export coords to file
 
             # Alpha band
-            feedback.pushInfo(self.tr('Reading alpha band...', 'Lendo banda alfa...'))
-            alpha = image.GetRasterBand(4).ReadAsArray()
+            alphaband = image.GetRasterBand(4)
+            janelas = BlocosRaster(image)
+            Percent = 100.0/(len(janelas)*(n_bands-1))
+            current = 0
 
             for k in range(n_bands-1):
-                band = image.GetRasterBand(k+1).ReadAsArray()
-                # Defining cell 0 to 1 value
-                if band.min() == 0:
-                    band = (band == 0)*1 + band
-                # Defining null cells
-                band = ((alpha != 0)*band).astype('byte')
+                inband = image.GetRasterBand(k+1)
+                # Defining cell 0 to 1 value (if the band minimum is 0)
+                zero_para_um = inband.ComputeRasterMinMax(False)[0] == 0
                 outband = Driver.GetRasterBand(k+1)
                 feedback.pushInfo(self.tr('Writing the band {}...'.format(k+1), 'Escrevendo a banda {}...'.format(k+1)))
-                outband.WriteArray(band) # write band to the raster
+                for xoff, yoff, xsize, ysize in janelas:
+                    band = inband.ReadAsArray(xoff, yoff, xsize, ysize)
+                    alpha = alphaband.ReadAsArray(xoff, yoff, xsize, ysize)
+                    if zero_para_um:
+                        band = (band == 0)*1 + band
+                    # Defining null cells
+                    band = ((alpha != 0)*band).astype('byte')
+                    outband.WriteArray(band, xoff, yoff) # write block to the raster
+                    if feedback.isCanceled():
+                        break
+                    current += 1
+                    feedback.setProgress(int(current * Percent))
                 if definirNulo:
                     Pixel_Nulo = 0
                     outband.SetNoDataValue(Pixel_Nulo)
@@ -52,7 +52,7 @@ import numpy as np
 from pyproj.crs import CRS
 from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import Interpolar
+from lftools.geocapt.dip import InterpolarArray, BlocosRaster
 from lftools.geocapt.adjust import AjustVertical, ValidacaoGCP
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -158,7 +158,9 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         )
 
         tipos = [self.tr('Constant','Constante'),
-                  self.tr('Plane','Plano')
+                  self.tr('Plane','Plano'),
+                  self.tr('Bilinear surface','Superfície bilinear'),
+                  self.tr('Quadratic surface','Superfície quadrática')
                ]
 
         self.addParameter(
@@ -319,7 +321,6 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         n_bands = image.RasterCount
         if n_bands != 1:
             raise QgsProcessingException(self.tr('The DEM raster layer must have only one band!', 'A camada raster do MDE deve ter apenas uma banda!'))
-        banda = image.GetRasterBand(1).ReadAsArray()
         GDT = image.GetRasterBand(1).DataType
         valor_nulo = image.GetRasterBand(1).GetNoDataValue()
         if not valor_nulo:
@@ -327,8 +328,6 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         origem = (ulx, uly)
         xres = abs(xres)
         yres = abs(yres)
-        # Fechar Raster
-        image = None # Close image
 
         ## Validar dados de entrada
         # Verificar se o Raster e os Vetores tem o mesmo SRC
@@ -346,14 +345,22 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
             X = coord.x()
             Y = coord.y()
             Z = feat[Z_id]
-            Zf = Interpolar(X, Y,
-                            banda,
-                            origem,
-                            xres,
-                            yres,
-                            reamostragem,
-                            valor_nulo)
+            # Ler apenas a vizinhança do ponto (com margem para a bicúbica)
+            lin_ini = min(max(floor((origem[1] - Y)/yres - 0.5) - 2, 0), rows)
+            col_ini = min(max(floor((X - origem[0])/xres - 0.5) - 2, 0), cols)
+            janela = image.GetRasterBand(1).ReadAsArray(col_ini, lin_ini, min(6, cols - col_ini), min(6, rows - lin_ini))
+            if janela is None:
+                janela = np.zeros((0, 0))
+            Zf = InterpolarArray(np.array([X]), np.array([Y]),
+                                 janela,
+                                 origem,
+                                 xres,
+                                 yres,
+                                 reamostragem,
+                                 valor_nulo,
+                                 (lin_ini, col_ini))[0]
             lista += [[(X,Y,Z),Zf]]
+        ValidacaoGCP(lista, metodo)
 
         # Ajustamento
         feedback.pushInfo(self.tr('Calculating adjustment parameters...', 'Calculando parâmetros de ajustamento...'))
@@ -365,35 +372,25 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         Driver.SetProjection(prj)
         outband = Driver.GetRasterBand(1)
 
-        # Fazer correção do Raster
+        # Fazer correção do Raster por blocos (somente pixels com valor)
         feedback.pushInfo(self.tr("Adjusting the DEM...", 'Ajustando o MDE...'))
-        if metodo == 0:
-            k = CoordTransf(0,0)
-            banda_nova = (banda + k)*(banda != valor_nulo) + valor_nulo*(banda == valor_nulo)
-            # Salvar banda
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(1), 'Escrevendo Banda {}...'.format(1)))
-            outband.WriteArray(banda_nova)
-            outband.SetNoDataValue(valor_nulo)
-        elif metodo == 1:
-            Percent = 100.0/rows
-            current = 0
-            banda_nova = banda
-            for lin in range(rows):
-                for col in range(cols):
-                    if banda[lin][col] != valor_nulo:
-                        X = origem[0] + xres*(col + 0.5)
-                        Y = origem[1] - yres*(lin + 0.5)
-                        dz = CoordTransf(X, Y)
-                        banda_nova[lin][col] = banda[lin][col] + dz
-                if feedback.isCanceled():
-                    break
-                current += 1
-                feedback.setProgress(int(current * Percent))
-            # Salvar banda
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(1), 'Escrevendo Banda {}...'.format(1)))
-            outband.WriteArray(banda_nova)
-            outband.SetNoDataValue(valor_nulo)
+        outband.SetNoDataValue(valor_nulo)
+        janelas = BlocosRaster(image)
+        Percent = 100.0/len(janelas)
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            banda = image.GetRasterBand(1).ReadAsArray(xoff, yoff, xsize, ysize)
+            # Coordenadas dos centros dos pixels do bloco (linha e coluna)
+            X = origem[0] + xres*(np.arange(xoff, xoff + xsize) + 0.5)
+            Y = origem[1] - yres*(np.arange(yoff, yoff + ysize) + 0.5)
+            dz = CoordTransf(X[np.newaxis,:], Y[:,np.newaxis])
+            banda_nova = np.where(banda != valor_nulo, banda + dz, banda)
+            outband.WriteArray(banda_nova, xoff, yoff)
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((index+1) * Percent))
 
+        # Fechar Raster
+        image = None # Close image
         del banda_nova, banda
         Driver.FlushCache()   # Escrever no disco
         Driver = None   # Salvar e fechar
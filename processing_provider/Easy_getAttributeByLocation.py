@@ -202,37 +202,45 @@ Os campos de origem e de destino devem ser indicadas para preenchimento dos atri
                 coordinateTransformer.setDestinationCrs(edif.crs())
                 coordinateTransformer.setSourceCrs(lotes.crs())
 
-        produto = edif.featureCount()*lotes.featureCount()
-        total = 100.0 /produto if produto else 0
-        cont = 0
+        # Camada alvo (polígonos que contêm os centroides) em memória com índice espacial
         if topologia == 0:
-            for feat1 in edif.getFeatures():
-                centroide = feat1.geometry().centroid()
-                if not mesmoSRC:
-                    centroide = reprojectPoints(centroide, coordinateTransformer)
-                for feat2 in lotes.getFeatures():
-                    if centroide.intersects(feat2.geometry()):
-                        valor = feat2[att]
-                        edif.changeAttributeValue(feat1.id(), columnIndex, valor)
-                        break
-                    cont += 1
-                    if feedback.isCanceled():
-                        break
-                    feedback.setProgress(int(cont * total))
-        elif topologia == 1:
-            for feat1 in lotes.getFeatures():
-                centroide = feat1.geometry().centroid()
-                if not mesmoSRC:
-                    centroide = reprojectPoints(centroide, coordinateTransformer)
-                valor = feat1[att]
-                for feat2 in edif.getFeatures():
-                    if centroide.intersects(feat2.geometry()):
-                        edif.changeAttributeValue(feat2.id(), columnIndex, valor)
-                        break
-                    cont += 1
-                    if feedback.isCanceled():
-                        break
-                    feedback.setProgress(int(cont * total))
+            origem, alvo = edif, lotes
+        else:
+            origem, alvo = lotes, edif
+        feedback.pushInfo(self.tr('Creating spatial index...', 'Criando índice espacial...'))
+        indice = QgsSpatialIndex()
+        geometrias = {}
+        valores = {}
+        for feat in alvo.getFeatures():
+            geom = feat.geometry()
+            indice.addFeature(feat.id(), geom.boundingBox())
+            geometrias[feat.id()] = geom
+            if topologia == 0:
+                valores[feat.id()] = feat[att]
+
+        # Centroides da camada de origem consultados pelo índice
+        novos_valores = {}
+        total = 100.0 /origem.featureCount() if origem.featureCount() else 0
+        for cont, feat1 in enumerate(origem.getFeatures()):
+            centroide = feat1.geometry().centroid()
+            if not mesmoSRC:
+                centroide = reprojectPoints(centroide, coordinateTransformer)
+            for fid in sorted(indice.intersects(centroide.boundingBox())):
+                if centroide.intersects(geometrias[fid]):
+                    if topologia == 0:
+                        novos_valores[feat1.id()] = valores[fid]
+                    else:
+                        novos_valores[fid] = feat1[att]
+                    break
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((cont+1) * total))
+
+        # Gravar os atributos em um único comando de edição
+        edif.beginEditCommand(self.tr('Get attribute by location', 'Pegar atributo pela localização'))
+        for fid in novos_valores:
+            edif.changeAttributeValue(fid, columnIndex, novos_valores[fid])
+        edif.endEditCommand()
 
         salvar = self.parameterAsBool(
             parameters,
@@ -46,8 +46,8 @@ from qgis.core import (QgsProcessing,
 
 from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.cartography import raioMedioGauss
+from lftools.geocapt.gnss import LerNMEA, DataHora
 import numpy as np
-import datetime
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -198,50 +198,12 @@ Modos:
         if not crs.isGeographic():
             raise QgsProcessingException(self.tr('Choose a geographic CRS!', 'Escolha um SRC geográfico!'))
 
-        arq = open(caminho, encoding='utf-8')
-
         tipo = self.parameterAsEnum(
             parameters,
             self.TYPE,
             context
         )
 
-        lista = []
-        PDOP, HDOP, VDOP = -1, -1, -1
-
-        for line in arq.readlines():
-            try:
-                if line[3:6] == 'GSA': # GPS DOP and active satellites
-                    partes = line.split(',')
-                    PDOP = float(partes[-4])
-                    HDOP = float(partes[-3])
-                    VDOP = float(partes[-2])
-                if line[3:6] == 'GGA': # global position system fix data
-                    partes = line.split(',')
-                    hora = int(partes[1][0:2])
-                    min = int(partes[1][2:4])
-                    seg = float(partes[1][4:10])
-                    lat = (-1 if partes[3] == 'S' else 1)*( float(partes[2][0:2]) + float(partes[2][2:-1])/60)
-                    lon = (-1 if partes[5] == 'W' else 1)*( float(partes[4][0:3]) + float(partes[4][3:-1])/60)
-                    quality = int(partes[6])
-                    num_sat = int(partes[7])
-                    HDOP = float(partes[8])
-                    H = float(partes[9]) - aa
-                    N = float(partes[11])
-                    h = N + H
-                    lista += [[lat, lon, h, H, N, HDOP, VDOP, PDOP, hora, min, seg, quality, num_sat]]
-
-                if line[3:6] == 'ZDA': # Time & Date – UTC, Day, Month, Year and Local Time Zone
-                    partes = line.split(',')
-                    dia = int(partes[2])
-                    mes = int(partes[3])
-                    ano = int(partes[4])
-            except:
-                pass
-
-        arq.close()
-
-        valores = np.array(lista)
         # Campos
         if tipo == 0:
             itens  = {"lat": QVariant.Double,
@@ -277,68 +239,68 @@ Modos:
         if sink is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
 
-        if tipo == 0:
-            feat = QgsFeature()
-            for pnt in lista:
-                feat.setGeometry(QgsPoint(pnt[1],pnt[0], pnt[2]))
-                data_hora = unicode(datetime.datetime(ano, mes, dia, pnt[-5], pnt[-4], int(pnt[-3])))
-                feat.setAttributes(pnt[0:5] + [data_hora] + pnt[5:8] + pnt[-2:]  ) # lat, lon, h, H, N, HDOP, VDOP, PDOP, hora, min, seg, quality, num_sat
-                sink.addFeature(feat, QgsFeatureSink.FastInsert)
-
-        elif tipo == 1:
-            valores = valores[valores[:,-2]==4] # eliminando observações de baixa qualidade
-            if len(valores) == 0:
-                raise QgsProcessingException(self.tr('There is no observation with RTK correction.', 'Não existe observação com correção RTK.'))
-            # calculo de valores médios
-            lat = valores[:,0].mean()
-            s_lat = valores[:,0].std()
-            lon = valores[:,1].mean()
-            s_lon = valores[:,1].std()
-            h = valores[:,2].mean()
-            s_h = valores[:,2].std()
-            H = valores[:,3].mean()
-            N = valores[:,4].mean()
-            data_hora_ini = unicode(datetime.datetime(ano, mes, dia, int(valores[0, -5]), int(valores[0, -4]), int(valores[0, -3])))
-            data_hora_fim = unicode(datetime.datetime(ano, mes, dia, int(valores[-1, -5]), int(valores[-1, -4]), int(valores[-1, -3])))
-            # Raio Médio de Gauss
-            R = raioMedioGauss(lat, int(self.tr('4326','4674')))
-            sigma_x = (R+h)*np.radians(s_lon)
-            sigma_y = (R+h)*np.radians(s_lat)
-
-            feat = QgsFeature()
-            feat.setGeometry(QgsPoint(lon, lat, h))
-            feat.setAttributes([float(lat),
-                                float(lon),
-                                float(h),
-                                float(H),
-                                float(N),
-                                data_hora_ini,
-                                data_hora_fim,
-                                float(sigma_x),
-                                float(sigma_y),
-                                float(s_h),
-                                len(valores)])
-            sink.addFeature(feat, QgsFeatureSink.FastInsert)
+        # Leitura em lotes de épocas
+        feedback.pushInfo(self.tr('Reading NMEA file...', 'Lendo arquivo NMEA...'))
+        cont = 0
+        rejeitadas = 0
+        feat = QgsFeature()
+        if tipo != 0:
+            # Média e desvio-padrão acumulados por lote
+            n = 0
+            media = np.zeros(5) # lat, lon, h, H, N
+            M2 = np.zeros(5)
+            data_hora_ini = None
+        for lote, fracao, rejeitadas in LerNMEA(caminho, aa):
+            if tipo == 0:
+                datahora = DataHora(lote['data'], lote['sod']).tolist()
+                colunas = [lote[campo].tolist() for campo in ('lat', 'lon', 'h', 'H', 'N', 'HDOP', 'VDOP', 'PDOP', 'quality', 'num_sat')]
+                feicoes = []
+                for k, (lat, lon, h, H, N, HDOP, VDOP, PDOP, quality, num_sat) in enumerate(zip(*colunas)):
+                    feat = QgsFeature()
+                    feat.setGeometry(QgsPoint(lon, lat, h))
+                    feat.setAttributes([lat, lon, h, H, N, str(datahora[k]), HDOP, VDOP, PDOP, quality, num_sat])
+                    feicoes += [feat]
+                sink.addFeatures(feicoes, QgsFeatureSink.FastInsert)
+            else:
+                if tipo == 1:
+                    lote = lote[lote['quality'] == 4] # eliminando observações de baixa qualidade
+                if len(lote):
+                    valores = np.column_stack([lote[campo] for campo in ('lat', 'lon', 'h', 'H', 'N')])
+                    n_lote = len(valores)
+                    media_lote = valores.mean(axis=0)
+                    delta = media_lote - media
+                    M2 += ((valores - media_lote)**2).sum(axis=0) + delta**2*n*n_lote/(n + n_lote)
+                    media += delta*n_lote/(n + n_lote)
+                    n += n_lote
+                    datahora = DataHora(lote['data'][[0,-1]], lote['sod'][[0,-1]])
+                    if data_hora_ini is None:
+                        data_hora_ini = str(datahora[0])
+                    data_hora_fim = str(datahora[-1])
+            cont += len(lote)
+            feedback.setProgress(int(fracao*100))
+            if feedback.isCanceled():
+                break
+        if rejeitadas:
+            feedback.pushInfo(self.tr('{} sentences rejected by checksum.'.format(rejeitadas), '{} sentenças rejeitadas pelo checksum.'.format(rejeitadas)))
 
-        elif tipo == 2:
+        if tipo == 0:
+            if cont == 0:
+                raise QgsProcessingException(self.tr('No dated GGA sentence found in the file!', 'Nenhuma sentença GGA com data encontrada no arquivo!'))
+        else:
+            if n == 0:
+                if tipo == 1:
+                    raise QgsProcessingException(self.tr('There is no observation with RTK correction.', 'Não existe observação com correção RTK.'))
+                else:
+                    raise QgsProcessingException(self.tr('No dated GGA sentence found in the file!', 'Nenhuma sentença GGA com data encontrada no arquivo!'))
             # calculo de valores médios
-            lat = valores[:,0].mean()
-            s_lat = valores[:,0].std()
-            lon = valores[:,1].mean()
-            s_lon = valores[:,1].std()
-            h = valores[:,2].mean()
-            s_h = valores[:,2].std()
-            H = valores[:,3].mean()
-            N = valores[:,4].mean()
-            data_hora_ini = unicode(datetime.datetime(ano, mes, dia, int(valores[0, -5]), int(valores[0, -4]), int(valores[0, -3])))
-            data_hora_fim = unicode(datetime.datetime(ano, mes, dia, int(valores[-1, -5]), int(valores[-1, -4]), int(valores[-1, -3])))
+            lat, lon, h, H, N = media
+            s_lat, s_lon, s_h = np.sqrt(M2[:3]/n)
             # Raio Médio de Gauss
             R = raioMedioGauss(lat, int(self.tr('4326','4674')))
             sigma_x = (R+h)*np.radians(s_lon)
             sigma_y = (R+h)*np.radians(s_lat)
 
-            feat = QgsFeature()
-            feat.setGeometry(QgsPoint(lon, lat, h))
+            feat.setGeometry(QgsPoint(float(lon), float(lat), float(h)))
             feat.setAttributes([float(lat),
                                 float(lon),
                                 float(h),
@@ -349,7 +311,7 @@ Modos:
                                 float(sigma_x),
                                 float(sigma_y),
                                 float(s_h),
-                                len(valores)])
+                                int(n)])
             sink.addFeature(feat, QgsFeatureSink.FastInsert)
 
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
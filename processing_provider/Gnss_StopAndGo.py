@@ -47,9 +47,9 @@ from qgis.core import (QgsProcessing,
 
 from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.cartography import raioMedioGauss
+from lftools.geocapt.estatistica import FeicaoCentral
 import numpy as np
 from pyproj.crs import CRS
-from datetime import datetime
 import codecs
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -231,90 +231,66 @@ Dados de entrada:
         theta = dist_max/R
         dist_max = np.degrees(theta) # Radianos para graus
 
-        x, y = [],[]
-        pontos = []
-        for feat in layer.getFeatures():
-            x += [feat.geometry().asPoint().x()]
-            y += [feat.geometry().asPoint().y()]
-
-        w = np.ones(len(x))
-
-        def CentralFeature(x, y):
-            dist_soma = 1e15
-            indice = -1
-            for i in range(len(x)):
-                x1 = x[i]
-                y1 = y[i]
-                soma = 0
-                for j in range(len(y)):
-                    x2 = x[j]
-                    y2 = y[j]
-                    soma += np.sqrt((x1 - x2)**2 + (y1 - y2)**2)
-                if soma < dist_soma:
-                    dist_soma = soma
-                    indice = i
-            return x[indice], y[indice]
-
-        # Saber se o ponto está parado em um ponto
+        # Ler coordenadas, data-hora e ids das feições uma única vez
+        feedback.pushInfo(self.tr('Reading points...', 'Lendo pontos...'))
         X, Y = [],[]
         datahora = []
+        ids = []
+        campo_datahora = layer.fields().indexFromName(self.tr('datetime', 'datahora'))
+        if campo_datahora < 0:
+            raise QgsProcessingException(self.tr('Check the input layer!', 'Verifique a camada de entrada!'))
         for feat in layer.getFeatures():
-            X += [feat.geometry().asPoint().x()]
-            Y += [feat.geometry().asPoint().y()]
-            datahora += [feat[self.tr('datetime', 'datahora')]]
-
-        cont = 1
+            geom = feat.geometry()
+            if geom.isMultipart():
+                pnt = geom.asMultiPoint()[0]
+            else:
+                pnt = geom.asPoint()
+            X += [pnt.x()]
+            Y += [pnt.y()]
+            datahora += [feat[campo_datahora]]
+            ids += [feat.id()]
+            if feedback.isCanceled():
+                break
         try:
-            t_ini = datahora[0]
+            if not datahora:
+                raise ValueError
+            X, Y = np.array(X), np.array(Y)
+            tempo = np.array(datahora, dtype='datetime64[s]') # "%Y-%m-%d %H:%M:%S"
         except:
             raise QgsProcessingException(self.tr('Check the input layer!', 'Verifique a camada de entrada!'))
-        grupos = {}
-        x, y = [],[]
-        for i in range(len(X)-1):
-            x1 = X[i]
-            y1 = Y[i]
-            x2 = X[i+1]
-            y2 = Y[i+1]
-            t = datahora[i+1]
-            if np.sqrt((x1 - x2)**2 + (y1 - y2)**2) < dist_max:
-                x += [x1]
-                y += [y1]
-            else:
-                intervalo = datetime.strptime(t, "%Y-%m-%d %H:%M:%S") - datetime.strptime(t_ini, "%Y-%m-%d %H:%M:%S")
-                intervalo = intervalo.total_seconds() # intervalo em segundos
-                if  intervalo > tempo_min: # se ficou parado pelo tempo mínimo
-                    grupos[cont] = {'x': x, 'y': y, 't_ini': t_ini, 't_fim': t}
-                    cont += 1
-                t_ini = t
-                x, y = [],[]
-
-        # Última leva
-        intervalo = datetime.strptime(t, "%Y-%m-%d %H:%M:%S") - datetime.strptime(t_ini, "%Y-%m-%d %H:%M:%S")
-        intervalo = intervalo.total_seconds()
-        if  intervalo > tempo_min:
-            grupos[cont] = {'x': x, 'y': y, 't_ini': t_ini, 't_fim': t}
+
+        # Saber se o ponto está parado em um ponto
+        # Quebras: épocas i cujo deslocamento até a época i+1 é maior ou igual à distância máxima
+        parado = np.hypot(np.diff(X), np.diff(Y)) < dist_max
+        quebras = np.nonzero(~parado)[0]
+        # Trechos entre quebras: pontos [ini, fim), início em t[ini] e término em t[fim_t]
+        ini = np.concatenate(([0], quebras + 1))
+        fim = np.concatenate((quebras, [len(X) - 1]))
+        fim_t = np.concatenate((quebras + 1, [len(X) - 1]))
+        intervalo = (tempo[fim_t] - tempo[ini]).astype(float) # intervalo em segundos
+        # Se ficou parado pelo tempo mínimo
+        trechos = np.nonzero((intervalo > tempo_min) & (fim > ini))[0]
+        feedback.pushInfo(self.tr('Number of stops: {}'.format(len(trechos)), 'Número de paradas: {}'.format(len(trechos))))
 
         # Calcular feição central
         feedback.pushInfo(self.tr('Calculating central features...', 'Calculando feições centrais...'))
-        for grupo in grupos:
-            x = grupos[grupo]['x']
-            y = grupos[grupo]['y']
-            central_X, central_Y = CentralFeature(x, y)
-            # Pegar atributos do ponto central
-            for feat in layer.getFeatures():
-                geom = feat.geometry()
-                if geom.isMultipart():
-                    pnt = geom.asMultiPoint()[0]
-                else:
-                    pnt = geom.asPoint()
-                if pnt.x() == central_X and pnt.y() == central_Y:
-                    att = feat.attributes()
-                    break
-            pnt = QgsGeometry.fromPointXY(QgsPointXY(float(central_X), float(central_Y)))
-            att += [grupos[grupo]['t_ini'], grupos[grupo]['t_fim'], len(x), str(grupo)]
-            feat.setGeometry(pnt)
-            feat.setAttributes(att)
-            sink.addFeature(feat, QgsFeatureSink.FastInsert)
+        centrais = []
+        for trecho in trechos:
+            indice = ini[trecho] + FeicaoCentral(X[ini[trecho]:fim[trecho]], Y[ini[trecho]:fim[trecho]])
+            centrais += [indice]
+            if feedback.isCanceled():
+                break
+        # Pegar atributos dos pontos centrais
+        atributos = {}
+        for feat in layer.getFeatures(QgsFeatureRequest().setFilterFids([ids[indice] for indice in centrais])):
+            atributos[feat.id()] = feat.attributes()
+        feature = QgsFeature(Fields)
+        for grupo, (trecho, indice) in enumerate(zip(trechos, centrais)):
+            pnt = QgsGeometry.fromPointXY(QgsPointXY(float(X[indice]), float(Y[indice])))
+            att = atributos[ids[indice]] + [datahora[ini[trecho]], datahora[fim_t[trecho]], int(fim[trecho] - ini[trecho]), str(grupo+1)]
+            feature.setGeometry(pnt)
+            feature.setAttributes(att)
+            sink.addFeature(feature, QgsFeatureSink.FastInsert)
             if feedback.isCanceled():
                 break
 
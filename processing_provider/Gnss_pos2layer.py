@@ -48,9 +48,8 @@ from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.cartography import raioMedioGauss
 from lftools.geocapt.vemos import vemos
 from lftools.geocapt.topogeo import dist2degrees
+from lftools.geocapt.gnss import LerPOS
 import numpy as np
-from datetime import datetime
-import codecs
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -247,117 +246,67 @@ Tipos:
         if sink is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
 
-        arq = codecs.open(caminho, 'r', encoding='utf-8', errors='ignore')
-
         saida = self.parameterAsEnum(
             parameters,
             self.TYPE,
             context
         )
 
-        # IBGE ou RTKLIB
-        for linha in arq.readlines():
-            break
-        arq.close()
-        if linha[0] == '%':
-            tipo = 'rtklib'
+        # IBGE ou RTKLIB - leitura em uma passada
+        tipo, pos = LerPOS(caminho)
+        if tipo == 'rtklib':
             feedback.pushInfo(self.tr("It's a RTKLIB file!", 'É um arquivo do RTKLIB!'))
-        elif linha[0] == '-':
-            tipo = 'ibge'
+        elif tipo == 'ibge':
             feedback.pushInfo(self.tr("It's a IBGE-PPP file!", 'É um arquivo do PPP-IBGE!'))
         else:
             raise QgsProcessingException(self.tr('Unrecognized POS file format!', 'Formato de arquivo POS não reconhecido!'))
-
-        arq = codecs.open(caminho, 'r', encoding='utf-8', errors='ignore')
-        lista = []
-        dic = {}
-        if tipo == 'rtklib':
-            for linha in arq.readlines():
-                if linha[0] != '%':
-                    while '  ' in linha:
-                        linha = linha.replace('  ', ' ')
-                    lista += [linha.split(' ')]
-            arq.close()
-            for k,pnt in enumerate(lista):
-                lat = float(pnt[2])
-                lon = float(pnt[3])
-                h = float(pnt[4])
-                ano, mes, dia = pnt[0].split('/')
-                hora, minuto, segundo = pnt[1].split(':')
-                datahora = unicode(datetime(int(ano), int(mes), int(dia), int(hora), int(minuto), int(float(segundo))))
-                quality = int(pnt[5])
-                nsat = int(pnt[6])
-                slat = float(pnt[7])
-                slon = float(pnt[8])
-                sh = float(pnt[9])
-                dic[k+1] = {'lat': lat, 'lon':lon, 'h': h, 'datahora': datahora, 'quality': quality, 'nsat': nsat,
-                          'slat': slat, 'slon': slon, 'sh':sh   }
-        elif tipo == 'ibge':
-            for linha in arq.readlines():
-                if linha[0:3] == 'FWD':
-                    while '  ' in linha:
-                        linha = linha.replace('  ', ' ')
-                    lista += [linha.split(' ')]
-            arq.close()
-            for k,pnt in enumerate(lista):
-                lat = float(pnt[20]) + float(pnt[20])/abs(float(pnt[20]))*(float(pnt[21])/60. + float(pnt[22])/3600)
-                lon = float(pnt[23]) + float(pnt[23])/abs(float(pnt[23]))*(float(pnt[24])/60. + float(pnt[25])/3600)
-                h = float(pnt[26])
-                ano, mes, dia = pnt[4].split('-')
-                hora, minuto, segundo = pnt[5].split(':')
-                datahora = unicode(datetime(int(ano), int(mes), int(dia), int(hora), int(minuto), int(float(segundo))))
-                quality = 6
-                nsat = int(pnt[6])
-                slat = float(pnt[15])
-                slon = float(pnt[16])
-                sh = float(pnt[17])
-                dic[k+1] = {'lat': lat, 'lon':lon, 'h': h, 'datahora': datahora, 'quality': quality, 'nsat': nsat,
-                          'slat': slat, 'slon': slon, 'sh':sh   }
-        # Salvando os resultados
-        tam = len(lista)
+        n_epocas = len(pos)
+        if saida == 1: # apenas a última época
+            pos = pos[-1:]
+
+        lat = pos['lat']
+        lon = pos['lon']
+        h = pos['h'] - aa
+        datahora = np.char.replace(np.datetime_as_string(pos['datahora'], unit='s'), 'T', ' ')
+
+        if model_vel > 0:
+            # Anos (dias inteiros) desde a época de referência
+            dias = (pos['datahora'] - np.datetime64('2000-04-24T12:00:00')).astype('timedelta64[s]').astype(np.int64) // 86400
+            anos = dias/365.25
+            vlat, vlon = vemos(lat, lon, ['vemos2009','vemos2017'][model_vel-1])
+            if np.isnan(vlat).any():
+                raise QgsProcessingException(self.tr('Coordinates outside the coverage of the velocity model!', 'Coordenadas fora da cobertura do modelo de velocidades!'))
+            dLat = dist2degrees(vlat*anos, lat, 4674)
+            dLon = dist2degrees(vlon*anos, lat, 4674)
+            lat = lat - dLat
+            lon = lon - dLon
+
+        # Salvando os resultados em lotes
+        tam = len(pos)
         total = 100./tam if tam>0 else 0
-        for k, item in enumerate(dic):
-            lat = dic[item]['lat']
-            lon = dic[item]['lon']
-            h = dic[item]['h'] - aa
-            datahora = dic[item]['datahora']
-            quality = dic[item]['quality']
-            nsat = dic[item]['nsat']
-            slat = dic[item]['slat']
-            slon = dic[item]['slon']
-            sh = dic[item]['sh']
+        feicoes = []
+        for k in range(tam):
             feat = QgsFeature(Fields)
-            feat['ord'] = item
-            feat['lat'] = lat
-            feat['lon'] = lon
-            feat['h'] = h
-            feat[self.tr("datetime","datahora")] = datahora
-            feat['sigma_x'] = slon
-            feat['sigma_y'] = slat
-            feat['sigma_z'] = sh
-            feat['num_sat'] = nsat
-            feat['quality'] = quality
-
-            if model_vel > 0:
-                vlat, vlon = vemos(lat, lon, ['vemos2009','vemos2017'][model_vel-1])
-                delta_tempo = datetime.strptime(datahora, "%Y-%m-%d %H:%M:%S") - datetime.strptime('2000-04-24 12:00:00', "%Y-%m-%d %H:%M:%S")
-                anos = delta_tempo.days/365.25
-                dLat = dist2degrees(vlat*anos, lat, 4674)
-                dLon = dist2degrees(vlon*anos, lat, 4674)
-                lat -= dLat
-                lon -= dLon
-
-            if saida == 0:
-                feat.setGeometry(QgsPoint(lon, lat, h))
-                sink.addFeature(feat, QgsFeatureSink.FastInsert)
-            if feedback.isCanceled():
-                break
-            feedback.setProgress(int((k+1) * total))
-
-
-        if saida == 1:
-            feat.setGeometry(QgsPoint(lon, lat, h))
-            sink.addFeature(feat, QgsFeatureSink.FastInsert)
+            feat.setAttributes([int(k+1) if saida == 0 else n_epocas,
+                                float(pos['lat'][k]),
+                                float(pos['lon'][k]),
+                                float(h[k]),
+                                str(datahora[k]),
+                                float(pos['slon'][k]),
+                                float(pos['slat'][k]),
+                                float(pos['sh'][k]),
+                                int(pos['nsat'][k]),
+                                int(pos['quality'][k])])
+            feat.setGeometry(QgsPoint(float(lon[k]), float(lat[k]), float(h[k])))
+            feicoes += [feat]
+            if len(feicoes) == 10000:
+                sink.addFeatures(feicoes, QgsFeatureSink.FastInsert)
+                feicoes = []
+                if feedback.isCanceled():
+                    break
+                feedback.setProgress(int((k+1) * total))
+        if feicoes:
+            sink.addFeatures(feicoes, QgsFeatureSink.FastInsert)
 
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
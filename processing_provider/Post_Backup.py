@@ -22,6 +22,7 @@ from qgis.core import (QgsProcessing,
                        QgsProcessingParameterString,
                        QgsProcessingParameterBoolean,
                        QgsProcessingParameterEnum,
+                       QgsProcessingParameterNumber,
                        QgsProcessingParameterRasterLayer,
                        QgsProcessingParameterFile,
                        QgsProcessingParameterFileDestination,
@@ -30,6 +31,7 @@ from qgis.core import (QgsProcessing,
                        QgsCoordinateReferenceSystem)
 
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.comandos import PastaPostgreSQL, ProgramaPostgreSQL, ExecutarComando, TamanhoCaminho, TextoBytes
 import os
 from datetime import datetime
 from qgis.PyQt.QtGui import QIcon
@@ -72,8 +74,8 @@ class Backup(QgsProcessingAlgorithm):
     def icon(self):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/postgis.png'))
 
-    txt_en = 'This tool creates a <b>backup</b> file in the "<b>.sql</b>" format for a PostgreSQL server database.'
-    txt_pt = 'Esta ferramenta gera um arquivo de <b>backup</b> no formato "<b>.sql</b>" para um banco de dados de um servidor PostgreSQL.'
+    txt_en = 'This tool creates a <b>backup</b> file in the "<b>.sql</b>" format for a PostgreSQL server database. For large databases, the <b>directory</b> format dumps several tables at the same time (parallel jobs) with compression, and can be restored in parallel.'
+    txt_pt = 'Esta ferramenta gera um arquivo de <b>backup</b> no formato "<b>.sql</b>" para um banco de dados de um servidor PostgreSQL. Para bancos grandes, o formato <b>diretório</b> exporta várias tabelas ao mesmo tempo (processos paralelos) com compressão, podendo ser restaurado em paralelo.'
     figure = 'images/tutorial/post_backup.jpg'
 
     def shortHelpString(self):
@@ -95,6 +97,9 @@ class Backup(QgsProcessingAlgorithm):
     USER = 'USER'
     PORT = 'PORT'
     VERSION = 'VERSION'
+    FORMAT = 'FORMAT'
+    JOBS = 'JOBS'
+    COMPRESSION = 'COMPRESSION'
     versions = ['9.5', '9.6', '10', '11', '12', '13', '14']
 
     def initAlgorithm(self, config=None):
@@ -140,6 +145,39 @@ class Backup(QgsProcessingAlgorithm):
             )
         )
 
+        formatos = [self.tr('Plain SQL (.sql)', 'SQL simples (.sql)'),
+                    self.tr('Directory (parallel)', 'Diretório (paralelo)')]
+
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.FORMAT,
+                self.tr('Backup format', 'Formato do backup'),
+				options = formatos,
+                defaultValue= 0
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.JOBS,
+                self.tr('Number of parallel jobs (directory format)', 'Número de processos paralelos (formato diretório)'),
+                type =0, #Double = 1 and Integer = 0
+                defaultValue = 4,
+                minValue = 1
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.COMPRESSION,
+                self.tr('Compression level (directory format)', 'Nível de compressão (formato diretório)'),
+                type =0, #Double = 1 and Integer = 0
+                defaultValue = 6,
+                minValue = 0,
+                maxValue = 9
+            )
+        )
+
     def processAlgorithm(self, parameters, context, feedback):
 
         path = self.parameterAsFile(
@@ -177,35 +215,48 @@ class Backup(QgsProcessingAlgorithm):
             context
         )
 
-        # Procurando arquivo psql
-        win64 = 'C:/Program Files (x86)/PostgreSQL/'+version+'/bin'
-        win64d = 'D:/Program Files (x86)/PostgreSQL/'+version+'/bin'
-        win32 = 'C:/Program Files/PostgreSQL/'+version+'/bin'
-        win32d = 'D:/Program Files/PostgreSQL/'+version+'/bin'
-        mac = '/Library/PostgreSQL/'+version+'/bin/'
-        if os.path.isdir(win64):
-            os.chdir(win64)
-        elif os.path.isdir(win64d):
-            os.chdir(win64d)
-        elif os.path.isdir(win32):
-            os.chdir(win32)
-        elif os.path.isdir(win32d):
-            os.chdir(win32d)
-        elif os.path.isdir(mac):
-            os.chdir(mac)
-        else:
+        formato = self.parameterAsEnum(
+            parameters,
+            self.FORMAT,
+            context
+        )
+
+        n_processos = self.parameterAsInt(
+            parameters,
+            self.JOBS,
+            context
+        )
+
+        compressao = self.parameterAsInt(
+            parameters,
+            self.COMPRESSION,
+            context
+        )
+
+        # Procurando arquivo pg_dump
+        pasta = PastaPostgreSQL(version, 'pg_dump')
+        if pasta is None:
             raise QgsProcessingException(self.tr('Make sure your PostgreSQL version is correct!', 'Verifique se a versão do seu PostgreSQL está correta!'))
 
         # Realizando o Backup
-        file_path = os.path.join(path, DB + '.sql')
-        comando = 'pg_dump -Fp -C -h ' + host + ' -U ' + user + ' ' + DB + ' > "' + file_path + '"'
-        feedback.pushInfo('\n' + self.tr('Command: ','Comando: ') + comando)
+        if formato == 0: # SQL simples
+            file_path = os.path.join(path, DB + '.sql')
+            comando = [ProgramaPostgreSQL(pasta, 'pg_dump'), '-Fp', '-C', '-v', '-h', host, '-U', user, '-f', file_path, DB]
+            extensao = '.sql'
+        else: # Diretório, com processos paralelos
+            file_path = os.path.join(path, DB)
+            if os.path.exists(file_path):
+                raise QgsProcessingException(self.tr('The output folder {} already exists!', 'A pasta de saída {} já existe!').format(file_path))
+            comando = [ProgramaPostgreSQL(pasta, 'pg_dump'), '-Fd', '-j', str(n_processos), '-Z', str(compressao), '-C', '-v', '-h', host, '-U', user, '-f', file_path, DB]
+            extensao = ''
+        feedback.pushInfo('\n' + self.tr('Command: ','Comando: ') + ' '.join(comando))
         feedback.pushInfo('\n' + self.tr('Starting DB Backup process...', 'Iniciando processo de Backup do BD...'))
-        result = os.system(comando)
+        result = ExecutarComando(comando, feedback, monitorar = file_path)
 
         if result==0:
+            feedback.pushInfo(self.tr('Backup size: ', 'Tamanho do backup: ') + TextoBytes(TamanhoCaminho(file_path)))
             datahora = datetime.now().strftime("_%Y-%m-%d_%H-%M-%S")
-            os.rename(file_path, os.path.join(path, DB + datahora + '.sql'))
+            os.rename(file_path, os.path.join(path, DB + datahora + extensao))
             feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
             feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
         else:
@@ -22,6 +22,7 @@ from qgis.core import (QgsProcessing,
                        QgsProcessingParameterString,
                        QgsProcessingParameterBoolean,
                        QgsProcessingParameterEnum,
+                       QgsProcessingParameterNumber,
                        QgsProcessingParameterRasterLayer,
                        QgsProcessingParameterFile,
                        QgsProcessingParameterFileDestination,
@@ -30,6 +31,8 @@ from qgis.core import (QgsProcessing,
                        QgsCoordinateReferenceSystem)
 
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.comandos import PastaPostgreSQL, ProgramaPostgreSQL, ExecutarComando, ExecutarEncadeado
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 from pathlib import Path
 from qgis.PyQt.QtGui import QIcon
@@ -72,8 +75,8 @@ class ImportRaster(QgsProcessingAlgorithm):
     def icon(self):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/postgis.png'))
 
-    txt_en = '''This tool allows you to load a raster layer into a PostGIS database.'''
-    txt_pt = """Esta ferramenta permite carregar uma camada raster para dentro de um banco de dados PostGIS."""
+    txt_en = '''This tool allows you to load a raster layer into a PostGIS database. All rasters of a folder can also be loaded into the same table by parallel jobs, one transaction per file, with the index, constraints and overviews created once at the end.'''
+    txt_pt = """Esta ferramenta permite carregar uma camada raster para dentro de um banco de dados PostGIS. Também é possível carregar todos os rasters de uma pasta para a mesma tabela com processos paralelos, uma transação por arquivo, sendo o índice, as restrições e as pirâmides criados uma única vez ao final."""
     figure = 'images/tutorial/post_importraster.jpg'
 
     def shortHelpString(self):
@@ -89,6 +92,8 @@ class ImportRaster(QgsProcessingAlgorithm):
         return self.tr(self.txt_en, self.txt_pt) + footer
 
     RASTER = 'RASTER'
+    FOLDER = 'FOLDER'
+    WORKERS = 'WORKERS'
     DATABASE = 'DATABASE'
     SCHEMA = 'SCHEMA'
     TABLE = 'TABLE'
@@ -108,7 +113,17 @@ class ImportRaster(QgsProcessingAlgorithm):
             QgsProcessingParameterRasterLayer(
                 self.RASTER,
                 self.tr('Raster layer', 'Camada Raster'),
-                [QgsProcessing.TypeRaster]
+                [QgsProcessing.TypeRaster],
+                optional = True
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterFile(
+                self.FOLDER,
+                self.tr('or folder with rasters', 'ou pasta com rasters'),
+                behavior=QgsProcessingParameterFile.Folder,
+                optional = True
             )
         )
 
@@ -205,6 +220,16 @@ class ImportRaster(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.WORKERS,
+                self.tr('Number of parallel jobs (folder)', 'Número de processos paralelos (pasta)'),
+                type =0, #Double = 1 and Integer = 0
+                defaultValue = 4,
+                minValue = 1
+            )
+        )
+
 
 
     def processAlgorithm(self, parameters, context, feedback):
@@ -214,9 +239,21 @@ class ImportRaster(QgsProcessingAlgorithm):
             self.RASTER,
             context
         )
-        if raster is None:
+
+        pasta_rasters = self.parameterAsFile(
+            parameters,
+            self.FOLDER,
+            context
+        )
+        if raster is None and not pasta_rasters:
             raise QgsProcessingException(self.invalidSourceError(parameters, self.RASTER))
 
+        n_processos = self.parameterAsInt(
+            parameters,
+            self.WORKERS,
+            context
+        )
+
 
         database = self.parameterAsString(
             parameters,
@@ -300,6 +337,11 @@ class ImportRaster(QgsProcessingAlgorithm):
         else:
             ovr = ''
 
+        if pasta_rasters:
+            self.importarPasta(pasta_rasters, database, schema, table, host, port, user, version, tipo, namecol,
+                               tiling, ovr, n_processos, feedback)
+            return {}
+
         # Preparando parâmetros
         projection = raster.crs().authid().split(":")[1]
         projection = ' -s ' + projection + ' '
@@ -337,3 +379,88 @@ class ImportRaster(QgsProcessingAlgorithm):
                                       'Houve algum problema durante a execução do comando. Por favor, verifique os parâmetros de entrada.'))
 
         return {}
+
+
+    # Carregar todos os rasters de uma pasta para a mesma tabela
+    # Tabela criada com o primeiro arquivo, arquivos anexados (-a) em paralelo, um por transação,
+    # índice, restrições e pirâmides criados uma única vez ao final
+    def importarPasta(self, pasta_rasters, database, schema, table, host, port, user, version, tipo, namecol,
+                      tiling, ovr, n_processos, feedback):
+        formatos = ('.tif', '.tiff', '.jp2', '.img', '.ecw', '.vrt', '.asc', '.png', '.jpg', '.jpeg')
+        arquivos = [os.path.join(pasta_rasters, arq) for arq in sorted(os.listdir(pasta_rasters))
+                    if os.path.splitext(arq)[1].lower() in formatos]
+        if not arquivos:
+            raise QgsProcessingException(self.tr('No raster file was found in the folder!', 'Nenhum arquivo raster foi encontrado na pasta!'))
+        feedback.pushInfo(self.tr('Rasters found: {}', 'Rasters encontrados: {}').format(len(arquivos)))
+
+        pasta = PastaPostgreSQL(version, 'raster2pgsql')
+        if pasta is None:
+            raise QgsProcessingException(self.tr('Make sure your PostgreSQL version is correct!', 'Verifique se a versão do seu PostgreSQL está correta!'))
+        raster2pgsql = ProgramaPostgreSQL(pasta, 'raster2pgsql')
+        psql = [ProgramaPostgreSQL(pasta, 'psql'), '-q', '-v', 'ON_ERROR_STOP=1', '-U', user, '-d', database, '-h', host, '-p', port]
+        tabela = schema + '.' + table
+
+        # SRC do primeiro raster
+        srid = QgsRasterLayer(arquivos[0]).crs().authid().split(':')[-1]
+        opcoes = ['-s', srid] + tiling.split() + namecol.split()
+        fatores = [fator for fator in ovr.replace('-l', '').replace(' ', '').split(',') if fator.isdigit()]
+        piramides = ['{}.o_{}_{}'.format(schema, fator, table) for fator in fatores]
+
+        # Criando a tabela
+        if tipo.strip() != '-a':
+            if tipo.strip() == '-d':
+                for nome in piramides + [tabela]:
+                    ExecutarComando(psql + ['-c', 'DROP TABLE IF EXISTS {};'.format(nome)], feedback)
+            result, erros = ExecutarEncadeado([raster2pgsql, '-p'] + opcoes + [arquivos[0], tabela], psql, feedback)
+            if result != 0:
+                raise QgsProcessingException(erros)
+            if tipo.strip() == '-p':
+                feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
+                return
+        else:
+            # As restrições (extensão, alinhamento...) da tabela existente impediriam a inclusão de novos rasters
+            ExecutarComando(psql + ['-c', "SELECT DropRasterConstraints('{}'::name, '{}'::name, 'rast'::name);".format(schema, table)], feedback)
+
+        # Carregando os arquivos em paralelo
+        feedback.pushInfo('\n' + self.tr('Importing rasters into the database...', 'Importando rasters para o banco de dados...'))
+        total = 100.0/len(arquivos)
+        falhas = []
+        with ThreadPoolExecutor(max_workers = n_processos) as executor:
+            tarefas = {executor.submit(ExecutarEncadeado, [raster2pgsql, '-a'] + opcoes + [arq, tabela], psql, feedback): arq for arq in arquivos}
+            for cont, tarefa in enumerate(as_completed(tarefas)):
+                arq = tarefas[tarefa]
+                result, erros = tarefa.result()
+                if result == 0:
+                    feedback.pushInfo(os.path.basename(arq))
+                else:
+                    falhas += [arq]
+                    feedback.pushInfo('{}: {}'.format(os.path.basename(arq), erros))
+                feedback.setProgress(int((cont+1) * total))
+                if feedback.isCanceled():
+                    for t in tarefas:
+                        t.cancel()
+                    break
+        if feedback.isCanceled():
+            return
+
+        # Índice, restrições e pirâmides
+        feedback.pushInfo('\n' + self.tr('Creating index, constraints and overviews...', 'Criando índice, restrições e pirâmides...'))
+        # Em '-a' o índice já existe e as pirâmides antigas são refeitas com os novos rasters
+        comandos = ['CREATE INDEX IF NOT EXISTS {}_st_convexhull_idx ON {} USING gist (ST_ConvexHull(rast));'.format(table, tabela),
+                    "SELECT AddRasterConstraints('{}'::name, '{}'::name, 'rast'::name);".format(schema, table)]
+        for fator, nome in zip(fatores, piramides):
+            comandos += ['DROP TABLE IF EXISTS {};'.format(nome),
+                         "SELECT ST_CreateOverview('{}'::regclass, 'rast'::name, {});".format(tabela, fator)]
+        comandos += ['VACUUM ANALYZE {};'.format(tabela)]
+        result = 0
+        for sql in comandos:
+            feedback.pushInfo(sql)
+            if ExecutarComando(psql + ['-c', sql], feedback) != 0:
+                result = 1
+
+        if result == 0 and not falhas:
+            feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
+            feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
+        else:
+            feedback.pushInfo(self.tr('There was a problem while executing the command. Please check the input parameters.',
+                                      'Houve algum problema durante a execução do comando. Por favor, verifique os parâmetros de entrada.'))
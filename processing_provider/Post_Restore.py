@@ -22,6 +22,7 @@ from qgis.core import (QgsProcessing,
                        QgsProcessingParameterString,
                        QgsProcessingParameterBoolean,
                        QgsProcessingParameterEnum,
+                       QgsProcessingParameterNumber,
                        QgsProcessingParameterRasterLayer,
                        QgsProcessingParameterFile,
                        QgsProcessingParameterFileDestination,
@@ -30,6 +31,7 @@ from qgis.core import (QgsProcessing,
                        QgsCoordinateReferenceSystem)
 
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.comandos import PastaPostgreSQL, ProgramaPostgreSQL, ExecutarComando, ItensBackup
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -71,8 +73,8 @@ class Restore(QgsProcessingAlgorithm):
     def icon(self):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/postgis.png'))
 
-    txt_en = 'This tool allows you to restore a database content by importing all the backup information in a ".sql" file into a PostgreSQL server.'
-    txt_pt = 'Esta ferramenta permite <b>restaurar</b>, ou seja, importar um banco de dados para um servidor PostgreSQL, a partir de um arquivo de backup no formato "<b>.sql</b>".'
+    txt_en = 'This tool allows you to restore a database content by importing all the backup information in a ".sql" file into a PostgreSQL server. A backup in the directory format can be restored with several parallel jobs.'
+    txt_pt = 'Esta ferramenta permite <b>restaurar</b>, ou seja, importar um banco de dados para um servidor PostgreSQL, a partir de um arquivo de backup no formato "<b>.sql</b>". Um backup no formato diretório pode ser restaurado com vários processos paralelos.'
     figure = 'images/tutorial/post_restore.jpg'
 
     def shortHelpString(self):
@@ -89,6 +91,8 @@ class Restore(QgsProcessingAlgorithm):
 
 
     FILE ='FILE'
+    FOLDER = 'FOLDER'
+    JOBS = 'JOBS'
     HOST = 'HOST'
     VERSION = 'VERSION'
     USER = 'USER'
@@ -101,7 +105,27 @@ class Restore(QgsProcessingAlgorithm):
             QgsProcessingParameterFile(
                 self.FILE,
                 self.tr('SQL File', 'Arquivo SQL'),
-                extension = 'sql'
+                extension = 'sql',
+                optional = True
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterFile(
+                self.FOLDER,
+                self.tr('or backup folder (directory format)', 'ou pasta do backup (formato diretório)'),
+                behavior=QgsProcessingParameterFile.Folder,
+                optional = True
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.JOBS,
+                self.tr('Number of parallel jobs (directory format)', 'Número de processos paralelos (formato diretório)'),
+                type =0, #Double = 1 and Integer = 0
+                defaultValue = 4,
+                minValue = 1
             )
         )
 
@@ -145,9 +169,21 @@ class Restore(QgsProcessingAlgorithm):
             self.FILE,
             context
         )
-        if not file_path:
+
+        pasta_backup = self.parameterAsFile(
+            parameters,
+            self.FOLDER,
+            context
+        )
+        if not file_path and not pasta_backup:
             raise QgsProcessingException(self.invalidSourceError(parameters, self.FILE))
 
+        n_processos = self.parameterAsInt(
+            parameters,
+            self.JOBS,
+            context
+        )
+
         host = self.parameterAsString(
             parameters,
             self.HOST,
@@ -174,29 +210,21 @@ class Restore(QgsProcessingAlgorithm):
         )
 
         # Procurando arquivo psql
-        win64 = 'C:/Program Files (x86)/PostgreSQL/'+version+'/bin'
-        win64d = 'D:/Program Files (x86)/PostgreSQL/'+version+'/bin'
-        win32 = 'C:/Program Files/PostgreSQL/'+version+'/bin'
-        win32d = 'D:/Program Files/PostgreSQL/'+version+'/bin'
-        mac = '/Library/PostgreSQL/'+version+'/bin/'
-        if os.path.isdir(win64):
-            os.chdir(win64)
-        elif os.path.isdir(win64d):
-            os.chdir(win64d)
-        elif os.path.isdir(win32):
-            os.chdir(win32)
-        elif os.path.isdir(win32d):
-            os.chdir(win32d)
-        elif os.path.isdir(mac):
-            os.chdir(mac)
-        else:
+        pasta = PastaPostgreSQL(version, 'psql')
+        if pasta is None:
             raise QgsProcessingException(self.tr('Make sure your PostgreSQL version is correct!', 'Verifique se a versão do seu PostgreSQL está correta!'))
 
         # Realizando o Restore
-        comando ='psql -d postgres -U '+user+' -h '+host+' -p '+port+' -f '+ '"' + file_path + '"'
-        feedback.pushInfo('\n' + self.tr('Command: ','Comando: ') + comando)
+        if pasta_backup: # formato diretório, com processos paralelos
+            pg_restore = ProgramaPostgreSQL(pasta, 'pg_restore')
+            comando = [pg_restore, '-C', '-d', 'postgres', '-j', str(n_processos), '-v', '-U', user, '-h', host, '-p', port, pasta_backup]
+            passos = ItensBackup(pg_restore, pasta_backup)
+        else:
+            comando = [ProgramaPostgreSQL(pasta, 'psql'), '-d', 'postgres', '-U', user, '-h', host, '-p', port, '-f', file_path]
+            passos = None
+        feedback.pushInfo('\n' + self.tr('Command: ','Comando: ') + ' '.join(comando))
         feedback.pushInfo('\n' + self.tr('Starting DB Restore process...', 'Iniciando processo de Restauracao do BD...'))
-        result = os.system(comando)
+        result = ExecutarComando(comando, feedback, passos = passos)
 
         if result==0:
             feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
@@ -46,6 +46,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import BlocosRaster
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -191,34 +192,35 @@ class Bands2RGB(QgsProcessingAlgorithm):
             context
         )
 
-        # Abrir banda R
-        image = gdal.Open(Band_R.dataProvider().dataSourceUri())
-        bandR = image.GetRasterBand(1).ReadAsArray()
-        prj=image.GetProjection()
-        geotransform = image.GetGeoTransform()
-        # Abrir banda G
-        image = gdal.Open(Band_G.dataProvider().dataSourceUri())
-        bandG = image.GetRasterBand(1).ReadAsArray()
-        # Abrir banda B
-        image = gdal.Open(Band_B.dataProvider().dataSourceUri())
-        bandB = image.GetRasterBand(1).ReadAsArray()
+        # Abrir bandas R, G e B
+        imageR = gdal.Open(Band_R.dataProvider().dataSourceUri())
+        imageG = gdal.Open(Band_G.dataProvider().dataSourceUri())
+        imageB = gdal.Open(Band_B.dataProvider().dataSourceUri())
+        prj=imageR.GetProjection()
+        geotransform = imageR.GetGeoTransform()
         # Criar objeto CRS
         CRS=osr.SpatialReference(wkt=prj)
         # Obter número de linhas e colunas
-        n_col = image.RasterXSize
-        n_lin = image.RasterYSize
-        image=None # Fechar imagem
+        n_col = imageB.RasterXSize
+        n_lin = imageB.RasterYSize
 
-        # Pegar tipo de dado do array
-        GDT = gdal_array.NumericTypeCodeToGDALTypeCode(bandB.dtype)
+        # Pegar tipo de dado da banda
+        GDT = imageB.GetRasterBand(1).DataType
 
         # Criar imagem RGB
         RGB = gdal.GetDriverByName('GTiff').Create(RGB_Output, n_col, n_lin, 3, GDT)
         RGB.SetGeoTransform(geotransform)    # specify coords
         RGB.SetProjection(CRS.ExportToWkt()) # export coords to file
-        RGB.GetRasterBand(1).WriteArray(bandR)   # write R band to the raster
-        RGB.GetRasterBand(2).WriteArray(bandG)   # write G band to the raster
-        RGB.GetRasterBand(3).WriteArray(bandB)   # write B band to the raster
+        janelas = BlocosRaster(imageB)
+        Percent = 100.0/len(janelas)
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            for k, image in enumerate([imageR, imageG, imageB]):
+                band = image.GetRasterBand(1).ReadAsArray(xoff, yoff, xsize, ysize)
+                RGB.GetRasterBand(k+1).WriteArray(band, xoff, yoff)   # write block of R, G or B band to the raster
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((index+1) * Percent))
+        imageR = imageG = imageB = None # Fechar imagens
         RGB.FlushCache()   # Escrever no disco
         RGB = None   # Salvar e fechar
         CRS = None
@@ -46,6 +46,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import BlocosRaster
 import numpy as np
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -215,51 +216,61 @@ Os operadores suportados são: + , - , * , /'''
         CRS=osr.SpatialReference(wkt=prj)
 
         # Verificar número de bandas
-        dic = {}
         for k in range(n_bands):
-            feedback.pushInfo(self.tr('Reading band {}...'.format(k+1), 'Lendo a banda {}...'.format(k+1)))
-            dic['b[n]'.replace('[n]', str(k+1))] = image.GetRasterBand(k+1).ReadAsArray().astype('float')
             expr = expr.replace('b[n]'.replace('[n]', str(k+1)), "dic['b[n]']".replace('[n]', str(k+1)))
-        if n_bands == 4 and alfa:
-            transp = dic['b4'] > 0
-        image = None
         lista = expr.lower().split('/')
-
-        try:
-            feedback.pushInfo(self.tr('Carrying out the calculations...', 'Realizando os cálculos...'))
-            if len(lista) == 2:
-                NUM, DEN = lista
-                NUM = eval(NUM)
-                DEN = eval(DEN)
-                if n_bands == 4 and alfa:
-                    INDICE = -9999*((DEN == 0) | np.logical_not(transp)) + ((DEN != 0) & transp)*(NUM/(DEN + (DEN == 0)*1))
-                else:
-                    if isinstance(Pixel_Nulo, (int, float)):
-                        INDICE = -9999*((DEN == 0) | (b1 == Pixel_Nulo)) + ((DEN != 0) & (b1 != Pixel_Nulo))*(NUM/(DEN + (DEN == 0)*1))
-                    else:
-                        INDICE = -9999*(DEN == 0) + (DEN != 0)*(NUM/(DEN + (DEN == 0)*1))
-            elif len(lista) == 1:
-                formula = eval(lista[0])
-                if n_bands == 4 and alfa:
-                    INDICE = -9999*(np.logical_not(transp)) + (transp)*formula
-                else:
-                    if isinstance(Pixel_Nulo, (int, float)):
-                        INDICE = -9999*(b1 == Pixel_Nulo) + (b1 != Pixel_Nulo)*formula
-                    else:
-                        INDICE = formula
-            else:
-                raise QgsProcessingException(self.tr('Check the input formula!', 'Verifique a fórmula de entrada!'))
-        except:
-            raise QgsProcessingException(self.tr('Check if your formula is correct!', 'Verifique se sua fórmula está correta!'))
+        if len(lista) not in (1, 2):
+            raise QgsProcessingException(self.tr('Check the input formula!', 'Verifique a fórmula de entrada!'))
 
         # Criate driver
         Driver = gdal.GetDriverByName('GTiff').Create(Output, cols, rows, 1, gdal.GDT_Float32)
         Driver.SetGeoTransform(geotransform)
         Driver.SetProjection(CRS.ExportToWkt())
         outband = Driver.GetRasterBand(1)
-        feedback.pushInfo(self.tr('Writing results...', 'Escrevendo resultados...'))
         outband.SetNoDataValue(-9999)
-        outband.WriteArray(INDICE)
+
+        feedback.pushInfo(self.tr('Carrying out the calculations...', 'Realizando os cálculos...'))
+        janelas = BlocosRaster(image)
+        Percent = 100.0/len(janelas)
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            dic = {}
+            for k in range(n_bands):
+                dic['b[n]'.replace('[n]', str(k+1))] = image.GetRasterBand(k+1).ReadAsArray(xoff, yoff, xsize, ysize).astype('float')
+            b1 = dic['b1']
+            if n_bands == 4 and alfa:
+                transp = dic['b4'] > 0
+
+            try:
+                if len(lista) == 2:
+                    NUM, DEN = lista
+                    NUM = eval(NUM)
+                    DEN = eval(DEN)
+                    if n_bands == 4 and alfa:
+                        INDICE = -9999*((DEN == 0) | np.logical_not(transp)) + ((DEN != 0) & transp)*(NUM/(DEN + (DEN == 0)*1))
+                    else:
+                        if isinstance(Pixel_Nulo, (int, float)):
+                            INDICE = -9999*((DEN == 0) | (b1 == Pixel_Nulo)) + ((DEN != 0) & (b1 != Pixel_Nulo))*(NUM/(DEN + (DEN == 0)*1))
+                        else:
+                            INDICE = -9999*(DEN == 0) + (DEN != 0)*(NUM/(DEN + (DEN == 0)*1))
+                else:
+                    formula = eval(lista[0])
+                    if n_bands == 4 and alfa:
+                        INDICE = -9999*(np.logical_not(transp)) + (transp)*formula
+                    else:
+                        if isinstance(Pixel_Nulo, (int, float)):
+                            INDICE = -9999*(b1 == Pixel_Nulo) + (b1 != Pixel_Nulo)*formula
+                        else:
+                            INDICE = formula
+            except:
+                raise QgsProcessingException(self.tr('Check if your formula is correct!', 'Verifique se sua fórmula está correta!'))
+
+            outband.WriteArray(INDICE, xoff, yoff)
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((index+1) * Percent))
+
+        feedback.pushInfo(self.tr('Writing results...', 'Escrevendo resultados...'))
+        image = None
         Driver.FlushCache()
         Driver = None
 
@@ -47,10 +47,9 @@ from qgis.core import (QgsProcessing,
 
 from math import floor, ceil
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
-from matplotlib import path
 import numpy as np
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import Interpolar
+from lftools.geocapt.dip import InterpolarArray, MascaraPoligono
 from lftools.geocapt.cartography import reprojectPoints
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -289,57 +288,21 @@ Referência:'''
                         poly = geom.asMultiPolygon()[0][0]
                     else:
                         poly = geom.asPolygon()[0]
-                    caminho = []
-                    lin_min = 1e8
-                    col_min = 1e8
-                    lin_max = -1e8
-                    col_max = -1e8
-                    for ponto in poly:
-                        linha = (origem[1]-ponto.y())/resol_Y
-                        if linha > lin_max:
-                            lin_max = linha
-                        if linha < lin_min:
-                            lin_min = linha
-                        coluna = (ponto.x() - origem[0])/resol_X
-                        if coluna > col_max:
-                            col_max = coluna
-                        if coluna < col_min:
-                            col_min = coluna
-                        caminho += [(linha, coluna)]
-                    p = path.Path(caminho)
-                    lin_min = int(np.floor(lin_min))
-                    lin_max = int(np.floor(lin_max))
-                    col_min = int(np.floor(col_min))
-                    col_max = int(np.floor(col_max))
-                    nx, ny = (lin_max-lin_min+1, col_max-col_min+1)
-                    lin = np.linspace(lin_min, lin_max, nx)
-                    col = np.linspace(col_min, col_max, ny)
-                    COL, LIN = np.meshgrid(col, lin)
-                    recorte = np.zeros((int(nx), int(ny)), dtype=bool)
-                    for x in range(int(nx)):
-                        for y in range(int(ny)):
-                            pixel = (LIN[x][y]+0.5, COL[x][y]+0.5) # 0.5 eh o centro do pixel
-                            contem = p.contains_points([pixel])
-                            recorte[x][y] = contem[0]
+                    recorte, lin_min, col_min = MascaraPoligono(poly, origem, resol_X, resol_Y, rows, cols)
+                    nx, ny = recorte.shape
                     # Amostras dentro do polígono
-                    recorte_img = banda[lin_min:lin_max+1, col_min:col_max+1]
-                    if np.shape(recorte)!=np.shape(recorte_img):
-                        # chegou no fim do recorte
-                        recorte = recorte[0:np.shape(recorte_img)[0], 0:np.shape(recorte_img)[1]]
-                    tam = np.shape(recorte_img)
-                    for x in range(tam[0]):
-                        for y in range(tam[1]):
-                            if recorte[x][y]:
-                                valores += [float(recorte_img[x][y])]
+                    valores += list(banda[lin_min:lin_min+nx, col_min:col_min+ny][recorte].astype('float'))
             except: #ponto elif layer.wkbType() == QgsWkbTypes.PointGeometry:
+                coordX, coordY = [], []
                 for feat in layer.getFeatures():
                     geom = feat.geometry() if mesmoSRC else reprojectPoints(feat.geometry(), coordinateTransformer)
                     if geom.isMultipart():
                         ponto = geom.asMultiPoint()[0]
                     else:
                         ponto = geom.asPoint()
-                    valorPixel = Interpolar(ponto.x(), ponto.y(), banda, origem, resol_X, resol_Y, metodo = 'nearest', nulo = Pixel_Nulo)
-                    valores += [valorPixel]
+                    coordX += [ponto.x()]
+                    coordY += [ponto.y()]
+                valores += list(InterpolarArray(np.array(coordX), np.array(coordY), banda, origem, resol_X, resol_Y, metodo = 'nearest', nulo = Pixel_Nulo))
 
             # Estatísticas dos Valores
             valores = np.array(valores)
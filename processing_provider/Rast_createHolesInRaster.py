@@ -47,7 +47,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 import numpy as np
-from matplotlib import path
+from lftools.geocapt.dip import MascaraPoligono
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -222,39 +222,17 @@ class CreateHolesInRaster(QgsProcessingAlgorithm):
             if transf_SRC:
                 geom.transform(coordTransf)
             coords = geom.asPolygon()[0]
-            caminho = []
-            for ponto in coords:
-                linha = (origem[1]-ponto.y())/resol_Y
-                coluna = (ponto.x() - origem[0])/resol_X
-                caminho += [(linha, coluna)]
-            p = path.Path(caminho)
-            box = geom.boundingBox()
-            uly = box.yMaximum()
-            lry = box.yMinimum()
-            ulx = box.xMinimum()
-            lrx = box.xMaximum()
-
-            # Limites de Varredura
-            row_ini = int(round((origem[1]-uly)/resol_Y - 0.5))-1
-            row_fim = int(round((origem[1]-lry)/resol_Y - 0.5))+1
-            col_ini = int(round((ulx - origem[0])/resol_X - 0.5))-1
-            col_fim = int(round((lrx - origem[0])/resol_X - 0.5))+1
-
-            # Varrer Raster
+            mascara, lin_min, col_min = MascaraPoligono(coords, origem, resol_X, resol_Y, rows, cols)
+            nx, ny = mascara.shape
+            janela = (slice(lin_min, lin_min+nx), slice(col_min, col_min+ny))
+
+            # Pixels dentro do polígono
             if n_bands == 4:
-                for lin in range(row_ini, row_fim):
-                    for col in range(col_ini, col_fim):
-                        pixel = (lin+0.5, col+0.5)
-                        if p.contains_points([pixel]):
-                            band4[lin][col] = 0
+                band4[janela][mascara] = 0
             else:
-                for lin in range(row_ini, row_fim):
-                    for col in range(col_ini, col_fim):
-                        pixel = (lin+0.5, col+0.5)
-                        if p.contains_points([pixel]):
-                            band1[lin][col] = Pixel_Nulo
-                            band2[lin][col] = Pixel_Nulo
-                            band3[lin][col] = Pixel_Nulo
+                band1[janela][mascara] = Pixel_Nulo
+                band2[janela][mascara] = Pixel_Nulo
+                band3[janela][mascara] = Pixel_Nulo
             feedback.setProgress(int(cont * total))
 
         # Criar imagem RGB
@@ -50,6 +50,7 @@ from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from math import floor, ceil
 import numpy as np
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import BlocosRaster
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -228,13 +229,22 @@ class DefineNullCell(QgsProcessingAlgorithm):
             Driver.SetGeoTransform(geotransform)    # specify coords
             Driver.SetProjection(CRS.ExportToWkt()) # export coords to file
 
+            janelas = BlocosRaster(image)
+            Percent = 100.0/(len(janelas)*n_bands)
+            current = 0
             for k in range(n_bands):
-                band = image.GetRasterBand(k+1).ReadAsArray()
-                # Defining null pixels
-                band = ((band>=MIN)*(band<=MAX))*band + (band<MIN)*(float(Pixel_Nulo)) + (band>MAX)*(float(Pixel_Nulo))
+                inband = image.GetRasterBand(k+1)
                 outband = Driver.GetRasterBand(k+1)
                 feedback.pushInfo(self.tr('Writing Band {}...'.format(k+1), 'Escrevendo Banda {}...'.format(k+1)))
-                outband.WriteArray(band) # write band to the raster
+                for xoff, yoff, xsize, ysize in janelas:
+                    band = inband.ReadAsArray(xoff, yoff, xsize, ysize)
+                    # Defining null pixels
+                    band = ((band>=MIN)*(band<=MAX))*band + (band<MIN)*(float(Pixel_Nulo)) + (band>MAX)*(float(Pixel_Nulo))
+                    outband.WriteArray(band, xoff, yoff) # write block to the raster
+                    if feedback.isCanceled():
+                        break
+                    current += 1
+                    feedback.setProgress(int(current * Percent))
                 outband.SetNoDataValue(Pixel_Nulo)
 
             image=None # Close dataset
@@ -47,6 +47,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import BlocosRaster
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -177,7 +178,7 @@ class ExtractRasterBand(QgsProcessingAlgorithm):
         # Abrir banda
         feedback.pushInfo(self.tr('Reading the selected band...', 'Lendo a banda selecionada...'))
         image = gdal.Open(entrada.dataProvider().dataSourceUri())
-        banda = image.GetRasterBand(n_banda).ReadAsArray()
+        banda = image.GetRasterBand(n_banda)
         prj=image.GetProjection()
         geotransform = image.GetGeoTransform()
 
@@ -187,17 +188,24 @@ class ExtractRasterBand(QgsProcessingAlgorithm):
         # Obter número de linhas e colunas
         cols = image.RasterXSize
         rows = image.RasterYSize
-        image=None # fechar magem
 
-        # Pegar tipo de dado do array
-        GDT = gdal_array.NumericTypeCodeToGDALTypeCode(banda.dtype)
+        # Pegar tipo de dado da banda
+        GDT = banda.DataType
 
         # Criar imagem com uma única banda
         feedback.pushInfo(self.tr('Writing the selected band...', 'Escrevendo a banda selecionada...'))
         nova_imagem = gdal.GetDriverByName('GTiff').Create(saida, cols, rows, 1, GDT)
         nova_imagem.SetGeoTransform(geotransform)
         nova_imagem.SetProjection(CRS.ExportToWkt())
-        nova_imagem.GetRasterBand(1).WriteArray(banda)
+        outband = nova_imagem.GetRasterBand(1)
+        janelas = BlocosRaster(image)
+        Percent = 100.0/len(janelas)
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            outband.WriteArray(banda.ReadAsArray(xoff, yoff, xsize, ysize), xoff, yoff)
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((index+1) * Percent))
+        image=None # fechar magem
         nova_imagem.FlushCache() # Escrever no disco
         nova_imagem = None # Salvar e fechar
         CRS = None
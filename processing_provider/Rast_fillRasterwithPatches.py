@@ -48,7 +48,7 @@ from qgis.core import (QgsProcessing,
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from math import floor, ceil
 import numpy as np
-from lftools.geocapt.dip import Interpolar
+from lftools.geocapt.dip import InterpolarArray, BlocosRaster, AbrirRaster
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -91,8 +91,8 @@ class FillRasterwithPatches(QgsProcessingAlgorithm):
     def icon(self):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/raster.png'))
 
-    txt_en = 'Fills Raster null pixels (no data) with data obtained from other smaller raster layers (Patches).'
-    txt_pt = 'Preenche vazios de Raster (pixels nulos) com dados obtidos de outras camadas raster menores (Remendos).'
+    txt_en = 'Fills Raster null pixels (no data) with data obtained from other smaller raster layers (Patches). Each pixel is filled by the first patch with valid data, following the chosen priority.'
+    txt_pt = 'Preenche vazios de Raster (pixels nulos) com dados obtidos de outras camadas raster menores (Remendos). Cada pixel é preenchido pelo primeiro remendo com dado válido, seguindo a prioridade escolhida.'
     figure = 'images/tutorial/raster_fill_holes.jpg'
 
     def shortHelpString(self):
@@ -110,6 +110,7 @@ class FillRasterwithPatches(QgsProcessingAlgorithm):
     RasterIN ='RasterIN'
     PATCHES = 'PATCHES'
     RESAMPLING = 'RESAMPLING'
+    PRIORITY = 'PRIORITY'
     RasterOUT = 'RasterOUT'
     OPEN = 'OPEN'
 
@@ -144,6 +145,18 @@ class FillRasterwithPatches(QgsProcessingAlgorithm):
             )
         )
 
+        prioridade = [self.tr('Layer order', 'Ordem das camadas'),
+                      self.tr('Best resolution first', 'Melhor resolução primeiro')]
+
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.PRIORITY,
+                self.tr('Patch priority', 'Prioridade dos remendos'),
+				options = prioridade,
+                defaultValue= 0
+            )
+        )
+
         # OUTPUT
         self.addParameter(
             QgsProcessingParameterFileDestination(
@@ -186,6 +199,12 @@ class FillRasterwithPatches(QgsProcessingAlgorithm):
         )
         reamostragem = ['nearest','bilinear','bicubic'][reamostragem]
 
+        prioridade = self.parameterAsEnum(
+            parameters,
+            self.PRIORITY,
+            context
+        )
+
         RGB_Output = self.parameterAsFileOutput(
             parameters,
             self.RasterOUT,
@@ -200,7 +219,7 @@ class FillRasterwithPatches(QgsProcessingAlgorithm):
 
         limiar = 240
 
-        # Abrir Raster layer como array
+        # Abrir Raster de entrada
         image = gdal.Open(RasterIN)
         prj=image.GetProjection()
         CRS=osr.SpatialReference(wkt=prj)
@@ -213,130 +232,102 @@ class FillRasterwithPatches(QgsProcessingAlgorithm):
         origem = (ulx, uly)
         resol_X = abs(xres)
         resol_Y = abs(yres)
-        if n_bands ==1:
-            feedback.pushInfo(self.tr('Opening raster band...', 'Abrindo banda do raster...'))
-            band1 = image.GetRasterBand(1).ReadAsArray()
-        if n_bands >=3:
-            feedback.pushInfo(self.tr('Opening Band R...', 'Abrindo Banda R...'))
-            band1 = image.GetRasterBand(1).ReadAsArray()
-            feedback.pushInfo(self.tr('Opening Band G...', 'Abrindo Banda G...'))
-            band2 = image.GetRasterBand(2).ReadAsArray()
-            feedback.pushInfo(self.tr('Opening Band B...', 'Abrindo Banda B...'))
-            band3 = image.GetRasterBand(3).ReadAsArray()
-        # Transparência
-        if n_bands == 4:
-            feedback.pushInfo(self.tr('Opening Band Alpha...', 'Abrindo Banda Alfa...'))
-            band4 = image.GetRasterBand(4).ReadAsArray()
+        n_saida = 1 if n_bands < 3 else 3 # banda única ou RGB
+        GDT = image.GetRasterBand(1).DataType
         Pixel_Nulo = image.GetRasterBand(1).GetNoDataValue()
         if Pixel_Nulo == None:
             Pixel_Nulo = 0
-        image=None # Fechar imagem
-
-        # Número de pixels para processamento
-        TAM =  0
-        for Remendo in PatchesLayers:
-            Rem_Path = Remendo.dataProvider().dataSourceUri()
-            Rem = gdal.Open(Rem_Path)
-        #    Rem_cols = Rem.RasterXSize # Number of columns
-            Rem_rows = Rem.RasterYSize # Number of rows
-            TAM += Rem_rows
-
-        # Remendos
-        total = 100.0 / TAM
-        cont = 0
-        for Remendo in PatchesLayers:
-            feedback.pushInfo((self.tr('Processing Layer: {}', 'Processando Camada: {}')).format(Remendo))
-            Rem_Path = Remendo.dataProvider().dataSourceUri()
-            Rem = gdal.Open(Rem_Path)
-            ulx, xres, xskew, uly, yskew, yres  = Rem.GetGeoTransform()
-            Rem_origem = (ulx, uly)
-            Rem_resol_X = abs(xres)
-            Rem_resol_Y = abs(yres)
-            Rem_cols = Rem.RasterXSize # Number of columns
-            Rem_rows = Rem.RasterYSize # Number of rows
-            lrx = ulx + (Rem_cols * xres)
-            lry = uly + (Rem_rows * yres)
-            bbox = [ulx, lrx, lry, uly]
-            Rem_nulo = Rem.GetRasterBand(1).GetNoDataValue()
-            if Rem_nulo == None:
-                Rem_nulo = 0
-            Rem_band1 = Rem.GetRasterBand(1).ReadAsArray()
-            if n_bands >1:
-                Rem_band2 = Rem.GetRasterBand(2).ReadAsArray()
-                Rem_band3 = Rem.GetRasterBand(3).ReadAsArray()
-
-            # Limites de Varredura
-            row_ini = int(round((origem[1]-uly)/resol_Y - 0.5))
-            row_fim = int(round((origem[1]-lry)/resol_Y - 0.5))
-            col_ini = int(round((ulx - origem[0])/resol_X - 0.5))
-            col_fim = int(round((lrx - origem[0])/resol_X - 0.5))
-            # Varrer Raster
-            if n_bands == 4:
-                for lin in range(row_ini, row_fim):
-                    for col in range(col_ini, col_fim):
-                        px_value = band4[lin][col]
-                        if px_value == 0 or band1[lin][col] > limiar: # Verificar Limiar
-                            X = origem[0] + resol_X*(col + 0.5)
-                            Y = origem[1] - resol_Y*(lin + 0.5)
-                            band1[lin][col] = Interpolar(X, Y, Rem_band1, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                            band2[lin][col] = Interpolar(X, Y, Rem_band2, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                            band3[lin][col] = Interpolar(X, Y, Rem_band3, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                    cont += 1
-                    feedback.setProgress(int(cont * total))
-                    if feedback.isCanceled():
-                        break
-            elif n_bands == 3:
-                for lin in range(row_ini, row_fim):
-                    for col in range(col_ini, col_fim):
-                        px_value = band1[lin][col]
-                        if px_value == Pixel_Nulo or band1[lin][col] > limiar: # Verificar Limiar
-                            X = origem[0] + resol_X*(col + 0.5)
-                            Y = origem[1] - resol_Y*(lin + 0.5)
-                            band1[lin][col] = Interpolar(X, Y, Rem_band1, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                            band2[lin][col] = Interpolar(X, Y, Rem_band2, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                            band3[lin][col] = Interpolar(X, Y, Rem_band3, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                    cont += 1
-                    feedback.setProgress(int(cont * total))
-                    if feedback.isCanceled():
-                        break
-            elif n_bands == 1:
-                for lin in range(row_ini, row_fim):
-                    for col in range(col_ini, col_fim):
-                        px_value = band1[lin][col]
-                        if px_value == Pixel_Nulo or band1[lin][col] > limiar: # Verificar Limiar
-                            X = origem[0] + resol_X*(col + 0.5)
-                            Y = origem[1] - resol_Y*(lin + 0.5)
-                            band1[lin][col] = Interpolar(X, Y, Rem_band1, Rem_origem, Rem_resol_X, Rem_resol_Y, reamostragem, Rem_nulo)
-                    cont += 1
-                    feedback.setProgress(int(cont * total))
-                    if feedback.isCanceled():
-                        break
-            Rem = None # Fechar imagem
 
-        # Criar imagem RGB
-        feedback.pushInfo(self.tr('Saving Raster...', 'Salvando Raster...'))
-        GDT = gdal_array.NumericTypeCodeToGDALTypeCode(band1.dtype)
-        if n_bands ==1:
-            RASTER = gdal.GetDriverByName('GTiff').Create(RGB_Output, cols, rows, 1, GDT)
-        else:
-            RASTER = gdal.GetDriverByName('GTiff').Create(RGB_Output, cols, rows, 3, GDT)
-        RASTER.SetGeoTransform(geotransform)    # specify coords
-        RASTER.SetProjection(CRS.ExportToWkt()) # export coords to file
-        if n_bands ==1:
-            feedback.pushInfo(self.tr('Writing rater band...', 'Escrevendo banda do raster...'))
-            banda = RASTER.GetRasterBand(1)
-            banda.WriteArray(band1)
-            banda.SetNoDataValue(Pixel_Nulo)
-        else:
-            feedback.pushInfo(self.tr('Writing Band R...', 'Escrevendo Banda R...'))
-            bandaR = RASTER.GetRasterBand(1)
-            bandaR.WriteArray(band1)
-            feedback.pushInfo(self.tr('Writing Band G...', 'Escrevendo Banda G...'))
-            bandaG = RASTER.GetRasterBand(2)
-            bandaG.WriteArray(band2)
-            feedback.pushInfo(self.tr('Writing Band B...', 'Escrevendo Banda B...'))
-            bandaB = RASTER.GetRasterBand(3)
-            bandaB.WriteArray(band3)
+        # Remendos abertos por esta execução
+        rasters = {}
+        try:
+            # Extensão, resolução e valor nulo dos remendos
+            remendos = []
+            for Remendo in PatchesLayers:
+                Rem_Path = Remendo.dataProvider().dataSourceUri()
+                Rem = AbrirRaster(Rem_Path, rasters)
+                if Rem.RasterCount < n_saida:
+                    raise QgsProcessingException(self.tr('The patch {} must have at least {} band(s)!', 'O remendo {} deve ter pelo menos {} banda(s)!').format(Remendo.name(), n_saida))
+                ulx, xres, xskew, uly, yskew, yres  = Rem.GetGeoTransform()
+                lrx = ulx + (Rem.RasterXSize * xres)
+                lry = uly + (Rem.RasterYSize * yres)
+                Rem_nulo = Rem.GetRasterBand(1).GetNoDataValue()
+                if Rem_nulo == None:
+                    Rem_nulo = 0
+                remendos += [{'caminho': Rem_Path,
+                              'origem': (ulx, uly),
+                              'resol_X': abs(xres),
+                              'resol_Y': abs(yres),
+                              # Limites de Varredura
+                              'row_ini': int(round((origem[1]-uly)/resol_Y - 0.5)),
+                              'row_fim': int(round((origem[1]-lry)/resol_Y - 0.5)),
+                              'col_ini': int(round((ulx - origem[0])/resol_X - 0.5)),
+                              'col_fim': int(round((lrx - origem[0])/resol_X - 0.5)),
+                              'nulo': Rem_nulo}]
+            # Ordem de prioridade: cada pixel é preenchido pelo primeiro remendo com valor
+            if prioridade == 1:
+                remendos.sort(key = lambda rem: rem['resol_X']*rem['resol_Y'])
+
+            # Criar imagem de saída
+            RASTER = gdal.GetDriverByName('GTiff').Create(RGB_Output, cols, rows, n_saida, GDT)
+            RASTER.SetGeoTransform(geotransform)    # specify coords
+            RASTER.SetProjection(CRS.ExportToWkt()) # export coords to file
+            if n_saida == 1:
+                RASTER.GetRasterBand(1).SetNoDataValue(Pixel_Nulo)
+
+            # Preencher por blocos, compondo todos os remendos em uma passada
+            feedback.pushInfo(self.tr('Filling raster with patches...', 'Preenchendo raster com remendos...'))
+            janelas = BlocosRaster(image)
+            total = 100.0/len(janelas)
+            for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+                bandas = [image.GetRasterBand(k+1).ReadAsArray(xoff, yoff, xsize, ysize) for k in range(n_saida)]
+                if n_bands == 4: # Transparência
+                    alfa = image.GetRasterBand(4).ReadAsArray(xoff, yoff, xsize, ysize)
+                    preencher = (alfa == 0) | (bandas[0] > limiar) # Verificar Limiar
+                else:
+                    preencher = (bandas[0] == Pixel_Nulo) | (bandas[0] > limiar) # Verificar Limiar
+                for rem in remendos:
+                    if not preencher.any():
+                        break
+                    row_ini, row_fim = max(rem['row_ini'], yoff), min(rem['row_fim'], yoff + ysize)
+                    col_ini, col_fim = max(rem['col_ini'], xoff), min(rem['col_fim'], xoff + xsize)
+                    if row_fim <= row_ini or col_fim <= col_ini:
+                        continue
+                    lin, col = np.nonzero(preencher[row_ini-yoff:row_fim-yoff, col_ini-xoff:col_fim-xoff])
+                    if not len(lin):
+                        continue
+                    lin += row_ini - yoff
+                    col += col_ini - xoff
+                    X = origem[0] + resol_X*(col + xoff + 0.5)
+                    Y = origem[1] - resol_Y*(lin + yoff + 0.5)
+                    # Janela do remendo que contém os pixels (com margem para a bicúbica)
+                    Rem = AbrirRaster(rem['caminho'], rasters)
+                    I = (rem['origem'][1] - Y)/rem['resol_Y'] - 0.5
+                    J = (X - rem['origem'][0])/rem['resol_X'] - 0.5
+                    lin_rem = max(int(np.floor(I.min())) - 2, 0)
+                    col_rem = max(int(np.floor(J.min())) - 2, 0)
+                    n_lin_rem = min(int(np.ceil(I.max())) + 3, Rem.RasterYSize) - lin_rem
+                    n_col_rem = min(int(np.ceil(J.max())) + 3, Rem.RasterXSize) - col_rem
+                    if n_lin_rem <= 0 or n_col_rem <= 0:
+                        continue
+                    # Reamostrar todas as bandas do remendo
+                    valores = []
+                    for k in range(n_saida):
+                        Rem_band = Rem.GetRasterBand(k+1).ReadAsArray(col_rem, lin_rem, n_col_rem, n_lin_rem)
+                        valores += [InterpolarArray(X, Y, Rem_band, rem['origem'], rem['resol_X'], rem['resol_Y'], reamostragem, rem['nulo'], (lin_rem, col_rem))]
+                    validos = valores[0] != rem['nulo']
+                    for k in range(n_saida):
+                        bandas[k][lin[validos], col[validos]] = valores[k][validos]
+                    preencher[lin[validos], col[validos]] = False
+                for k in range(n_saida):
+                    RASTER.GetRasterBand(k+1).WriteArray(bandas[k], xoff, yoff)
+                feedback.setProgress(int((index+1) * total))
+                if feedback.isCanceled():
+                    break
+        finally:
+            image = None # Fechar imagem
+            Rem = None
+            rasters.clear() # Fechar remendos
 
         feedback.pushInfo(self.tr('Saving raster...', 'Salvando raster...'))
         RASTER.FlushCache()   # Escrever no disco
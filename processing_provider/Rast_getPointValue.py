@@ -50,7 +50,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import Interpolar
+from lftools.geocapt.dip import InterpolarArray
 import os
 import numpy as np
 from qgis.PyQt.QtGui import QIcon
@@ -255,42 +255,38 @@ class GetPointValue(QgsProcessingAlgorithm):
         else:
             transf_SRC = False
 
-        # Calcular valor interpolado para cada ponto
-        Percent = 100.0/pontos.featureCount() if pontos.featureCount()>0 else 0
-        newfeat = QgsFeature(Fields)
-        for index, feat in enumerate(pontos.getFeatures()):
+        # Coordenadas de todos os pontos
+        feedback.pushInfo(self.tr('Reading points...', 'Lendo pontos...'))
+        atributos, coordX, coordY = [], [], []
+        for feat in pontos.getFeatures():
             geom = feat.geometry()
             if transf_SRC:
                 geom.transform(coordTransf)
             att = feat.attributes()
-            if geom.isMultipart():
-                pnts = geom.asMultiPoint()
-                for pnt in pnts:
-                    X, Y = pnt.x(), pnt.y()
-                    valor = Interpolar(X, Y,
-                                        banda,
-                                        origem,
-                                        xres,
-                                        yres,
-                                        reamostragem,
-                                        valor_nulo)
-                    newfeat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(X, Y)))
-                    newfeat.setAttributes(att + [valor])
-                    sink.addFeature(newfeat, QgsFeatureSink.FastInsert)
-            else:
-                pnt = geom.asPoint()
-                X, Y = pnt.x(), pnt.y()
-                valor = Interpolar(X, Y,
-                                    banda,
-                                    origem,
-                                    xres,
-                                    yres,
-                                    reamostragem,
-                                    valor_nulo)
-                newfeat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(X, Y)))
-                newfeat.setAttributes(att + [valor])
-                sink.addFeature(newfeat, QgsFeatureSink.FastInsert)
+            pnts = geom.asMultiPoint() if geom.isMultipart() else [geom.asPoint()]
+            for pnt in pnts:
+                atributos += [att]
+                coordX += [pnt.x()]
+                coordY += [pnt.y()]
+            if feedback.isCanceled():
+                break
 
+        # Calcular valor interpolado para todos os pontos
+        feedback.pushInfo(self.tr('Interpolating values...', 'Interpolando valores...'))
+        valores = InterpolarArray(np.array(coordX), np.array(coordY),
+                                  banda,
+                                  origem,
+                                  xres,
+                                  yres,
+                                  reamostragem,
+                                  valor_nulo)
+
+        Percent = 100.0/len(atributos) if len(atributos)>0 else 0
+        newfeat = QgsFeature(Fields)
+        for index, att in enumerate(atributos):
+            newfeat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(coordX[index], coordY[index])))
+            newfeat.setAttributes(att + [float(valores[index])])
+            sink.addFeature(newfeat, QgsFeatureSink.FastInsert)
             if feedback.isCanceled():
                 break
             feedback.setProgress(int((index+1) * Percent))
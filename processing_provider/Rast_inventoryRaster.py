@@ -49,6 +49,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.catalogo import AbrirCatalogo, AtualizarCatalogo, Contorno
 import os
 import numpy as np
 from qgis.PyQt.QtGui import QIcon
@@ -112,6 +113,7 @@ class InventoryRaster(QgsProcessingAlgorithm):
     SUBFOLDER = 'SUBFOLDER'
     FORMAT = 'FORMAT'
     GEOMETRY = 'GEOMETRY'
+    CACHE = 'CACHE'
     OUTPUT = 'OUTPUT'
     CRS = 'CRS'
 
@@ -151,6 +153,14 @@ class InventoryRaster(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.CACHE,
+                self.tr('Keep a footprint catalogue in the folder (only new or changed files are opened again)', 'Manter catálogo das áreas de cobertura na pasta (apenas arquivos novos ou alterados são abertos novamente)'),
+                defaultValue = True
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterCrs(
                 self.CRS,
@@ -193,6 +203,12 @@ class InventoryRaster(QgsProcessingAlgorithm):
             context
         )
 
+        usar_cache = self.parameterAsBool(
+            parameters,
+            self.CACHE,
+            context
+        )
+
         crs = self.parameterAsCrs(
             parameters,
             self.CRS,
@@ -245,30 +261,25 @@ class InventoryRaster(QgsProcessingAlgorithm):
 
         # Obter dados dos arquivos listados
         feedback.pushInfo(self.tr('Creating raster files...', 'Criando inventário de arquivos raster...'))
-        for current, file_path in enumerate(lista):
-            image = gdal.Open(file_path) # https://gdal.org/python/
-            prj = image.GetProjection() # wkt
-            ulx, xres, xskew, uly, yskew, yres  = image.GetGeoTransform()
-            GDT = image.GetRasterBand(1).DataType
-            n_bands = image.RasterCount
-            cols = image.RasterXSize # Number of columns
-            rows = image.RasterYSize # Number of rows
-            CRS= QgsCoordinateReferenceSystem(prj) # Create CRS
-            image=None # Close image
-
-            # Creating BBox
-            coord = [[QgsPointXY(ulx, uly),
-                      QgsPointXY(ulx+cols*xres, uly),
-                      QgsPointXY(ulx+cols*xres, uly+rows*yres),
-                      QgsPointXY(ulx, uly+rows*yres),
-                      QgsPointXY(ulx, uly)]]
-            geom = QgsGeometry.fromPolygonXY(coord)
+        catalogo = AbrirCatalogo(pasta if usar_cache else None)
+        n_cache = 0
+        sistemas = {}
+        for current, (_, file_path, dados, do_cache) in enumerate(AtualizarCatalogo(catalogo, lista)):
+            n_cache += do_cache
+            if isinstance(dados, Exception):
+                feedback.pushInfo(self.tr('Problem opening the file: {}'.format(file_path), 'Problema para abrir o arquivo: {}'.format(file_path)))
+                continue
+            prj, ulx, xres, xskew, uly, yskew, yres, cols, rows, n_bands, tipo = dados
 
             # CRS transformation
-            coordinateTransformer = QgsCoordinateTransform()
-            coordinateTransformer.setDestinationCrs(crs)
-            coordinateTransformer.setSourceCrs(CRS)
-            geom_transf = self.reprojectPoints(geom, coordinateTransformer)
+            if prj not in sistemas:
+                CRS= QgsCoordinateReferenceSystem(prj) # Create CRS
+                coordinateTransformer = QgsCoordinateTransform()
+                coordinateTransformer.setDestinationCrs(crs)
+                coordinateTransformer.setSourceCrs(CRS)
+                sistemas[prj] = (CRS.description(), coordinateTransformer)
+            descricao, coordinateTransformer = sistemas[prj]
+            geom_transf = self.reprojectPoints(Contorno(dados), coordinateTransformer)
 
             # Attributes
             path, file = os.path.split(file_path)
@@ -281,9 +292,9 @@ class InventoryRaster(QgsProcessingAlgorithm):
                    abs(yres),
                    cols,
                    rows,
-                   CRS.description(),
+                   descricao,
                    n_bands,
-                   gdal.GetDataTypeName(GDT)]
+                   tipo]
 
             # Saving feature
             feat = QgsFeature()
@@ -294,6 +305,9 @@ class InventoryRaster(QgsProcessingAlgorithm):
             if feedback.isCanceled():
                 break
             feedback.setProgress(int((current+1) * total))
+        catalogo.close()
+        if usar_cache:
+            feedback.pushInfo(self.tr('Files read from the catalogue: {}', 'Arquivos lidos do catálogo: {}').format(n_cache))
 
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
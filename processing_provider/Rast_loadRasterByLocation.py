@@ -35,6 +35,7 @@ from qgis.core import (QgsProcessing,
                        QgsProcessingParameterMultipleLayers,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterRasterLayer,
+                       QgsSpatialIndex,
                        QgsProcessingParameterFile,
                        QgsFeatureRequest,
                        QgsExpression,
@@ -50,6 +51,7 @@ from qgis.core import (QgsProcessing,
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.cartography import reprojectPoints
+from lftools.geocapt.catalogo import AbrirCatalogo, AtualizarCatalogo, RastersNaArea, Contorno
 import os, shutil
 import numpy as np
 from qgis.PyQt.QtGui import QIcon
@@ -115,6 +117,7 @@ class LoadRasterByLocation(QgsProcessingAlgorithm):
     SUBFOLDER = 'SUBFOLDER'
     FORMAT = 'FORMAT'
     INPUT = 'INPUT'
+    CACHE = 'CACHE'
     OUTPUTFOLDER = 'OUTPUTFOLDER'
 
     def initAlgorithm(self, config=None):
@@ -152,6 +155,14 @@ class LoadRasterByLocation(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.CACHE,
+                self.tr('Keep a footprint catalogue in the folder (only new or changed files are opened again)', 'Manter catálogo das áreas de cobertura na pasta (apenas arquivos novos ou alterados são abertos novamente)'),
+                defaultValue = True
+            )
+        )
+
         # OUTPUT
         self.addParameter(
             QgsProcessingParameterFile(
@@ -194,6 +205,12 @@ class LoadRasterByLocation(QgsProcessingAlgorithm):
             raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
         crs = source.sourceCrs()
 
+        usar_cache = self.parameterAsBool(
+            parameters,
+            self.CACHE,
+            context
+        )
+
         # Copiar arquivos selecionados
         saida = self.parameterAsFile(
             parameters,
@@ -216,48 +233,73 @@ class LoadRasterByLocation(QgsProcessingAlgorithm):
 
         total = 100.0 / len(lista) if len(lista)>0 else 0
 
-        # Verify raster to be loaded
+        # Catálogo das áreas de cobertura (apenas arquivos novos ou alterados são abertos)
         feedback.pushInfo(self.tr('Verifying raster files...', 'Verificando arquivos raster...'))
+        catalogo = AbrirCatalogo(pasta if usar_cache else None)
+        n_cache = 0
+        rasters = {}
+        for current, (_, file_path, dados, do_cache) in enumerate(AtualizarCatalogo(catalogo, lista)):
+            n_cache += do_cache
+            if isinstance(dados, Exception):
+                feedback.pushInfo(self.tr('Problem opening the file: {}'.format(file_path), 'Problema para abrir o arquivo: {}'.format(file_path)))
+            else:
+                rasters[file_path] = dados
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((current+1) * total))
+        if usar_cache:
+            feedback.pushInfo(self.tr('Files read from the catalogue: {}', 'Arquivos lidos do catálogo: {}').format(n_cache))
+
+        # Feições da camada vetorial e rasters candidatos (índice do catálogo, em WGS84)
+        feicoes = {}
+        index = QgsSpatialIndex()
+        candidatos = set()
+        xform_geo = QgsCoordinateTransform(crs, QgsCoordinateReferenceSystem('EPSG:4326'), QgsProject.instance())
+        for feat in source.getFeatures():
+            if not feat.hasGeometry():
+                continue
+            feicoes[feat.id()] = feat.geometry()
+            index.addFeature(feat)
+            if crs.isValid():
+                try:
+                    candidatos.update(RastersNaArea(catalogo, xform_geo.transformBoundingBox(feat.geometry().boundingBox())))
+                    continue
+                except Exception:
+                    pass
+            candidatos.update(rasters) # sem SRC: todos os rasters são verificados
+        catalogo.close()
+
+        # Verificação da interseção das áreas de cobertura com as feições
         selecao = []
-        for current, file_path in enumerate(lista):
-            try:
-                image = gdal.Open(file_path)
-                prj = image.GetProjection() # wkt
-                ulx, xres, xskew, uly, yskew, yres = image.GetGeoTransform()
-                cols = image.RasterXSize # Number of columns
-                rows = image.RasterYSize # Number of rows
-                image=None # Close image
-
-                # Creating BBox
-                coord = [[QgsPointXY(ulx, uly),
-                          QgsPointXY(ulx+cols*xres, uly),
-                          QgsPointXY(ulx+cols*xres, uly+rows*yres),
-                          QgsPointXY(ulx, uly+rows*yres),
-                          QgsPointXY(ulx, uly)]]
-                geom = QgsGeometry.fromPolygonXY(coord)
-
-                # CRS transformation
-                CRS= QgsCoordinateReferenceSystem(prj) # Create image CRS
+        transformadores = {}
+        for file_path in lista:
+            if file_path not in candidatos or file_path not in rasters:
+                continue
+            dados = rasters[file_path]
+            # CRS transformation
+            if dados[0] not in transformadores:
                 coordinateTransformer = QgsCoordinateTransform()
                 coordinateTransformer.setDestinationCrs(crs)
-                coordinateTransformer.setSourceCrs(CRS)
-                geom_transf = reprojectPoints(geom, coordinateTransformer)
-
-                for feat in source.getFeatures():
-                    if geom_transf.intersects(feat.geometry()):
-                        selecao += [file_path]
-                        break
-
-                if saida and os.path.exists(saida):
-                    for caminho in selecao:
-                        head, tail = os.path.split(caminho)
-                        shutil.copy2(caminho, os.path.join(saida, tail))
+                coordinateTransformer.setSourceCrs(QgsCoordinateReferenceSystem(dados[0])) # Create image CRS
+                transformadores[dados[0]] = coordinateTransformer
+            try:
+                geom_transf = reprojectPoints(Contorno(dados), transformadores[dados[0]])
             except:
                 feedback.pushInfo(self.tr('Problem opening the file: {}'.format(file_path), 'Problema para abrir o arquivo: {}'.format(file_path)))
-
+                continue
+            for fid in index.intersects(geom_transf.boundingBox()):
+                if geom_transf.intersects(feicoes[fid]):
+                    selecao += [file_path]
+                    break
             if feedback.isCanceled():
                 break
-            feedback.setProgress(int((current+1) * total))
+        feedback.pushInfo(self.tr('Selected rasters: {}', 'Rasters selecionados: {}').format(len(selecao)))
+
+        # Copiar arquivos selecionados
+        if saida and os.path.exists(saida):
+            for caminho in selecao:
+                head, tail = os.path.split(caminho)
+                shutil.copy2(caminho, os.path.join(saida, tail))
 
         self.LISTA = selecao
         self.FORMATO = formato
@@ -45,16 +45,16 @@ from qgis.core import (QgsProcessing,
                        QgsProject,
                        QgsRasterLayer,
                        QgsCoordinateTransform,
+                       QgsSpatialIndex,
                        QgsCoordinateReferenceSystem)
 
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
-from itertools import combinations
-from matplotlib import path
 import numpy as np
 from pyproj.crs import CRS
 from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import Interpolar
+from lftools.geocapt.dip import InterpolarPixels, PIXELS_POR_LOTE, ClassesSobreposicao, MascaraPoligono
+from lftools.geocapt.paralelo import ExecutorProcessos
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -118,6 +118,7 @@ class MosaicRaster(QgsProcessingAlgorithm):
     NULLVALUE = 'NULLVALUE'
     RESAMPLING = 'RESAMPLING'
     FRAME = 'FRAME'
+    WORKERS = 'WORKERS'
     MOSAIC = 'MOSAIC'
     OPEN = 'OPEN'
 
@@ -188,6 +189,16 @@ class MosaicRaster(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.WORKERS,
+                self.tr('Number of parallel processes', 'Número de processos paralelos'),
+                type =0, #Double = 1 and Integer = 0
+                defaultValue = 1,
+                minValue = 1
+            )
+        )
+
         # OUTPUT
         self.addParameter(
             QgsProcessingParameterFileDestination(
@@ -249,6 +260,12 @@ class MosaicRaster(QgsProcessingAlgorithm):
             context
         )
 
+        n_processos = self.parameterAsInt(
+            parameters,
+            self.WORKERS,
+            context
+        )
+
         # output
 
         Output = self.parameterAsFileOutput(
@@ -391,137 +408,60 @@ class MosaicRaster(QgsProcessingAlgorithm):
         origem = (ulx, uly)
         resol_X = abs(xres)
         resol_Y = abs(yres)
-        # Numeração das Imagens
-        valores = list(range(1,len(lista)+1))
 
         # Definição de áreas de varredura
         feedback.pushInfo(self.tr('Defining mosaic filling areas...', 'Definindo áreas de preenchimento do mosaico...'))
 
-        # Gerar combinações dos Rasters
-        if sobrep != 0:
-            combs = []
-            feedback.pushInfo(self.tr('Creating combinations...', 'Gerando combinações...'))
-            for k in range(1,5):
-                combs += list(combinations(valores,k))
-                if feedback.isCanceled():
-                    break
-            # Armazenar geometrias exclusivas de cada combinação
-            classes = {}
-            feedback.pushInfo(self.tr('Indentifying combinations...', 'Identificando combinações...'))
-            Percent = 100.0/(len(combs))
-            current = 0
+        # Índice espacial das extensões dos rasters
+        indice = QgsSpatialIndex()
+        for k, geom in enumerate(geoms):
+            indice.addFeature(k, geom.boundingBox())
 
-            for comb in combs:
-                if len(comb)==1:
-                    geom1 = geoms[comb[0]-1]
-                    lista_outras = []
-                    for geom in geoms:
-                        if geom1 != geom:
-                            lista_outras += [geom]
-                    outras = QgsGeometry()
-                    outras = outras.unaryUnion(lista_outras)
-                    diferença = geom1.difference(outras)
-                    if not diferença.isEmpty():
-                        classes[comb] = {'geom': diferença}
-                elif len(comb) < len(valores):
-                    intersecao = geoms[comb[0]-1]
-                    sentinela = True
-                    for ind in comb[1:]:
-                        geom = geoms[ind-1]
-                        if geom.intersects(intersecao):
-                            intersecao = intersecao.intersection(geom)
-                        else:
-                            sentinela = False
-                            continue
-                    lista_outras = []
-                    for valor in valores:
-                        if valor not in comb:
-                            lista_outras += [geoms[valor-1]]
-                    outras = QgsGeometry()
-                    outras = outras.unaryUnion(lista_outras)
-                    if sentinela:
-                        diferença = intersecao.difference(outras)
-                        if not diferença.isEmpty():
-                            classes[comb] = {'geom': diferença}
-                else:
-                    intersecao = geoms[comb[0]-1]
-                    sentinela = True
-                    for ind in comb[1:]:
-                        geom = geoms[ind-1]
-                        if geom.intersects(intersecao):
-                            intersecao = intersecao.intersection(geom)
-                        else:
-                            sentinela = False
-                            continue
-                    if sentinela:
-                        classes[comb] = {'geom': intersecao}
-                if feedback.isCanceled():
-                    break
-                current += 1
-                feedback.setProgress(int(current * Percent))
-        else:
-            # Gerar geometrias por área sem cálculo de sobreposição ("first")
-            combs = np.array(valores)[:,np.newaxis]
-            classes = {}
-            acumulado = geoms[combs[0][0]-1]
-            classes[(1,)] = {'geom': acumulado}
-            for k in range(1, len(combs)):
-                comb = combs[k]
-                geom = geoms[comb[0]-1]
-                diferenca = geom.difference(acumulado)
-                classes[(comb[0],)] = {'geom': diferenca}
-                acumulado = acumulado.combine(geom)
-                if feedback.isCanceled():
-                    break
+        # Retângulo de cada raster na grade do mosaico (pixels com centro dentro da extensão)
+        retangulos = []
+        vizinhos = []
+        for k, geom in enumerate(geoms):
+            box = geom.boundingBox()
+            lin_ini = floor((origem[1] - box.yMaximum())/resol_Y - 0.5) + 1
+            lin_fim = ceil((origem[1] - box.yMinimum())/resol_Y - 0.5)
+            col_ini = floor((box.xMinimum() - origem[0])/resol_X - 0.5) + 1
+            col_fim = ceil((box.xMaximum() - origem[0])/resol_X - 0.5)
+            retangulos += [(min(max(lin_ini, 0), n_lin), min(max(lin_fim, 0), n_lin),
+                            min(max(col_ini, 0), n_col), min(max(col_fim, 0), n_col))]
+            vizinhos += [indice.intersects(box)]
+            if feedback.isCanceled():
+                break
 
-        # Gerar lista com os valores classificados
-        Percent = 100.0/(len(classes))
-        current = 0
-        cont_px = 0
-        for classe in classes:
-            feedback.pushInfo((self.tr('Classifying class {}...', 'Classificando classe {}...')).format(str(classe)))
-            geom = classes[classe]['geom']
-            if vlayer:
-                geom = geom.intersection(moldura_geom)
-            if geom.type() == 2:
-                if geom.isMultipart():
-                    coords = geom.asMultiPolygon()[0][0]
-                else:
-                    coords = geom.asPolygon()[0]
+        # Classes de sobreposição por arranjo planar dos retângulos vizinhos
+        # ("first": cada pixel é da primeira imagem que o cobre)
+        feedback.pushInfo(self.tr('Indentifying combinations...', 'Identificando combinações...'))
+        classes = ClassesSobreposicao(retangulos, vizinhos, sobrep == 0)
+
+        # Recortar pelos polígonos da moldura
+        if vlayer:
+            mascara = np.zeros((n_lin, n_col), dtype=bool)
+            if moldura_geom.isMultipart():
+                poligonos = moldura_geom.asMultiPolygon()
             else:
-                del classes[classe]
-                continue
-            caminho = []
-            for ponto in coords:
-                linha = (origem[1]-ponto.y())/resol_Y
-                coluna = (ponto.x() - origem[0])/resol_X
-                caminho += [(linha, coluna)]
-            p = path.Path(caminho)
-            box = geom.boundingBox()
-            uly = box.yMaximum()
-            lry = box.yMinimum()
-            ulx = box.xMinimum()
-            lrx = box.xMaximum()
-            # Limites de Varredura
-            row_ini = int(round((origem[1]-uly)/resol_Y - 0.5))-1
-            row_fim = int(round((origem[1]-lry)/resol_Y - 0.5))+1
-            col_ini = int(round((ulx - origem[0])/resol_X - 0.5))-1
-            col_fim = int(round((lrx - origem[0])/resol_X - 0.5))+1
-            lin, col = np.meshgrid(np.arange(row_ini, row_fim),np.arange(col_ini, col_fim))
-            LIN = lin.flatten()[:,np.newaxis]
-            COL = col.flatten()[:,np.newaxis]
-            pixels_center = np.hstack((LIN + 0.5, COL + 0.5)) # centro do pixel
-            # Verificando pixels dentro de poligono
-            flags = p.contains_points(pixels_center)
-            pixels_x = (LIN+1).flatten()*flags # soma e subtrair 1 para evitar zero
-            pixels_y = (COL+1).flatten()*flags
-            pixels_x = (pixels_x[pixels_x>0]-1)[:,np.newaxis]
-            pixels_y = (pixels_y[pixels_y>0]-1)[:,np.newaxis]
-            pixels = np.hstack((pixels_x, pixels_y))
-            classes[classe]['pixels'] = pixels
-            cont_px += len(pixels)
-            current += 1
-            feedback.setProgress(int(current * Percent))
+                poligonos = [moldura_geom.asPolygon()]
+            for poligono in poligonos:
+                for k, anel in enumerate(poligono):
+                    recorte, lin_min, col_min = MascaraPoligono(anel, origem, resol_X, resol_Y, n_lin, n_col)
+                    janela = mascara[lin_min:lin_min+recorte.shape[0], col_min:col_min+recorte.shape[1]]
+                    if k == 0: # anel externo
+                        janela |= recorte
+                    else: # buracos
+                        janela &= ~recorte
+            for classe in list(classes):
+                pixels = classes[classe]
+                pixels = pixels[mascara[pixels[:,0], pixels[:,1]]]
+                if len(pixels):
+                    classes[classe] = pixels
+                else:
+                    del classes[classe]
+            mascara = None
+        cont_px = sum([len(classes[classe]) for classe in classes])
+        feedback.pushInfo(self.tr('Number of classes: {}'.format(len(classes)), 'Número de classes: {}'.format(len(classes))))
 
         # Criar Raster
         Driver = gdal.GetDriverByName('GTiff').Create(Output, n_col, n_lin, n_bands, GDT)
@@ -529,104 +469,73 @@ class MosaicRaster(QgsProcessingAlgorithm):
         Driver.SetProjection(prj)
 
 
-        # Mosaicar por banda
-        Percent = 100.0/(cont_px*n_bands)
-        current = 0
-
-        for k in range(n_bands):
-            feedback.pushInfo((self.tr('Creating band {}...', 'Criando banda {}...')).format(str(k+1)))
-            # Criar Array do mosaico
-            tipo = gdal_array.GDALTypeCodeToNumericTypeCode(GDT)
-            inteiro = True if GDT in (gdal.GDT_Byte,
-                                      gdal.GDT_UInt16,
-                                      gdal.GDT_Int16,
-                                      gdal.GDT_UInt32,
-                                      gdal.GDT_Int32) else False
-            banda = np.ones((n_lin,n_col), dtype = tipo) * (int(valor_nulo) if inteiro else valor_nulo)
-            imgs = {}
-            # Para cada classe abrir banda da(s) imagem(ns)
-            for classe in classes:
-                # Deixando somente imagens a serem utilizadas
-                for item in valores:
-                    if (item not in classe) and (item in imgs):
-                        del imgs[item]
-                # Preenchendo dados da imagem no dicionário
-                for img in classe:
-                    if img not in imgs or len(lista) == 1:
-                        img_path = lista[img-1]
-                        image = gdal.Open(img_path)
-                        ulx, xres, xskew, uly, yskew, yres  = image.GetGeoTransform()
-                        img_origem = (ulx, uly)
-                        img_resol_X = abs(xres)
-                        img_resol_Y = abs(yres)
-                        img_band = image.GetRasterBand(k+1).ReadAsArray()
-                        imgs[img] = {'band': img_band,
-                                     'xres': img_resol_X,
-                                     'yres': img_resol_Y,
-                                     'origem': img_origem }
-                        image = None
-
-                if sobrep == 0: # Se for "primeiro", interpolar apenas da primeira img da comb, caso contrário
-                    img = classe[0]
-                    # Para cada pixel da classe
-                    for px in classes[classe]['pixels']:
-                        lin,col = px
-                        X = origem[0] + resol_X*(col + 0.5)
-                        Y = origem[1] - resol_Y*(lin + 0.5)
-                        Interpolado = Interpolar(X, Y,
-                                                imgs[img]['band'],
-                                                imgs[img]['origem'],
-                                                imgs[img]['xres'],
-                                                imgs[img]['yres'],
-                                                reamostragem,
-                                                valor_nulo)
-                        if Interpolado != valor_nulo:
-                            banda[lin][col] = round(Interpolado) if inteiro else Interpolado
-
-                        if feedback.isCanceled():
-                            break
-                        current += 1
-                        feedback.setProgress(int(current * Percent))
-
-                else: # Para cada pixel da classe interpolar o valor da banda de cada img
-                    for px in classes[classe]['pixels']:
-                        lin,col = px
-                        X = origem[0] + resol_X*(col + 0.5)
-                        Y = origem[1] - resol_Y*(lin + 0.5)
-                        interp_values = []
-                        for img in imgs:
-                            Interpolado = Interpolar(X, Y,
-                                                     imgs[img]['band'],
-                                                     imgs[img]['origem'],
-                                                     imgs[img]['xres'],
-                                                     imgs[img]['yres'],
-                                                     reamostragem,
-                                                     valor_nulo)
-                            if Interpolado != valor_nulo:
-                                interp_values += [Interpolado]
-                        # Calcular o valor agregado (0:first, 1:average, 2:median, 3:min, 4:max) e inserir na banda (se byte, arredondar)
-                        if interp_values:
-                            if sobrep == 1:
-                                result = np.mean(interp_values)
-                            elif sobrep == 2:
-                                result = np.median(interp_values)
-                            elif sobrep == 3:
-                                result = np.min(interp_values)
-                            elif sobrep == 4:
-                                result = np.max(interp_values)
-                            banda[lin][col] = round(result) if inteiro else result
-
-                        if feedback.isCanceled():
-                            break
-                        current += 1
-                        feedback.setProgress(int(current * Percent))
-
-            # Salvar banda
-            outband = Driver.GetRasterBand(k+1)
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(k+1), 'Escrevendo Banda {}...'.format(k+1)))
-            outband.WriteArray(banda)
-            if NULO != -1:
-                outband.SetNoDataValue(valor_nulo)
+        # Tarefas de interpolação: pixels de cada classe divididos em lotes
+        tarefas = []
+        for classe in classes:
+            pixels = classes[classe]
+            imagens = [lista[img-1] for img in (classe[:1] if sobrep == 0 else classe)]
+            for ini in range(0, len(pixels), PIXELS_POR_LOTE):
+                tarefas += [(imagens, pixels[ini:ini+PIXELS_POR_LOTE])]
+        # Imagens abertas por esta execução (os processos paralelos têm o seu próprio cache)
+        rasters = {}
+        executor = None
+        if n_processos > 1:
+            feedback.pushInfo(self.tr('Interpolating with {} parallel processes...'.format(n_processos), 'Interpolando com {} processos paralelos...'.format(n_processos)))
+            executor = ExecutorProcessos(n_processos)
+
+        try:
+            # Mosaicar por banda
+            Percent = 100.0/(cont_px*n_bands) if cont_px else 0
+            current = 0
+
+            for k in range(n_bands):
+                feedback.pushInfo((self.tr('Creating band {}...', 'Criando banda {}...')).format(str(k+1)))
+                # Criar Array do mosaico
+                tipo = gdal_array.GDALTypeCodeToNumericTypeCode(GDT)
+                inteiro = True if GDT in (gdal.GDT_Byte,
+                                          gdal.GDT_UInt16,
+                                          gdal.GDT_Int16,
+                                          gdal.GDT_UInt32,
+                                          gdal.GDT_Int32) else False
+                banda = np.ones((n_lin,n_col), dtype = tipo) * (int(valor_nulo) if inteiro else valor_nulo)
+                # Interpolar os lotes de pixels de cada classe a partir da(s) imagem(ns) da classe
+                # (0:first, 1:average, 2:median, 3:max, 4:min) - resultados na ordem das tarefas
+                argumentos = [[imagens for imagens, pixels in tarefas],
+                              [k+1]*len(tarefas),
+                              [pixels[:,0] for imagens, pixels in tarefas],
+                              [pixels[:,1] for imagens, pixels in tarefas],
+                              [origem]*len(tarefas),
+                              [resol_X]*len(tarefas),
+                              [resol_Y]*len(tarefas),
+                              [reamostragem]*len(tarefas),
+                              [valor_nulo]*len(tarefas),
+                              [sobrep]*len(tarefas)]
+                if n_processos > 1:
+                    resultados = executor.map(InterpolarPixels, *argumentos)
+                else:
+                    resultados = map(InterpolarPixels, *argumentos, [rasters]*len(tarefas))
+                for (imagens, pixels), Interpolado in zip(tarefas, resultados):
+                    validos = ~np.isnan(Interpolado)
+                    lin = pixels[validos,0]
+                    col = pixels[validos,1]
+                    banda[lin, col] = np.round(Interpolado[validos]) if inteiro else Interpolado[validos]
+                    if feedback.isCanceled():
+                        break
+                    current += len(pixels)
+                    feedback.setProgress(int(current * Percent))
+
+                # Salvar banda
+                outband = Driver.GetRasterBand(k+1)
+                feedback.pushInfo(self.tr('Writing Band {}...'.format(k+1), 'Escrevendo Banda {}...'.format(k+1)))
+                outband.WriteArray(banda)
+                if NULO != -1:
+                    outband.SetNoDataValue(valor_nulo)
+                if feedback.isCanceled():
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown(wait = True, cancel_futures = True)
+            rasters.clear() # Fechar imagens
 
         # Salvar e Fechar Raster
         Driver.FlushCache()   # Escrever no disco
@@ -50,6 +50,7 @@ from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from math import floor, ceil
 import numpy as np
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import BlocosRaster
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -232,26 +233,75 @@ class RescaleTo8bits(QgsProcessingAlgorithm):
         Driver.SetGeoTransform(geotransform)
         Driver.SetProjection(CRS.ExportToWkt())
 
-        bands = []
+        # Estatísticas por blocos (memória limitada)
+        janelas = BlocosRaster(image)
+        inteiro = GDT in (gdal.GDT_Byte, gdal.GDT_UInt16, gdal.GDT_Int16, gdal.GDT_UInt32, gdal.GDT_Int32)
+        Percent = 100.0/(len(janelas)*n_bands*(3 if tipo == 1 else 2))
+        current = 0
         max,min = [],[]
         for k in range(n_bands):
-            band = image.GetRasterBand(k+1).ReadAsArray()
-            bands += [band]
-            # Remove null pixels of the statistics
-            if Pixel_Nulo:
-                band = band[band != Pixel_Nulo]
+            feedback.pushInfo(self.tr('Calculating statistics of band {}...'.format(k+1), 'Calculando estatísticas da banda {}...'.format(k+1)))
+            inband = image.GetRasterBand(k+1)
+            cont, media, M2 = 0, 0.0, 0.0
+            b_max, b_min = -np.inf, np.inf
+            for xoff, yoff, xsize, ysize in janelas:
+                band = inband.ReadAsArray(xoff, yoff, xsize, ysize)
+                # Remove null pixels of the statistics
+                if Pixel_Nulo:
+                    band = band[band != Pixel_Nulo]
+                current += 1
+                feedback.setProgress(int(current * Percent))
+                n = band.size
+                if n == 0:
+                    continue
+                b_max = np.maximum(b_max, band.max())
+                b_min = np.minimum(b_min, band.min())
+                # Média e soma dos quadrados dos desvios (atualização por blocos)
+                if tipo == 2:
+                    m = band.mean()
+                    delta = m - media
+                    M2 += ((band - m)**2).sum() + delta**2*cont*n/(cont + n)
+                    media += delta*n/(cont + n)
+                cont += n
             # Max e Min
             if tipo == 0:
-                max += [band.max()]
-                min += [band.min()]
+                max += [b_max]
+                min += [b_min]
             # Quantile (2% - 98%)
             if tipo == 1:
-                max += [np.quantile(band,0.98)]
-                min += [np.quantile(band,0.02)]
+                # Contagem exata dos valores inteiros ou histograma fino para reais
+                if inteiro and b_max - b_min < 2**24:
+                    contagem = np.zeros(int(b_max - b_min) + 1, dtype='int64')
+                    valores = np.arange(len(contagem)) + b_min
+                else:
+                    contagem = np.zeros(2**16, dtype='int64')
+                    bordas = np.linspace(b_min, b_max, len(contagem) + 1)
+                    valores = (bordas[:-1] + bordas[1:])/2
+                for xoff, yoff, xsize, ysize in janelas:
+                    band = inband.ReadAsArray(xoff, yoff, xsize, ysize)
+                    if Pixel_Nulo:
+                        band = band[band != Pixel_Nulo]
+                    if inteiro and b_max - b_min < 2**24:
+                        contagem += np.bincount((band - b_min).astype('int64').ravel(), minlength=len(contagem))
+                    else:
+                        contagem += np.histogram(band, bins=bordas)[0]
+                    current += 1
+                    feedback.setProgress(int(current * Percent))
+                acumulado = np.cumsum(contagem)
+                quantis = []
+                for q in (0.98, 0.02):
+                    h = (cont - 1)*q
+                    ind = int(np.floor(h))
+                    v1 = valores[np.searchsorted(acumulado, ind, side='right')]
+                    v2 = valores[np.searchsorted(acumulado, ind + 1 if ind + 1 < cont else ind, side='right')]
+                    quantis += [v1 + (h - ind)*(v2 - v1)]
+                max += [quantis[0]]
+                min += [quantis[1]]
             # Media ± 2*DesvPad
             if tipo == 2:
-                max += [band.mean() + 2*band.std()]
-                min += [band.mean() - 2*band.std()]
+                desvio = np.sqrt(M2/cont)
+                max += [media + 2*desvio]
+                min += [media - 2*desvio]
 
         if not porBanda:
             Max = np.max(max)
@@ -259,23 +309,29 @@ class RescaleTo8bits(QgsProcessingAlgorithm):
 
         # Rescale and save bands
         for k in range(n_bands):
-            band = bands[k]
+            inband = image.GetRasterBand(k+1)
             if porBanda:
                 Max = max[k]
                 Min = min[k]
-            if nullPixel:
-                transf = (255*(band.astype('float')- Min)/(Max-Min) + 0.5).round()
-            else:
-                transf = (256*(band.astype('float')- Min)/(Max-Min) - 0.5).round()
-            if tipo in [1,2]:
-                transf = ((transf>0)*(transf<=255))*transf + 255*(transf>255)
-                if nullPixel:
-                    transf = transf*(band != Pixel_Nulo)
-
-            transf = transf.astype('uint8')
             outband = Driver.GetRasterBand(k+1)
             feedback.pushInfo(self.tr('Writing Band {}...'.format(k+1), 'Escrevendo Banda {}...'.format(k+1)))
-            outband.WriteArray(transf)
+            for xoff, yoff, xsize, ysize in janelas:
+                band = inband.ReadAsArray(xoff, yoff, xsize, ysize)
+                if nullPixel:
+                    transf = (255*(band.astype('float')- Min)/(Max-Min) + 0.5).round()
+                else:
+                    transf = (256*(band.astype('float')- Min)/(Max-Min) - 0.5).round()
+                if tipo in [1,2]:
+                    transf = ((transf>0)*(transf<=255))*transf + 255*(transf>255)
+                    if nullPixel:
+                        transf = transf*(band != Pixel_Nulo)
+
+                transf = transf.astype('uint8')
+                outband.WriteArray(transf, xoff, yoff)
+                if feedback.isCanceled():
+                    break
+                current += 1
+                feedback.setProgress(int(current * Percent))
             if nullPixel:
                 outband.SetNoDataValue(0)
 
@@ -47,7 +47,7 @@ from qgis.core import (QgsProcessing,
 
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import rgb2hsv
+from lftools.geocapt.dip import rgb2hsv, BlocosRaster
 import numpy as np
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -190,54 +190,44 @@ class RGB2HSV(QgsProcessingAlgorithm):
             context
         )
 
-        # Abrir Raster layer como array
+        # Abrir Raster layer
         image = gdal.Open(RasterIN)
         prj=image.GetProjection()
         geotransform = image.GetGeoTransform()
         num_bands = image.RasterCount
         if num_bands not in (3,4):
             raise QgsProcessingException(self.tr('The raster layer must have 3 (RGB) or 4 bands (RGBA)!','A camada raster deve ter 3 (RGB) ou 4 bandas (RGBA)!'))
-        bandas = []
-        for b in range(num_bands):
-            bandas += [image.GetRasterBand(b+1).ReadAsArray()]
-        rgb = np.dstack((bandas[0], bandas[1] ,bandas[2]))
         cols = image.RasterXSize
         rows = image.RasterYSize
-        # Origem e resolucao da imagem
-        ulx, xres, xskew, uly, yskew, yres  = image.GetGeoTransform()
-        origem = (ulx, uly)
-        resol_X = abs(xres)
-        resol_Y = abs(yres)
-        image=None # Fechar imagem
 
-        # Transformação
-        HSV = rgb2hsv(rgb)
+        # Criar rasters de saída (H, S e V)
+        saidas = []
+        for arquivo in [hue, sat, val]:
+            img = gdal.GetDriverByName('GTiff').Create(arquivo, cols, rows, 1, gdal.GDT_Float32)
+            img.SetGeoTransform(geotransform)
+            img.SetProjection(prj)
+            saidas += [img]
+
+        # Transformação por blocos
+        janelas = BlocosRaster(image)
+        Percent = 100.0/len(janelas)
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            bandas = []
+            for b in range(3):
+                bandas += [image.GetRasterBand(b+1).ReadAsArray(xoff, yoff, xsize, ysize)]
+            rgb = np.dstack((bandas[0], bandas[1] ,bandas[2]))
+            HSV = rgb2hsv(rgb)
+            for k, img in enumerate(saidas):
+                img.GetRasterBand(1).WriteArray(HSV[:,:,k], xoff, yoff)
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((index+1) * Percent))
+        image=None # Fechar imagem
 
         # Salvando Resultados
-        img = gdal.GetDriverByName('GTiff').Create(hue, cols, rows, 1, gdal.GDT_Float32)
-        img.SetGeoTransform(geotransform)
-        img.SetProjection(prj)
-        banda = img.GetRasterBand(1)
-        banda.WriteArray(HSV[:,:,0])
-        img.FlushCache()
-        img = None
-
-        S = HSV[:,:,1]
-        img = gdal.GetDriverByName('GTiff').Create(sat, cols, rows, 1, gdal.GDT_Float32)
-        img.SetGeoTransform(geotransform)
-        img.SetProjection(prj)
-        banda = img.GetRasterBand(1)
-        banda.WriteArray(HSV[:,:,1])
-        img.FlushCache()
-        img = None
-
-        V = HSV[:,:,2]
-        img = gdal.GetDriverByName('GTiff').Create(val, cols, rows, 1, gdal.GDT_Float32)
-        img.SetGeoTransform(geotransform)
-        img.SetProjection(prj)
-        banda = img.GetRasterBand(1)
-        banda.WriteArray(HSV[:,:,2])
-        img.FlushCache()
+        for img in saidas:
+            img.FlushCache()
+        img = saidas = None # Salvar e fechar
 
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
@@ -48,7 +48,7 @@ from qgis.core import (QgsProcessing,
 
 from math import floor, ceil
 from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
-from matplotlib import path
+from lftools.geocapt.dip import MascaraPoligono, BlocosRaster
 import numpy as np
 from lftools.geocapt.imgs import Imgs
 import os
@@ -246,9 +246,6 @@ class SupervisedClassification(QgsProcessingAlgorithm):
         n_bands = image.RasterCount
         if n_bands < 2:
             raise QgsProcessingException(self.tr('The raster layer must have more than 1 band!', 'A camada raster deve ter mais de 1 banda!'))
-        bandas = []
-        for k in range(n_bands):
-            bandas += [image.GetRasterBand(k+1).ReadAsArray()]
         Pixel_Nulo = image.GetRasterBand(1).GetNoDataValue()
         if Pixel_Nulo == None:
             Pixel_Nulo = 0
@@ -262,7 +259,6 @@ class SupervisedClassification(QgsProcessingAlgorithm):
         lrx = ulx + (cols * xres)
         lry = uly + (rows * yres)
         bbox = [ulx, lrx, lry, uly]
-        image=None # Fechar imagem
 
         # Transformação de coordenadas
         crsSrc = layer.sourceCrs()
@@ -289,52 +285,15 @@ class SupervisedClassification(QgsProcessingAlgorithm):
                 poly = geom.asMultiPolygon()[0][0]
             else:
                 poly = geom.asPolygon()[0]
-            caminho = []
-            lin_min = 1e8
-            col_min = 1e8
-            lin_max = -1e8
-            col_max = -1e8
-            for ponto in poly:
-                linha = (origem[1]-ponto.y())/resol_Y
-                if linha > lin_max:
-                    lin_max = linha
-                if linha < lin_min:
-                    lin_min = linha
-                coluna = (ponto.x() - origem[0])/resol_X
-                if coluna > col_max:
-                    col_max = coluna
-                if coluna < col_min:
-                    col_min = coluna
-                caminho += [(linha, coluna)]
-            p = path.Path(caminho)
-            lin_min = int(np.floor(lin_min))
-            lin_max = int(np.floor(lin_max))
-            col_min = int(np.floor(col_min))
-            col_max = int(np.floor(col_max))
-            nx, ny = (lin_max-lin_min+1, col_max-col_min+1)
-            lin = np.linspace(lin_min, lin_max, nx)
-            col = np.linspace(col_min, col_max, ny)
-            COL, LIN = np.meshgrid(col, lin)
-            recorte = np.zeros((int(nx), int(ny)), dtype=bool)
-            for x in range(int(nx)):
-                for y in range(int(ny)):
-                    pixel = (LIN[x][y]+0.5, COL[x][y]+0.5) # 0.5 eh o centro do pixel
-                    contem = p.contains_points([pixel])
-                    recorte[x][y] = contem[0]
+            recorte, lin_min, col_min = MascaraPoligono(poly, origem, resol_X, resol_Y, rows, cols)
+            nx, ny = recorte.shape
+            if recorte.size == 0:
+                continue
             # Recorte de cada banda
             for k in range(n_bands):
-                banda = bandas[k]
-                recorte_img = banda[lin_min:lin_max+1, col_min:col_max+1]
-                if np.shape(recorte)!=np.shape(recorte_img):
-                    # chegou no fim do recorte
-                    recorte = recorte[0:np.shape(recorte_img)[0], 0:np.shape(recorte_img)[1]]
-                tam = np.shape(recorte_img)
-                valores = []
-                for x in range(tam[0]):
-                    for y in range(tam[1]):
-                        if recorte[x][y]:
-                            valores += [float(recorte_img[x][y])]
-                dic[code]['valores'][k+1] = dic[code]['valores'][k+1] + valores
+                recorte_img = image.GetRasterBand(k+1).ReadAsArray(col_min, lin_min, ny, nx)
+                valores = recorte_img[recorte].astype('float')
+                dic[code]['valores'][k+1] = np.concatenate((dic[code]['valores'][k+1], valores))
 
         # Cálculo da Média por banda e MVC de cada classe
         ordem = []
@@ -361,106 +320,69 @@ class SupervisedClassification(QgsProcessingAlgorithm):
             ordem += [[np.trace(MVC), code]]
         ordem = sorted(ordem, reverse = True)
 
-        # Varrer imagem e classificar cada pixel
-        img_class = np.zeros((rows, cols), dtype=np.byte)
-        total = 100.0/rows
-
+        # Parâmetros das classes empilhados (classes, bandas, 1)
+        codigos = list(dic.keys())
+        medias = np.array([dic[code]['media'] for code in codigos])
         if metodo == 0: # Paralelepípedo
-            for lin in range(rows):
-                for col in range(cols):
-                    px = []
-                    for k in range(n_bands):
-                        px += [[float(bandas[k][lin][col])]]
-                    px = np.array(px)
-                    classe = None
-                    for item in ordem:
-                        m = dic[item[1]]['media']
-                        s = dic[item[1]]['desvpad']
-                        cond = (m-fator*s < px) * (px < m+fator*s)
-                        if cond.sum() == len(px):
-                            classe = item[1]
-                    if classe:
-                        img_class[lin,col] = classe
-                feedback.setProgress(int((lin+1) * total))
-                if feedback.isCanceled():
-                    break
-
+            ordem_ind = [codigos.index(item[1]) for item in ordem]
+            lim_inf = medias - fator*np.array([dic[code]['desvpad'] for code in codigos])
+            lim_sup = medias + fator*np.array([dic[code]['desvpad'] for code in codigos])
         elif metodo == 1: # Elipsoide
-            for lin in range(rows):
-                for col in range(cols):
-                    px = []
-                    for k in range(n_bands):
-                        px += [[float(bandas[k][lin][col])]]
-                    px = np.array(px)
-                    classe = None
-                    for item in ordem:
-                        m = dic[item[1]]['media']
-                        mvc = dic[item[1]]['mvc']
-                        det = dic[item[1]]['det']
-                        pos = (px - m).T*mvc*(px - m) - det
-                        if pos <= 0:
-                            classe = item[1]
-                    if classe:
-                        img_class[lin,col] = classe
-                feedback.setProgress(int((lin+1) * total))
-                if feedback.isCanceled():
-                    break
-
-        elif metodo == 2: # Distância Euclidiana
-            for lin in range(rows):
-                for col in range(cols):
-                    px = []
-                    for k in range(n_bands):
-                        px += [[float(bandas[k][lin][col])]]
-                    px = np.array(px)
-                    min_dist = 1e9
-                    classe = None
-                    for code in dic:
-                        m = dic[code]['media']
-                        dist = (px - m).T*(px - m)
-                        if dist[0][0] < min_dist:
-                            min_dist = dist[0][0]
-                            classe = code
-                    img_class[lin,col] = classe
-                feedback.setProgress(int((lin+1) * total))
-                if feedback.isCanceled():
-                    break
-
+            ordem_ind = [codigos.index(item[1]) for item in ordem]
+            matrizes = np.array([np.asarray(dic[code]['mvc']) for code in codigos])
+            dets = np.array([dic[code]['det'] for code in codigos])
         elif metodo == 3: # Distância de Mahalanobis
-            for lin in range(rows):
-                for col in range(cols):
-                    px = []
-                    for k in range(n_bands):
-                        px += [[float(bandas[k][lin][col])]]
-                    px = np.array(px)
-                    min_dist = 1e9
-                    classe = None
-                    for code in dic:
-                        m = dic[code]['media']
-                        MVC_inv = dic[code]['MVC_inv']
-                        dist_Mah = (px - m).T*MVC_inv*(px - m)
-                        if dist_Mah[0][0] < min_dist:
-                            min_dist = dist_Mah[0][0]
-                            classe = code
-                    img_class[lin,col] = classe
-                feedback.setProgress(int((lin+1) * total))
-                if feedback.isCanceled():
-                    break
-
-
-        # Salvando Resultado
-        GDT = gdal_array.NumericTypeCodeToGDALTypeCode(img_class.dtype)
+            matrizes = np.array([np.asarray(dic[code]['MVC_inv']) for code in codigos])
+
+        # Criar imagem classificada
+        GDT = gdal_array.NumericTypeCodeToGDALTypeCode(np.dtype(np.byte))
         classified_img = gdal.GetDriverByName('GTiff').Create(Raster_Output, cols, rows, 1, GDT)
         classified_img.SetGeoTransform(geotransform)
         classified_img.SetProjection(prj)
         banda = classified_img.GetRasterBand(1)
-        banda.WriteArray(img_class)
+
+        # Varrer imagem por blocos e classificar os pixels de cada bloco
+        janelas = BlocosRaster(image)
+        total = 100.0/len(janelas)
+        for index, (xoff, yoff, xsize, ysize) in enumerate(janelas):
+            # Matriz (bandas, N) com os pixels do bloco
+            px = np.array([image.GetRasterBand(k+1).ReadAsArray(xoff, yoff, xsize, ysize).astype('float').ravel() for k in range(n_bands)])
+            img_class = np.zeros(px.shape[1], dtype=np.byte)
+
+            if metodo == 0: # Paralelepípedo
+                for ind in ordem_ind:
+                    cond = ((lim_inf[ind] < px) * (px < lim_sup[ind])).all(axis=0)
+                    img_class[cond] = codigos[ind]
+
+            elif metodo == 1: # Elipsoide
+                for ind in ordem_ind:
+                    dif = px - medias[ind]
+                    pos = np.einsum('in,ij,jn->n', dif, matrizes[ind], dif) - dets[ind]
+                    img_class[pos <= 0] = codigos[ind]
+
+            elif metodo in [2,3]: # Distância Euclidiana ou de Mahalanobis
+                min_dist = np.full(px.shape[1], np.inf)
+                for ind, m in enumerate(medias):
+                    dif = px - m
+                    if metodo == 2:
+                        dist = (dif*dif).sum(axis=0)
+                    else:
+                        dist = np.einsum('in,ij,jn->n', dif, matrizes[ind], dif)
+                    menor = dist < min_dist
+                    min_dist[menor] = dist[menor]
+                    img_class[menor] = codigos[ind]
+
+            # Salvando bloco
+            banda.WriteArray(img_class.reshape(ysize, xsize), xoff, yoff)
+            feedback.setProgress(int((index+1) * total))
+            if feedback.isCanceled():
+                break
+
         banda.SetNoDataValue(Pixel_Nulo)
+        image=None # Fechar imagem
         classified_img.FlushCache()   # Escrever no disco
         classified_img = None   # Salvar e fechar
 
-
-
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
         self.CAMINHO = Raster_Output
@@ -39,15 +39,11 @@ from qgis.core import (QgsApplication,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterFeatureSink)
 
-import datetime
 import shutil
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
-from PIL import Image, TiffTags, ExifTags
-from PIL.TiffImagePlugin import ImageFileDirectory_v2
-from PIL.TiffTags import TAGS
-ImageFileDirectory_v2._load_dispatch[13] = ImageFileDirectory_v2._load_dispatch[TiffTags.LONG]
+from lftools.geocapt.fotos import ExifFotos, AbrirCacheExif
 
 class ImportPhotos(QgsProcessingAlgorithm):
 
@@ -107,6 +103,7 @@ class ImportPhotos(QgsProcessingAlgorithm):
     NONGEO = 'NONGEO'
     OUTPUT = 'OUTPUT'
     SUBFOLDER = 'SUBFOLDER'
+    CACHE = 'CACHE'
 
     def initAlgorithm(self, config=None):
 
@@ -127,6 +124,14 @@ class ImportPhotos(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.CACHE,
+                self.tr('Keep a metadata cache in the folder (only new or changed photos are read again)', 'Manter cache dos metadados na pasta (apenas fotos novas ou alteradas são lidas novamente)'),
+                defaultValue = True
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterFile(
                 self.NONGEO,
@@ -167,6 +172,12 @@ class ImportPhotos(QgsProcessingAlgorithm):
             context
         )
 
+        usar_cache = self.parameterAsBool(
+            parameters,
+            self.CACHE,
+            context
+        )
+
         feedback.pushInfo(self.tr('Checking files in the folder...', 'Checando arquivos na pasta...'))
         lista = []
         if subpasta:
@@ -184,60 +195,6 @@ class ImportPhotos(QgsProcessingAlgorithm):
         if os.path.isdir(fotos_nao_geo):
             copy_ngeo = True
 
-        # Funcao para transformar os dados do EXIF em coordenadas em graus decimais
-        def coordenadas(exif):
-            try:
-                ref_lat = exif['GPSInfo'][1][0]
-                ref_lon = exif['GPSInfo'][3][0]
-                sinal_lat, sinal_lon = 0, 0
-                if ref_lat == 'S':
-                    sinal_lat = -1
-                elif ref_lat == 'N':
-                    sinal_lat = 1
-                if ref_lon == 'W':
-                    sinal_lon = -1
-                elif ref_lon == 'E':
-                    sinal_lon = 1
-
-                try:
-                    grausLat,grausLon = exif['GPSInfo'][2][0][0], exif['GPSInfo'][4][0][0]
-                    minLat, minLon = exif['GPSInfo'][2][1][0], exif['GPSInfo'][4][1][0]
-                    segLat = exif['GPSInfo'][2][2][0]/float(exif['GPSInfo'][2][2][1])
-                    segLon = exif['GPSInfo'][4][2][0]/float(exif['GPSInfo'][4][2][1])
-                except:
-                    grausLat,grausLon = exif['GPSInfo'][2][0], exif['GPSInfo'][4][0]
-                    minLat, minLon = exif['GPSInfo'][2][1], exif['GPSInfo'][4][1]
-                    segLat = exif['GPSInfo'][2][2]
-                    segLon = exif['GPSInfo'][4][2]
-                if sinal_lat!=0 and sinal_lon!=0:
-                    lat = sinal_lat*(float(grausLat)+minLat/60.0+segLat/3600.0)
-                    lon = sinal_lon*(float(grausLon)+minLon/60.0+segLon/3600.0)
-                return lat, lon
-            except:
-                return 0,0
-
-        # Funcao para pegar Azimute
-        def azimute(exif):
-            Az = exif['GPSInfo'][17]
-            if isinstance(Az, tuple):
-                Az = Az[0]/float(Az[1])
-                return Az
-            else:
-                return Az
-
-        # Funcao para gerar o padrao data-hora
-        def data_hora(texto):
-            data_hora = texto.replace(' ',':')
-            data_hora = data_hora.split(':')
-            ano = int(data_hora[0])
-            mes = int(data_hora[1])
-            dia = int(data_hora[2])
-            hora = int(data_hora[3])
-            minuto = int(data_hora[4])
-            segundo = int(data_hora[5])
-            data_hora = unicode(datetime.datetime(ano, mes, dia, hora, minuto, segundo))
-            return data_hora
-
         # Criando Output
         crs = QgsCoordinateReferenceSystem()
         crs.createFromSrid(4326)
@@ -261,90 +218,34 @@ class ImportPhotos(QgsProcessingAlgorithm):
         if sink is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
 
+        # Metadados lidos em paralelo, com cache na pasta
+        cache = AbrirCacheExif(pasta) if usar_cache else None
+        if usar_cache and cache is None:
+            feedback.pushInfo(self.tr('The metadata cache could not be created in the folder!', 'Não foi possível criar o cache dos metadados na pasta!'))
+        n_cache = 0
         Percent = 100.0/tam if tam!=0 else 0
-        for index, filepath in enumerate(lista):
-            if (filepath).lower().endswith(('.jpg', '.jpeg')):
-                caminho, arquivo = os.path.split(filepath)
-                img = Image.open(os.path.join(caminho,arquivo))
-                if img._getexif():
-                    exif = {
-                        ExifTags.TAGS[k]: v
-                        for k, v in img._getexif().items()
-                        if k in ExifTags.TAGS
-                    }
-                else:
-                    exif = {}
-                lon, lat = 0, 0
-                Az = None
-                date_time = None
-                altitude = None
-                if 'GPSInfo' in exif:
-                    lat, lon = coordenadas(exif)
-                    if lat != 0:
-                        if 17 in exif['GPSInfo']:
-                            Az = azimute(exif)
-                        if 6 in exif['GPSInfo']:
-                            try:
-                                altitude = float(exif['GPSInfo'][6][0])/exif['GPSInfo'][6][1]
-                            except:
-                                altitude = float(exif['GPSInfo'][6])
-                if 'DateTimeOriginal' in exif:
-                    date_time = data_hora(exif['DateTimeOriginal'])
-                elif 'DateTime' in exif:
-                    date_time = data_hora(exif['DateTime'])
+        for index, (_, filepath, dados, do_cache) in enumerate(ExifFotos(lista, cache)):
+            caminho, arquivo = os.path.split(filepath)
+            n_cache += do_cache
+            if isinstance(dados, Exception):
+                feedback.pushInfo(self.tr('The file "{}" could not be read: {}', 'A imagem "{}" não pôde ser lida: {}').format(arquivo, dados))
+            else:
+                lon, lat, altitude, Az, date_time = dados
                 if lon != 0:
                     feature = QgsFeature(fields)
                     feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon, lat)))
-                    feature.setAttributes([arquivo, lon, lat, altitude, Az, date_time, os.path.join(caminho, arquivo)])
+                    feature.setAttributes([arquivo, lon, lat, altitude, Az, date_time, filepath])
                     sink.addFeature(feature, QgsFeatureSink.FastInsert)
                 else:
                     feedback.pushInfo(self.tr('The file "{}" has no geotag!'.format(arquivo), 'A imagem "{}" não possui geotag!'.format(arquivo)))
                     if copy_ngeo:
-                        shutil.copy2(os.path.join(pasta, arquivo), os.path.join(fotos_nao_geo, arquivo))
-
-            elif (filepath).lower().endswith(('.tif', '.tiff')):
-                caminho, arquivo = os.path.split(filepath)
-                img = Image.open(os.path.join(caminho,arquivo))
-                meta_dict = {TAGS[key] : img.tag[key] for key in img.tag_v2}
-                gps_offset = img.tag_v2.get(0x8825)
-                tags = {}
-                if gps_offset:
-                	ifh = b"II\x2A\x00\x08\x00\x00\x00" if img.tag_v2._endian == "<" else "MM\x00\x2A\x00\x00\x00\x08"
-                	info = ImageFileDirectory_v2(ifh)
-                	img.fp.seek(gps_offset)
-                	info.load(img.fp)
-                	gps_keys = ['GPSVersionID','GPSLatitudeRef','GPSLatitude','GPSLongitudeRef','GPSLongitude','GPSAltitudeRef','GPSAltitude','GPSTimeStamp','GPSSatellites','GPSStatus','GPSMeasureMode','GPSDOP','GPSSpeedRef','GPSSpeed','GPSTrackRef','GPSTrack','GPSImgDirectionRef','GPSImgDirection','GPSMapDatum','GPSDestLatitudeRef','GPSDestLatitude','GPSDestLongitudeRef','GPSDestLongitude','GPSDestBearingRef','GPSDestBearing','GPSDestDistanceRef','GPSDestDistance','GPSProcessingMethod','GPSAreaInformation','GPSDateStamp','GPSDifferential']
-                	for k, v in info.items():
-                		tags[gps_keys[k]] = str(v)
-
-                lon, lat = 0, 0
-                Az = None
-                date_time = None
-                altitude = None
-
-                if 'GPSLatitudeRef' in tags:
-                    lat_ref = str(tags['GPSLatitudeRef'])
-                    lat = eval(str(tags['GPSLatitude']))
-                    lat = (-1 if lat_ref.upper() == 'S' else 1)*(lat[0] + lat[1]/60 + lat[2]/3600)
-                    lon_ref = str(tags['GPSLongitudeRef'])
-                    lon = eval(str(tags['GPSLongitude']))
-                    lon = (-1 if lon_ref.upper() == 'W' else 1)*(lon[0] + lon[1]/60 + lon[2]/3600)
-                    alt_ref = str(tags['GPSAltitudeRef'])
-                    altitude = eval(str(tags['GPSAltitude']))
-                    date_time = data_hora(meta_dict['DateTime'][0])
-
-                    if lon != 0:
-                        feature = QgsFeature(fields)
-                        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon, lat)))
-                        feature.setAttributes([arquivo, lon, lat, altitude, Az, date_time, os.path.join(caminho, arquivo)])
-                        sink.addFeature(feature, QgsFeatureSink.FastInsert)
-                else:
-                    feedback.pushInfo(self.tr('The file "{}" has no geotag!'.format(arquivo), 'A imagem "{}" não possui geotag!'.format(arquivo)))
-                    if copy_ngeo:
-                        shutil.copy2(os.path.join(pasta, arquivo), os.path.join(fotos_nao_geo, arquivo))
+                        shutil.copy2(filepath, os.path.join(fotos_nao_geo, arquivo))
             if feedback.isCanceled():
                 break
             feedback.setProgress(int((index+1) * Percent))
+        if cache is not None:
+            cache.close()
+            feedback.pushInfo(self.tr('Photos read from the cache: {}', 'Fotos lidas do cache: {}').format(n_cache))
 
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
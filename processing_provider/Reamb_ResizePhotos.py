@@ -32,7 +32,10 @@ import shutil
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
-import PIL
+from lftools.geocapt.fotos import RedimensionarFoto
+from lftools.geocapt.paralelo import ExecutorProcessos
+from concurrent.futures import wait, FIRST_COMPLETED
+import time
 
 
 class ResizePhotos(QgsProcessingAlgorithm):
@@ -95,6 +98,8 @@ class ResizePhotos(QgsProcessingAlgorithm):
     OUTPUT_FOLDER = 'OUTPUT_FOLDER'
     SUBFOLDER = 'SUBFOLDER'
     SIZE = 'SIZE'
+    WORKERS = 'WORKERS'
+    UPDATE = 'UPDATE'
 
     def initAlgorithm(self, config=None):
 
@@ -125,6 +130,24 @@ class ResizePhotos(QgsProcessingAlgorithm):
                 )
             )
 
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.WORKERS,
+                self.tr('Number of parallel processes', 'Número de processos paralelos'),
+                type =0, #Double = 1 and Integer = 0
+                defaultValue = 1,
+                minValue = 1
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.UPDATE,
+                self.tr('Skip photos already resized (output newer than input)', 'Pular fotos já redimensionadas (saída mais nova que a entrada)'),
+                defaultValue = False
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterFile(
                 self.OUTPUT_FOLDER,
@@ -156,6 +179,18 @@ class ResizePhotos(QgsProcessingAlgorithm):
             context
         )
 
+        n_processos = self.parameterAsInt(
+            parameters,
+            self.WORKERS,
+            context
+        )
+
+        atualizar = self.parameterAsBool(
+            parameters,
+            self.UPDATE,
+            context
+        )
+
         pasta_out = self.parameterAsFile(
             parameters,
             self.OUTPUT_FOLDER,
@@ -183,29 +218,37 @@ class ResizePhotos(QgsProcessingAlgorithm):
 
         # Redimensionando imagens
         feedback.pushInfo(self.tr('Resizing the images...', 'Redimensionando as imagens...'))
-        for index, caminho in enumerate(lista):
-            arquivo = os.path.split(caminho)[-1]
-            img = PIL.Image.open(caminho)
-            if 'exif' in img.info:
-                exif = img.info['exif']
-            altura = img.size[1]
-            largura = img.size[0]
-            if largura > altura:
-                new_height = int(lado/float(largura)*altura)
-                new_width = lado
-            else:
-                new_width = int(lado/float(altura)*largura)
-                new_height = lado
-            img = img.resize((new_width, new_height))
-            if 'exif' in img.info:
-                img.save(os.path.join(pasta_out, arquivo), exif=exif)
-            else:
-                img.save(os.path.join(pasta_out, arquivo))
-            if feedback.isCanceled():
-                break
-            feedback.setProgress(int((index+1) * Percent))
-
-        del img
+        tarefas = [(caminho, os.path.join(pasta_out, os.path.split(caminho)[-1]), lado, atualizar) for caminho in lista]
+        inicio = time.time()
+        gravadas = 0
+        if n_processos > 1:
+            # Fila limitada: no máximo 2 fotos por processo aguardando
+            with ExecutorProcessos(n_processos) as executor:
+                pendentes = set()
+                index = 0
+                proxima = 0
+                while proxima < tam or pendentes:
+                    while proxima < tam and len(pendentes) < 2*n_processos:
+                        pendentes.add(executor.submit(RedimensionarFoto, *tarefas[proxima]))
+                        proxima += 1
+                    prontas, pendentes = wait(pendentes, return_when = FIRST_COMPLETED)
+                    for pronta in prontas:
+                        gravadas += pronta.result()
+                        index += 1
+                    if feedback.isCanceled():
+                        for pendente in pendentes:
+                            pendente.cancel()
+                        break
+                    feedback.setProgress(int(index * Percent))
+        else:
+            for index, tarefa in enumerate(tarefas):
+                gravadas += RedimensionarFoto(*tarefa)
+                if feedback.isCanceled():
+                    break
+                feedback.setProgress(int((index+1) * Percent))
+
+        tempo = time.time() - inicio
+        feedback.pushInfo(self.tr('Resized photos: {} of {} ({:.1f} images/s)', 'Fotos redimensionadas: {} de {} ({:.1f} imagens/s)').format(gravadas, tam, gravadas/tempo if tempo > 0 else 0))
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
 
@@ -52,6 +52,7 @@ import numpy as np
 from pyproj.crs import CRS
 from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.dip import SomaMovel, MedianaMovel, PIXELS_POR_BLOCO
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -219,39 +220,26 @@ O processo de filtragem é feito utilizando matrizes denominadas máscaras (ou k
         new_uly = uly - abs(yres)*(size -1)/2
         new_geotransform = (new_ulx, xres, xskew, new_uly, yskew, yres)
 
-        # Kernel (filtro da média)
-        kernel = 1.0/(size**2)*np.ones((size, size))
-
-        # Convolução 2D
-        m, n = kernel.shape # n = m
-        y, x = banda.shape
-        y = y - m + 1
-        x = x - m + 1
+        # Filtragem por faixas de linhas (convolução separável para a média e stride tricks para a mediana)
+        m = size
+        y = rows - m + 1
+        x = cols - m + 1
         RESULT = np.zeros((y,x))
+        faixa = max(1, PIXELS_POR_BLOCO//(x*m*m))
         Percent = 100.0/y
-        current = 0
-        if tipo in [0,1]: #Filtro da média
-            for i in range(y):
-                for j in range(x):
-                    if np.sum(banda[i:i+m, j:j+m] == nulo) > 0:
-                        RESULT[i][j] = nulo
-                    else:
-                        RESULT[i][j] = np.sum(banda[i:i+m, j:j+m]*kernel)
-                if feedback.isCanceled():
-                    break
-                current += 1
-                feedback.setProgress(int(current * Percent))
-        elif tipo in [2,3]: #Filtro da mediana
-            for i in range(y):
-                for j in range(x):
-                    if np.sum(banda[i:i+m, j:j+m] == nulo) > 0:
-                        RESULT[i][j] = nulo
-                    else:
-                        RESULT[i][j] = np.median(banda[i:i+m, j:j+m])
-                if feedback.isCanceled():
-                    break
-                current += 1
-                feedback.setProgress(int(current * Percent))
+        for i in range(0, y, faixa):
+            bloco = banda[i:i+faixa+m-1]
+            n_lin = bloco.shape[0] - m + 1
+            if tipo in [0,1]: #Filtro da média
+                RESULT[i:i+n_lin] = SomaMovel(bloco, m)/(m**2)
+            elif tipo in [2,3]: #Filtro da mediana
+                RESULT[i:i+n_lin] = MedianaMovel(bloco, m)
+            # Janelas com algum pixel nulo
+            if nulo is not None:
+                RESULT[i:i+n_lin][SomaMovel(bloco == nulo, m) > 0] = nulo
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((i+n_lin) * Percent))
 
         # Salvando Resultado
         ncols = cols - (size - 1)
@@ -54,7 +54,7 @@ from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
-from matplotlib import path
+from lftools.geocapt.dip import MascaraPoligono
 
 class SpotElevation(QgsProcessingAlgorithm):
 
@@ -264,58 +264,23 @@ class SpotElevation(QgsProcessingAlgorithm):
         # Amostra de Raster por poligono
         Percent = 100.0/len(lista) if len(lista)>0 else 0
         for index, poly in enumerate(lista):
-            caminho = []
-            lin_min = 1e8
-            col_min = 1e8
-            lin_max = -1e8
-            col_max = -1e8
-            for ponto in poly:
-                linha = (origem[1]-ponto.y())/resol_Y
-                if linha > lin_max:
-                    lin_max = linha
-                if linha < lin_min:
-                    lin_min = linha
-                coluna = (ponto.x() - origem[0])/resol_X
-                if coluna > col_max:
-                    col_max = coluna
-                if coluna < col_min:
-                    col_min = coluna
-                caminho += [(linha, coluna)]
-            p = path.Path(caminho)
-            lin_min = int(np.floor(lin_min))
-            lin_max = int(np.floor(lin_max))
-            col_min = int(np.floor(col_min))
-            col_max = int(np.floor(col_max))
-            nx, ny = (lin_max-lin_min+1, col_max-col_min+1)
-            lin = np.linspace(lin_min, lin_max, nx)
-            col = np.linspace(col_min, col_max, ny)
-            COL, LIN = np.meshgrid(col, lin)
-            recorte = np.zeros((int(nx), int(ny)), dtype=bool)
-            for x in range(int(nx)):
-                for y in range(int(ny)):
-                    pixel = (LIN[x][y]+0.5, COL[x][y]+0.5) # 0.5 eh o centro do pixel
-                    contem = p.contains_points([pixel])
-                    recorte[x][y] = contem[0]
+            recorte, lin_min, col_min = MascaraPoligono(poly, origem, resol_X, resol_Y, rows, cols)
+            nx, ny = recorte.shape
             # Determinar qual(is) pixel(s) eh de maximo ou minimo
-            recorte_img = band[lin_min:lin_max+1, col_min:col_max+1]
-            if np.shape(recorte)==np.shape(recorte_img):
-                produto = recorte*recorte_img
-            else:
-                recorte = recorte[0:np.shape(recorte_img)[0], 0:np.shape(recorte_img)[1]]
-                produto = recorte*recorte_img
+            recorte_img = band[lin_min:lin_min+nx, col_min:col_min+ny]
+            produto = recorte*recorte_img
+            validos = produto != 0
             min = 1e8
             max = -1e8
-            tam = np.shape(produto)
             MIN = -1
             MAX = -1
-            for x in range(tam[0]):
-                for y in range(tam[1]):
-                    if produto[x][y] < min and produto[x][y]!=0:
-                        min = produto[x][y]
-                        MIN = (x,y)
-                    if produto[x][y] > max and produto[x][y]!=0:
-                        max = produto[x][y]
-                        MAX = (x,y)
+            if validos.any():
+                ind_min = np.argmin(np.where(validos, produto, np.inf))
+                ind_max = np.argmax(np.where(validos, produto, -np.inf))
+                min = produto.flat[ind_min]
+                max = produto.flat[ind_max]
+                MIN = np.unravel_index(ind_min, produto.shape)
+                MAX = np.unravel_index(ind_max, produto.shape)
             # Saber se eh depressao ou pico
             COTA = COTAS[index]
             TIPO = 0
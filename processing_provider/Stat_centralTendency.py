@@ -46,6 +46,7 @@ import numpy as np
 from numpy import pi, cos, sin, sqrt
 #from scipy.stats import chi2
 from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.estatistica import QuantisPonderados, FeicaoCentral
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -302,37 +303,6 @@ Observação: Camada em um SRC projetado obtém resultado mais acurados.'''
                     else:
                         dic[grupo] = {'x':[pnt.x()], 'y':[pnt.y()]}
 
-        # Função para calcular a Mediana Ponderada
-        def quantis_ponderados(valores, quantis, pesos):
-            # entradas:
-                # valores: array com valores
-                # quantil: array com quantil entre 0 e 1
-                # pesos: lista com mesma dimensão de valores com os respectivos pesos
-            pesos = np.array(pesos)
-            sorter = np.argsort(valores) # ordenar valores
-            valores = valores[sorter]
-            pesos = pesos[sorter]
-            q = 1.*pesos.cumsum()/pesos.sum() # quantis ponderados
-            return np.interp(quantis, q, valores)
-
-        # Função para retornar a feição central
-        def CentralFeature(x, y, w):
-            dist_soma = 1e15
-            indice = -1
-            for i in range(len(x)):
-                x1 = x[i]
-                y1 = y[i]
-                soma = 0
-                for j in range(len(y)):
-                    x2 = x[j]
-                    y2 = y[j]
-                    peso = w[j]
-                    soma += peso*np.sqrt((x1 - x2)**2 + (y1 - y2)**2)
-                if soma < dist_soma:
-                    dist_soma = soma
-                    indice = i
-            return x[indice], y[indice]
-
         # Cálculo
         feature = QgsFeature()
         total = 100.0 / len(dic) if len(dic) else 0
@@ -361,15 +331,15 @@ Observação: Camada em um SRC projetado obtém resultado mais acurados.'''
             elif estat == 1:
                 if Campo_Peso:
                     if (np.array(w) > 0).sum() > 1: # Mais de um ponto com peso maior que zero
-                        perc25X, medianX, perc75X = quantis_ponderados(x, [0.25, 0.5, 0.75], w)
-                        perc25Y, medianY, perc75Y = quantis_ponderados(y, [0.25, 0.5, 0.75], w)
+                        (perc25X, perc25Y), (medianX, medianY), (perc75X, perc75Y) = QuantisPonderados(np.column_stack((x, y)), [0.25, 0.5, 0.75], w)
                     else:
                         continue
                 else:
                     perc25X, medianX, perc75X = np.quantile(x, [0.25, 0.5, 0.75])
                     perc25Y, medianY, perc75Y = np.quantile(y, [0.25, 0.5, 0.75])
             elif estat == 2:
-                central_X, central_Y = CentralFeature(x, y, w)
+                indice = FeicaoCentral(x, y, w)
+                central_X, central_Y = x[indice], y[indice]
 
             max_x = np.max(x)
             max_y = np.max(y)
@@ -181,149 +181,80 @@ class DirectionalMerge(QgsProcessingAlgorithm):
         # Criar uma nova lista com as feicoes finais mescladas
         nova_lista = []
         # Remover os aneis lineares da lista e acrescentar na nova lista
-        ind = 0
-        while ind < len(lista)-1:
-            P_ini = lista[ind][1]
-            P_fim = lista[ind][2]
-            if P_ini==P_fim:
-                nova_lista+= [lista[ind][0]]
-                del  lista[ind]
+        linhas_abertas = []
+        for item in lista:
+            if item[1] == item[2]:
+                nova_lista += [[item[0], item[5]]]
             else:
-                ind +=1
-
-        # Mesclar linhas que se tocam e tem a mesma direcao (com mesmo atributo)
+                linhas_abertas += [item]
+        lista = linhas_abertas
+        tam = len(lista)
+
+        # Índice das extremidades: ponto (arredondado) -> [(linha, 0 - inicial ou 1 - final)]
+        extremos = {}
+        for ind, item in enumerate(lista):
+            extremos.setdefault(self.chave(item[1]), []).append((ind, 0))
+            extremos.setdefault(self.chave(item[2]), []).append((ind, 1))
+        comprimentos = [QgsGeometry.fromPolylineXY(item[0]).length() for item in lista]
+
+        # Mesclar linhas que se tocam e tem a mesma direcao, percorrendo cada cadeia pelas extremidades
+        # atributos == 0: apenas linhas com os mesmos atributos
+        # atributos == 1: preservar atributos da linha maior
         feedback.pushInfo(self.tr('Merging lines...', 'Mesclando linhas...'))
-        if atributos == 0:
-            while len(lista)>1:
-                tam = len(lista)
-                for i in range(0,tam-1):
-                    mergeou = False
-                    # Ponto inicial e final da feicao A
-                    coord_A = lista[i][0]
-                    P_ini_A = lista[i][1]
-                    P_fim_A = lista[i][2]
-                    ang_ini_A = lista[i][3]
-                    ang_fim_A = lista[i][4]
-                    att_A = lista[i][5]
-                    for j in range(i+1,tam):
-                        # Ponto inicial e final da feicao B
-                        coord_B = lista[j][0]
-                        P_ini_B = lista[j][1]
-                        P_fim_B = lista[j][2]
-                        ang_ini_B = lista[j][3]
-                        ang_fim_B = lista[j][4]
-                        att_B = lista[j][5]
-                        if att_A == att_B:
-                            # 4 possibilidades
-                            # 1 - Ponto final de A igual ao ponto inicial de B
-                            if (P_fim_A == P_ini_B) and (fabs(ang_fim_A-ang_ini_B)<tol or fabs(360-fabs(ang_fim_A-ang_ini_B))<tol):
-                                mergeou = True
-                                break
-                            # 2 - Ponto inicial de A igual ao ponto final de B
-                            elif (P_ini_A == P_fim_B) and (fabs(ang_ini_A-ang_fim_B)<tol or fabs(360-fabs(ang_ini_A-ang_fim_B))<tol):
-                                mergeou = True
-                                break
-                            # 3 - Ponto incial de A igual ao ponto inicial de B
-                            elif (P_ini_A == P_ini_B) and (fabs(ang_ini_A- self.contraAz(ang_ini_B))<tol or fabs(360-fabs(ang_ini_A - self.contraAz(ang_ini_B)))<tol):
-                                mergeou = True
-                                break
-                            # 4 - Ponto final de A igual ao ponto final de B
-                            elif (P_fim_A == P_fim_B) and (fabs(ang_fim_A - self.contraAz(ang_fim_B))<tol or fabs(360-fabs(ang_fim_A - self.contraAz(ang_fim_B)))<tol):
-                                mergeou = True
+        usada = [False]*tam
+        for i in range(tam):
+            if usada[i]:
+                continue
+            usada[i] = True
+            coord, _, _, ang_ini, ang_fim, att = lista[i]
+            coord = list(coord)
+            comprimento = comprimentos[i]
+            # Prolongar pelo ponto final e depois pelo ponto inicial da cadeia
+            for lado in (1, 0):
+                while True:
+                    P = coord[-1] if lado == 1 else coord[0]
+                    ang = ang_fim if lado == 1 else ang_ini
+                    escolhida = None
+                    for j, lado_B in sorted(extremos.get(self.chave(P), [])):
+                        if usada[j] or (atributos == 0 and lista[j][5] != att):
+                            continue
+                        ang_B = lista[j][3] if lado_B == 0 else lista[j][4]
+                        # extremidades opostas (fim-início, início-fim) ou iguais (início-início, fim-fim)
+                        if lado != lado_B:
+                            if self.alinhados(ang, ang_B, tol):
+                                escolhida = (j, lado_B)
                                 break
-                    if mergeou:
-                        geom_A = QgsGeometry.fromPolylineXY(coord_A)
-                        geom_B = QgsGeometry.fromPolylineXY(coord_B)
-                        new_geom = geom_A.combine(geom_B)
-
-                        new_feat = QgsFeature()
-                        new_feat.setAttributes(att_A)
-                        new_feat.setGeometry(new_geom)
-
-                        if new_geom.isMultipart():
-                            nova_lista += [[coord_A, att_A], [coord_B, att_B]]
-                            del lista[i], lista[j-1]
+                        elif self.alinhados(ang, self.contraAz(ang_B), tol):
+                            escolhida = (j, lado_B)
                             break
-                        else:
-                            del lista[i], lista[j-1]
-                            lista = self.pontos_ang(new_feat)+lista
-                            break
-                    if not(mergeou):
-                        # Tirar a geometria que nao se conecta com nada da lista
-                        nova_lista += [[coord_A, att_A]]
-                        del lista[i]
+                    if escolhida is None:
                         break
-                if len(lista)==1:
-                    nova_lista += [[lista[0][0], lista[0][5]]]
-
-        # Mesclar os que se tocam e tem mesma direcao (preservar atributos da linha maior)
-        if atributos == 1:
-            while len(lista)>1:
-                tam = len(lista)
-                for i in range(0,tam-1):
-                    mergeou = False
-                    # Ponto inicial e final da feicao A
-                    coord_A = lista[i][0]
-                    P_ini_A = lista[i][1]
-                    P_fim_A = lista[i][2]
-                    ang_ini_A = lista[i][3]
-                    ang_fim_A = lista[i][4]
-                    att_A = lista[i][5]
-                    for j in range(i+1,tam):
-                        # Ponto inicial e final da feicao B
-                        coord_B = lista[j][0]
-                        P_ini_B = lista[j][1]
-                        P_fim_B = lista[j][2]
-                        ang_ini_B = lista[j][3]
-                        ang_fim_B = lista[j][4]
-                        att_B = lista[j][5]
-                        # 4 possibilidades
-                        # 1 - Ponto final de A igual ao ponto inicial de B
-                        if (P_fim_A == P_ini_B) and (fabs(ang_fim_A-ang_ini_B)<tol or fabs(360-fabs(ang_fim_A-ang_ini_B))<tol):
-                            mergeou = True
-                            break
-                        # 2 - Ponto inicial de A igual ao ponto final de B
-                        elif (P_ini_A == P_fim_B) and (fabs(ang_ini_A-ang_fim_B)<tol or fabs(360-fabs(ang_ini_A-ang_fim_B))<tol):
-                            mergeou = True
-                            break
-                        # 3 - Ponto incial de A igual ao ponto inicial de B
-                        elif (P_ini_A == P_ini_B) and (fabs(ang_ini_A - self.contraAz(ang_ini_B))<tol or fabs(360-fabs(ang_ini_A - self.contraAz(ang_ini_B)))<tol):
-                            mergeou = True
-                            break
-                        # 4 - Ponto final de A igual ao ponto final de B
-                        elif (P_fim_A == P_fim_B) and (fabs(ang_fim_A - self.contraAz(ang_fim_B))<tol or fabs(360-fabs(ang_fim_A - self.contraAz(ang_fim_B)))<tol):
-                            mergeou = True
-                            break
-                    if mergeou:
-                        geom_A = QgsGeometry.fromPolylineXY(coord_A)
-                        geom_B = QgsGeometry.fromPolylineXY(coord_B)
-                        new_geom = geom_A.combine(geom_B)
-
-                        length_A = geom_A.length()
-                        length_B = geom_B.length()
-                        if length_A > length_B:
-                            att = att_A
+                    j, lado_B = escolhida
+                    usada[j] = True
+                    coord_B = lista[j][0]
+                    if lado == 1: # B entra pelo ponto final da cadeia
+                        if lado_B == 0:
+                            coord = coord + coord_B[1:]
+                            ang_fim = lista[j][4]
                         else:
-                            att = att_B
-                        new_feat = QgsFeature()
-                        new_feat.setAttributes(att)
-                        new_feat.setGeometry(new_geom)
-
-                        if new_geom.isMultipart():
-                            nova_lista += [[coord_A, att_A], [coord_B, att_B]]
-                            del lista[i], lista[j-1]
-                            break
+                            coord = coord + coord_B[::-1][1:]
+                            ang_fim = self.contraAz(lista[j][3])
+                    else: # B entra pelo ponto inicial da cadeia
+                        if lado_B == 1:
+                            coord = coord_B[:-1] + coord
+                            ang_ini = lista[j][3]
                         else:
-                            del lista[i], lista[j-1]
-                            lista = self.pontos_ang(new_feat)+lista
-                            break
-                    if not(mergeou):
-                        # Tirar a geometria que nao se conecta com nada da lista
-                        nova_lista += [[coord_A, att_A]]
-                        del lista[i]
+                            coord = coord_B[::-1][:-1] + coord
+                            ang_ini = self.contraAz(lista[j][4])
+                    if atributos == 1 and comprimentos[j] >= comprimento:
+                        att = lista[j][5]
+                    comprimento += comprimentos[j]
+                    if self.chave(coord[0]) == self.chave(coord[-1]): # cadeia fechada
                         break
-                if len(lista)==1:
-                    nova_lista += [[lista[0][0], lista[0][5]]]
+            nova_lista += [[coord, att]]
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((i+1) * 100/tam))
 
         # Criando o shapefile de saida
         feedback.pushInfo(self.tr('Saving output...', 'Salvando saída...'))
@@ -377,6 +308,14 @@ class DirectionalMerge(QgsProcessingAlgorithm):
                     itens += [[item, item[0], item[-1], ang_ini, ang_fim, att]]
                 return itens
 
+    # Chave das extremidades: coordenadas arredondadas
+    def chave(self, pnt):
+        return (round(pnt.x(), 8), round(pnt.y(), 8))
+
+    # Direcoes dentro da tolerancia
+    def alinhados(self, ang_A, ang_B, tol):
+        return fabs(ang_A - ang_B) < tol or fabs(360 - fabs(ang_A - ang_B)) < tol
+
     # Funcao para dar a direcao oposta
     def contraAz(self, x):
         if x<=0:
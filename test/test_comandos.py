@@ -0,0 +1,184 @@
+# coding=utf-8
+"""Tests for the external command helpers of geocapt.comandos."""
+
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import subprocess
+import time
+import unittest
+
+from lftools.geocapt.comandos import (ExecutarComando, ExecutarEncadeado, ItensBackup,
+                                      TamanhoCaminho, TextoBytes)
+
+
+class Feedback(object):
+    """Minimal stand-in for QgsProcessingFeedback."""
+
+    def __init__(self):
+        self.mensagens = []
+        self.progresso = []
+        self.cancelado = False
+
+    def pushInfo(self, texto):
+        self.mensagens.append(texto)
+
+    def setProgress(self, valor):
+        self.progresso.append(valor)
+
+    def isCanceled(self):
+        return self.cancelado
+
+    def cancel(self):
+        self.cancelado = True
+
+
+def python(codigo):
+    return [sys.executable, '-c', codigo]
+
+
+class ComandosTest(unittest.TestCase):
+    """Test the subprocess helpers with Python child processes."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.pasta = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def test_texto_bytes(self):
+        """Sizes are written with binary units."""
+        self.assertEqual(TextoBytes(512), '512 B')
+        self.assertEqual(TextoBytes(2048), '2.0 kB')
+        self.assertEqual(TextoBytes(5*1024**3), '5.0 GB')
+
+    def test_tamanho_caminho(self):
+        """Size of a file and of a folder tree."""
+        os.makedirs(os.path.join(self.pasta, 'sub'))
+        with open(os.path.join(self.pasta, 'a.bin'), 'wb') as arq:
+            arq.write(b'x'*100)
+        with open(os.path.join(self.pasta, 'sub', 'b.bin'), 'wb') as arq:
+            arq.write(b'x'*50)
+        self.assertEqual(TamanhoCaminho(os.path.join(self.pasta, 'a.bin')), 100)
+        self.assertEqual(TamanhoCaminho(self.pasta), 150)
+        self.assertEqual(TamanhoCaminho(os.path.join(self.pasta, 'nada')), 0)
+
+    def test_executar_comando(self):
+        """Output lines reach the feedback, with progress and exit code."""
+        feedback = Feedback()
+        codigo = ExecutarComando(python('import sys\nfor k in range(4): print("linha", k)\nsys.exit(2)'),
+                                 feedback, passos=4)
+        self.assertEqual(codigo, 2)
+        self.assertEqual(feedback.mensagens, ['linha 0', 'linha 1', 'linha 2', 'linha 3'])
+        self.assertEqual(feedback.progresso[-1], 99)
+
+    def test_executar_comando_cancelar(self):
+        """The process is terminated when the user cancels."""
+        feedback = Feedback()
+        threading.Timer(0.5, feedback.cancel).start()
+        inicio = time.time()
+        codigo = ExecutarComando(python('import time\nwhile True: time.sleep(0.1)'), feedback)
+        self.assertNotEqual(codigo, 0)
+        self.assertLess(time.time() - inicio, 10)
+
+    def test_executar_encadeado(self):
+        """The output of the first command is piped to the second one."""
+        saida = os.path.join(self.pasta, 'saida.txt')
+        codigo, erros = ExecutarEncadeado(python('print("dados")'),
+                                          python('import sys\nopen(sys.argv[1], "w").write(sys.stdin.read())') + [saida])
+        self.assertEqual(codigo, 0)
+        self.assertEqual(erros, '')
+        with open(saida) as arq:
+            self.assertEqual(arq.read().strip(), 'dados')
+
+    def test_executar_encadeado_erro(self):
+        """Errors of both commands are returned with the failing exit code."""
+        codigo, erros = ExecutarEncadeado(python('import sys\nsys.stderr.write("erro1")'),
+                                          python('import sys\nsys.stdin.read()\nsys.stderr.write("erro2")\nsys.exit(3)'))
+        self.assertEqual(codigo, 3)
+        self.assertIn('erro1', erros)
+        self.assertIn('erro2', erros)
+
+    def test_executar_encadeado_cancelar(self):
+        """Both processes of the pipe are terminated when the user cancels."""
+        feedback = Feedback()
+        threading.Timer(0.5, feedback.cancel).start()
+        inicio = time.time()
+        codigo, erros = ExecutarEncadeado(python('import sys, time\nwhile True:\n    print("x")\n    sys.stdout.flush()\n    time.sleep(0.01)'),
+                                          python('import sys\nfor linha in sys.stdin: pass'), feedback)
+        self.assertNotEqual(codigo, 0)
+        self.assertLess(time.time() - inicio, 10)
+
+
+def _psql(*argumentos):
+    return subprocess.run(['psql', '-X', '-q', '-t', '-A', '-d', 'postgres'] + list(argumentos),
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL,
+                          universal_newlines=True)
+
+def _servidor_local():
+    if not (shutil.which('pg_dump') and shutil.which('pg_restore') and shutil.which('psql')):
+        return False
+    try:
+        return _psql('-c', 'SELECT 1').returncode == 0
+    except OSError:
+        return False
+
+
+@unittest.skipUnless(_servidor_local(), 'local PostgreSQL server not available')
+class BackupRestoreTest(unittest.TestCase):
+    """Round trip of a directory-format backup against a local PostgreSQL.
+
+    The connection is taken from the standard PGHOST, PGPORT, PGUSER and
+    PGPASSWORD environment variables.
+    """
+
+    BANCO = 'lftools_teste_backup'
+
+    def setUp(self):
+        """Runs before each test."""
+        self.pasta = tempfile.mkdtemp()
+        _psql('-c', 'DROP DATABASE IF EXISTS {};'.format(self.BANCO))
+        self.assertEqual(_psql('-c', 'CREATE DATABASE {};'.format(self.BANCO)).returncode, 0)
+
+    def tearDown(self):
+        """Runs after each test."""
+        _psql('-c', 'DROP DATABASE IF EXISTS {};'.format(self.BANCO))
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def test_diretorio_paralelo(self):
+        """pg_dump -Fd -j followed by pg_restore -C -j restores the data."""
+        for sql in ('CREATE TABLE a AS SELECT generate_series(1, 5000) AS id;',
+                    'CREATE TABLE b AS SELECT generate_series(1, 300) AS id;'):
+            self.assertEqual(_psql('-d', self.BANCO, '-c', sql).returncode, 0)
+
+        destino = os.path.join(self.pasta, 'backup')
+        feedback = Feedback()
+        codigo = ExecutarComando(['pg_dump', '-Fd', '-j', '2', '-Z', '6', '-C', '-v', '-f', destino, self.BANCO],
+                                 feedback, monitorar=destino)
+        self.assertEqual(codigo, 0)
+        self.assertGreater(TamanhoCaminho(destino), 0)
+        self.assertTrue(ItensBackup('pg_restore', destino))
+
+        _psql('-c', 'DROP DATABASE {};'.format(self.BANCO))
+        feedback = Feedback()
+        codigo = ExecutarComando(['pg_restore', '-C', '-d', 'postgres', '-j', '2', '-v', destino],
+                                 feedback, passos=ItensBackup('pg_restore', destino))
+        self.assertEqual(codigo, 0)
+        resultado = _psql('-d', self.BANCO, '-c', 'SELECT (SELECT count(*) FROM a) + (SELECT count(*) FROM b);')
+        self.assertEqual(resultado.stdout.strip(), '5300')
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(ComandosTest))
+    suite.addTests(unittest.makeSuite(BackupRestoreTest))
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
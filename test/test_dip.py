@@ -0,0 +1,64 @@
+# coding=utf-8
+"""Regression tests for the array interpolation of geocapt.dip."""
+
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+import unittest
+import numpy as np
+
+from lftools.geocapt.dip import Interpolar, InterpolarArray
+
+
+class InterpolarArrayTest(unittest.TestCase):
+    """Test that InterpolarArray reproduces Interpolar pixel by pixel."""
+
+    def setUp(self):
+        """Runs before each test."""
+        rng = np.random.RandomState(0)
+        self.origem = (500000.0, 7500000.0)
+        self.resol_X, self.resol_Y = 0.5, 0.4
+        self.nulo = 0
+        self.band = (rng.rand(40, 50)*255).astype('uint8')
+        self.band[rng.rand(40, 50) < 0.02] = self.nulo
+        # pontos sempre com a janela de interpolação dentro do raster
+        self.X = self.origem[0] + rng.uniform(2, 47, 2000)*self.resol_X
+        self.Y = self.origem[1] - rng.uniform(2, 37, 2000)*self.resol_Y
+        # inclui centros de pixel exatos
+        self.X[:45] = self.origem[0] + (np.arange(2, 47) + 0.5)*self.resol_X
+        self.Y[:45] = self.origem[1] - (np.arange(45) % 35 + 2.5)*self.resol_Y
+
+    def compare(self, metodo):
+        vetorizado = InterpolarArray(self.X, self.Y, self.band, self.origem,
+                                     self.resol_X, self.resol_Y, metodo, self.nulo)
+        escalar = [Interpolar(x, y, self.band, self.origem, self.resol_X,
+                              self.resol_Y, metodo, self.nulo) for x, y in zip(self.X, self.Y)]
+        self.assertTrue(np.array_equal(vetorizado, np.array(escalar)))
+
+    def test_nearest(self):
+        """Nearest neighbour matches the scalar path."""
+        self.compare('nearest')
+
+    def test_bilinear(self):
+        """Bilinear matches the scalar path, including nodata masking."""
+        self.compare('bilinear')
+
+    def test_bicubic(self):
+        """Bicubic matches the scalar path, including nodata masking."""
+        self.compare('bicubic')
+
+    def test_outside(self):
+        """Coordinates outside the raster return the null value."""
+        X = np.array([self.origem[0] - 10, self.origem[0] + 1000])
+        Y = np.array([self.origem[1] + 10, self.origem[1] - 1000])
+        for metodo in ('nearest', 'bilinear', 'bicubic'):
+            valores = InterpolarArray(X, Y, self.band, self.origem,
+                                      self.resol_X, self.resol_Y, metodo, self.nulo)
+            self.assertTrue((valores == self.nulo).all())
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(InterpolarArrayTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
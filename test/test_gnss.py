@@ -0,0 +1,102 @@
+# coding=utf-8
+"""Tests for the NMEA reader of geocapt.gnss."""
+
+__author__ = 'Leandro França'
+__date__ = '2026-10-18'
+__copyright__ = '(C) 2026, Leandro França'
+
+import os
+import shutil
+import tempfile
+import unittest
+from functools import reduce
+from operator import xor
+
+from lftools.geocapt import gnss
+from lftools.geocapt.gnss import LerNMEA, DataHora
+
+
+def sentenca(corpo, checksum=None):
+    if checksum is None:
+        checksum = reduce(xor, corpo.encode('ascii'), 0)
+    return '${}*{:02X}'.format(corpo, checksum)
+
+def gga(hora):
+    return sentenca('GPGGA,{},0830.000,S,03500.000,W,4,12,0.8,10.5,M,-5.2,M,,'.format(hora))
+
+def rmc(hora, data):
+    return sentenca('GPRMC,{},A,0830.000,S,03500.000,W,0.0,0.0,{},,,A'.format(hora, data))
+
+def zda(hora, dia, mes, ano):
+    return sentenca('GPZDA,{},{},{},{},00,00'.format(hora, dia, mes, ano))
+
+
+class LerNMEATest(unittest.TestCase):
+    """Test the batch NMEA reader and the date of each epoch."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.pasta = tempfile.mkdtemp()
+        self.lote = gnss.EPOCAS_POR_LOTE
+
+    def tearDown(self):
+        """Runs after each test."""
+        gnss.EPOCAS_POR_LOTE = self.lote
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def ler(self, linhas):
+        caminho = os.path.join(self.pasta, 'teste.nmea')
+        with open(caminho, 'w') as arq:
+            arq.write('\r\n'.join(linhas) + '\r\n')
+        lotes = [(lote.copy(), rejeitadas) for lote, fracao, rejeitadas in LerNMEA(caminho)]
+        datas = [str(d) for lote, _ in lotes for d in DataHora(lote['data'], lote['sod'])]
+        return lotes, datas
+
+    def test_gga_antes_rmc(self):
+        """Midnight rollover when GGA comes before the date sentence."""
+        lotes, datas = self.ler([gga('235959.00'), rmc('235959.00', '311223'),
+                                 gga('000000.00'), rmc('000000.00', '010124')])
+        self.assertEqual(datas, ['2023-12-31 23:59:59', '2024-01-01 00:00:00'])
+
+    def test_rmc_antes_gga(self):
+        """Midnight rollover is applied once when RMC comes before GGA."""
+        lotes, datas = self.ler([rmc('235959.00', '311223'), gga('235959.00'),
+                                 rmc('000000.00', '010124'), gga('000000.00'),
+                                 rmc('000001.00', '010124'), gga('000001.00')])
+        self.assertEqual(datas, ['2023-12-31 23:59:59', '2024-01-01 00:00:00', '2024-01-01 00:00:01'])
+
+    def test_zda_antes_gga(self):
+        """Midnight rollover is applied once when ZDA comes before GGA."""
+        lotes, datas = self.ler([zda('235959.00', '31', '12', '2023'), gga('235959.00'),
+                                 zda('000000.00', '01', '01', '2024'), gga('000000.00')])
+        self.assertEqual(datas, ['2023-12-31 23:59:59', '2024-01-01 00:00:00'])
+
+    def test_checksum(self):
+        """Sentences with a wrong checksum are rejected and counted."""
+        lotes, datas = self.ler([rmc('120000.00', '150624'), gga('120000.00'),
+                                 sentenca('GPGGA,120001.00,0830.000,S,03500.000,W,4,12,0.8,10.5,M,-5.2,M,,', 0),
+                                 gga('120002.00')])
+        self.assertEqual(datas, ['2024-06-15 12:00:00', '2024-06-15 12:00:02'])
+        self.assertEqual(lotes[-1][1], 1)
+
+    def test_lotes(self):
+        """Epochs are split in batches without losing or repeating any."""
+        gnss.EPOCAS_POR_LOTE = 4
+        linhas = [rmc('235955.00', '311223')]
+        for seg in range(55, 60):
+            linhas += [gga('2359{:02d}.00'.format(seg))]
+        for seg in range(5):
+            linhas += [gga('0000{:02d}.00'.format(seg))]
+        lotes, datas = self.ler(linhas)
+        self.assertEqual([len(lote) for lote, _ in lotes], [4, 4, 2])
+        self.assertEqual(datas[4], '2023-12-31 23:59:59')
+        self.assertEqual(datas[5], '2024-01-01 00:00:00')
+        self.assertEqual(datas[-1], '2024-01-01 00:00:04')
+        self.assertAlmostEqual(lotes[0][0]['lat'][0], -(8 + 30/60.))
+        self.assertAlmostEqual(lotes[0][0]['lon'][0], -35)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(LerNMEATest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)